@@ -0,0 +1,10 @@
+"""
+Benchmarks of the DECIDE program, run from the home directory of the repo, e.g.
+
+    python -m benchmarks.parallel
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
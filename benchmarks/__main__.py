@@ -0,0 +1,3 @@
+from benchmarks.lics import main
+
+main()
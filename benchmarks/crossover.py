@@ -0,0 +1,72 @@
+"""
+Calibrate the number of points from which the vectorized engine is faster than the scalar
+one, for every LIC. The result can be pasted over CROSSOVER in decision_logic.py.
+
+    python -m benchmarks.crossover
+
+The LICs are timed on tracks that meet none of them, so that neither engine can stop early.
+The track is converted to an array beforehand, since calculate_CMV converts it once for all
+vectorized LICs. Since the scalar LICs often stop at the first window on real tracks, the
+vectorized engine is only chosen once it is faster by a margin on these tracks.
+"""
+
+import argparse
+import math
+import random
+
+from decision_logic import LICS, VECTORIZED_LICS, CROSSOVER, lic_arguments
+from lic_vectorized import as_point_array
+from parameters import PARAMETERS_T
+
+from benchmarks.timing import measure, write_results
+
+SIZES = [4, 6, 8, 12, 16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512, 768, 1024, 1536, 2048, 3072, 4096, 8192]
+
+# No window meets its LIC on a track from unmet_track
+PARAMETERS = PARAMETERS_T(length_1=1e9, radius_1=1e9, epsilon=math.pi - 1e-9, area_1=1e18, q_pts=3, quads=3,
+                          dist=1e9, n_pts=3, k_pts=1, a_pts=1, b_pts=1, c_pts=1, d_pts=1, e_pts=1, f_pts=1,
+                          g_pts=1, length_2=0, radius_2=0, area_2=0)
+
+
+def unmet_track(num_points: int, seed: int = 0) -> list[tuple[float, float]]:
+    """Points in quadrant I with increasing x, so that LICs 4, 5 and 11 are not met either."""
+    rng = random.Random(seed)
+    return [(i + rng.uniform(0, 0.5), rng.uniform(0, 1)) for i in range(num_points)]
+
+
+def calibrate(sizes: list[int], repeat: int, margin: float) -> tuple[list[int], list[dict]]:
+    """The crossover of every LIC, and all timings."""
+    results = []
+    crossover = []
+    tracks = {num_points: unmet_track(num_points) for num_points in sizes}
+    for i, (lic, vectorized_lic) in enumerate(zip(LICS, VECTORIZED_LICS)):
+        arguments = lic_arguments(i, PARAMETERS)
+        found = None
+        for num_points in sizes:
+            points, array = tracks[num_points], as_point_array(tracks[num_points])
+            scalar, _ = measure(lambda: lic(points, *arguments), repeat)
+            vectorized, _ = measure(lambda: vectorized_lic(array, *arguments), repeat)
+            results.append({"name": lic.__name__, "num_points": num_points, "scalar": scalar, "vectorized": vectorized})
+            if vectorized * margin <= scalar:
+                found = num_points
+                break
+        crossover.append(found or sizes[-1] * 2)
+        print(f"{lic.__name__:>7}: {crossover[-1]:>6} points (current {CROSSOVER[i]})")
+    return crossover, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per result, the best is kept")
+    parser.add_argument("--margin", type=float, default=2.0,
+                        help="how many times faster the vectorized LIC must be on tracks that meet no LIC")
+    parser.add_argument("--output", default="benchmark-crossover.json", help="path of the JSON results")
+    args = parser.parse_args()
+
+    crossover, results = calibrate(SIZES, args.repeat, args.margin)
+    print(f"CROSSOVER = {crossover}")
+    write_results(args.output, results, benchmark="crossover", crossover=crossover)
+
+
+if __name__ == "__main__":
+    main()
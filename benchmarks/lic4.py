@@ -0,0 +1,60 @@
+"""
+Scaling of LIC 4 with the number of points, for windows of half the track that are never met, so
+that every window is evaluated. The sliding-window LIC 4 takes constant time per point; the
+former implementation, which classified all Q_PTS points of every window again, is timed for
+comparison on the smaller tracks.
+
+    python -m benchmarks.lic4 --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import random
+
+from lic import get_quadrant, lic_4
+from lic_vectorized import as_point_array, lic_4 as lic_4_vectorized
+
+from benchmarks.timing import measure
+
+
+def lic_4_per_window(points: list[tuple[float, float]], q_pts: int, quads: int) -> bool:
+    """LIC 4 as it was before the sliding window, O(N * Q_PTS)."""
+    for i in range(len(points) - q_pts + 1):
+        quadrants = set()
+        for j in range(i, i + q_pts):
+            quadrant = get_quadrant(points[j])
+            if quadrant is not None:
+                quadrants.add(quadrant)
+            if len(quadrants) > quads:
+                return True
+    return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4000, 16000, 64000, 256000],
+                        help="numbers of points")
+    parser.add_argument("--max-per-window", type=int, default=4000,
+                        help="largest track to time the per-window implementation on")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'points':>8}  {'sliding':>12}  {'per point':>10}  {'vectorized':>12}  {'per window':>12}")
+    for size in args.sizes:
+        # Quadrants I and II only, so no window lies in more than QUADS = 2 quadrants
+        points = [(rng.uniform(-1, 1), rng.uniform(0, 1)) for _ in range(size)]
+        q_pts, quads = size // 2, 2
+        array = as_point_array(points)
+        assert not lic_4(points, q_pts, quads)
+
+        sliding, _ = measure(lambda: lic_4(points, q_pts, quads), repeat=3)
+        vectorized, _ = measure(lambda: lic_4_vectorized(array, q_pts, quads), repeat=3)
+        per_window = ""
+        if size <= args.max_per_window:
+            seconds, _ = measure(lambda: lic_4_per_window(points, q_pts, quads), repeat=1, min_time=0)
+            per_window = f"{seconds * 1e3:9.1f} ms"
+        print(f"{size:8d}  {sliding * 1e3:9.2f} ms  {sliding / size * 1e9:7.0f} ns  {vectorized * 1e3:9.2f} ms  "
+              f"{per_window:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Time every LIC, calculate_CMV, calculate_PUM, Calculate_FUV and the end-to-end decide over
+tracks of increasing size and several parameter regimes, and write the results as JSON.
+
+    python -m benchmarks --sizes 5 100 1000 --output results.json
+"""
+
+import argparse
+import contextlib
+import io
+import math
+
+from decider import Decider
+from decide import decide
+from decision_logic import LICS, VECTORIZED_LICS, lic_arguments, calculate_CMV, calculate_CMV_vectorized, \
+    calculate_PUM, Calculate_FUV
+from lic_vectorized import as_point_array
+from parameters import PARAMETERS_T
+
+from benchmarks.timing import measure, random_points, write_results
+
+SIZES = [5, 100, 1000, 10_000, 100_000]
+
+# worst-case: no window meets its LIC, so every window is evaluated.
+# early-exit: the first window meets every LIC.
+# typical: the default parameters.
+REGIMES = {
+    "worst-case": PARAMETERS_T(length_1=1e9, radius_1=1e9, epsilon=math.pi - 1e-9, area_1=1e18, q_pts=5, quads=3,
+                               dist=1e9, n_pts=5, k_pts=3, a_pts=2, b_pts=3, c_pts=2, d_pts=3, e_pts=2, f_pts=3,
+                               g_pts=2, length_2=0, radius_2=0, area_2=0),
+    "early-exit": PARAMETERS_T(length_1=0, radius_1=0, epsilon=0, area_1=0, q_pts=5, quads=1, dist=0, n_pts=5,
+                               k_pts=3, a_pts=2, b_pts=3, c_pts=2, d_pts=3, e_pts=2, f_pts=3, g_pts=2,
+                               length_2=1e9, radius_2=1e9, area_2=1e18),
+    "typical": PARAMETERS_T(),
+}
+
+LCM = [["ANDD"] * 15 for _ in range(15)]
+PUV = [True] * 15
+
+
+def benchmark(sizes: list[int], regimes: list[str], repeat: int) -> list[dict]:
+    """Run the benchmark and print one line per result."""
+    results = []
+
+    def record(name: str, engine: str, regime: str, num_points: int | None, function: object) -> None:
+        # decide prints its result
+        with contextlib.redirect_stdout(io.StringIO()):
+            seconds, loops = measure(function, repeat)
+        results.append({"name": name, "engine": engine, "regime": regime, "num_points": num_points,
+                        "seconds": seconds, "loops": loops})
+        print(f"{name:>24} {engine:>10} {regime:>11} {num_points or '-':>7} {seconds * 1e6:14.2f} us")
+
+    print(f"{'name':>24} {'engine':>10} {'regime':>11} {'N':>7} {'time':>17}")
+    for regime in regimes:
+        parameters = REGIMES[regime]
+        CMV = calculate_CMV(random_points(100), parameters)
+        PUM = calculate_PUM(LCM, CMV)
+        record("calculate_PUM", "scalar", regime, None, lambda: calculate_PUM(LCM, CMV))
+        record("Calculate_FUV", "scalar", regime, None, lambda: Calculate_FUV(PUM, PUV))
+
+        for num_points in sizes:
+            points = random_points(num_points)
+            array = as_point_array(points)
+            for i, (lic, vectorized_lic) in enumerate(zip(LICS, VECTORIZED_LICS)):
+                arguments = lic_arguments(i, parameters)
+                record(lic.__name__, "scalar", regime, num_points, lambda: lic(points, *arguments))
+                record(lic.__name__, "vectorized", regime, num_points, lambda: vectorized_lic(array, *arguments))
+            record("calculate_CMV", "scalar", regime, num_points,
+                   lambda: calculate_CMV(points, parameters, engine="scalar"))
+            record("calculate_CMV", "auto", regime, num_points, lambda: calculate_CMV(points, parameters))
+            record("calculate_CMV", "vectorized", regime, num_points,
+                   lambda: calculate_CMV_vectorized(array, parameters))
+
+            record("decide", "auto", regime, num_points, lambda: decide(points, parameters, LCM, PUV))
+            decider = Decider(parameters, LCM, PUV)
+            record("Decider.decide", "auto", regime, num_points, lambda: decider.decide(points))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="numbers of points per track")
+    parser.add_argument("--regimes", nargs="+", default=list(REGIMES), choices=list(REGIMES),
+                        help="parameter regimes")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per result, the best is kept")
+    parser.add_argument("--output", default="benchmark-lics.json", help="path of the JSON results")
+    args = parser.parse_args()
+
+    results = benchmark(args.sizes, args.regimes, args.repeat)
+    write_results(args.output, results, benchmark="lics", sizes=args.sizes, regimes=args.regimes)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
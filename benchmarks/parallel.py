@@ -0,0 +1,55 @@
+"""
+Throughput of ParallelDecider for an increasing number of worker processes.
+
+    python -m benchmarks.parallel --frames 100000 --workers 1 2 4 8 16 32
+"""
+
+import argparse
+import random
+import time
+
+from decider import Decider
+from parallel import ParallelDecider
+from parameters import PARAMETERS_T
+
+
+def random_frames(count: int, num_points: int, seed: int = 0) -> list[list[tuple[float, float]]]:
+    """Frames of num_points random points."""
+    rng = random.Random(seed)
+    return [[(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(num_points)] for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=20000, help="number of frames")
+    parser.add_argument("--points", type=int, default=100, help="points per frame")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="pool sizes to measure")
+    parser.add_argument("--chunk-size", type=int, default=256, help="frames per task")
+    args = parser.parse_args()
+
+    # Every LIC is required, so this is the most expensive decision
+    parameters = PARAMETERS_T(length_1=25, radius_1=15, area_1=100, dist=15, q_pts=5, quads=3, n_pts=5, length_2=1)
+    LCM = [["ANDD"] * 15 for _ in range(15)]
+    PUV = [True] * 15
+    frames = random_frames(args.frames, args.points)
+
+    start = time.perf_counter()
+    decider = Decider(parameters, LCM, PUV)
+    expected = [decider.decide(points) for points in frames]
+    serial = time.perf_counter() - start
+    print(f"{'workers':>8} {'frames/s':>12} {'speedup':>8}")
+    print(f"{'serial':>8} {args.frames / serial:12.0f} {1:8.2f}")
+
+    for workers in args.workers:
+        with ParallelDecider(parameters, LCM, PUV, workers, args.chunk_size) as pool:
+            # Start the workers before timing
+            pool.decide_all(frames[:workers * args.chunk_size])
+            start = time.perf_counter()
+            launches = pool.decide_all(frames)
+            elapsed = time.perf_counter() - start
+        assert launches == expected
+        print(f"{workers:>8} {args.frames / elapsed:12.0f} {serial / elapsed:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
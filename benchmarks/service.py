@@ -0,0 +1,134 @@
+"""
+Latency of the decide service under load, measured by the client.
+
+    python -m benchmarks.service --requests 5000 --points 100 --workers 0 2 --clients 1 4
+
+For every number of workers a server is started with python src/decide.py serve, on a free
+port of localhost, and every client thread sends requests with one frame over its own kept-alive
+connection, one at a time. The latency of a request is the time from sending it to having read
+the response, and its percentiles are reported with those of the X-Decide-Latency-Us header, the
+time the server spent on the request before writing the response.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import statistics
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+DECIDE = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/decide.py"))
+
+
+def free_port() -> int:
+    """A port of localhost that is not in use."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, workers: int, config: str | None) -> subprocess.Popen:
+    """Start the service and wait until it answers /health."""
+    command = [sys.executable, DECIDE, "serve", "--port", str(port), "--workers", str(workers)]
+    if config:
+        command += ["--config", config]
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/health")
+            if connection.getresponse().status == 200:
+                connection.close()
+                return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError("the service did not start")
+
+
+def client(port: int, bodies: list[bytes], content_type: str, latencies: list[float], server_latencies: list[float]) -> None:
+    """Send every body as a request and append the latencies of the requests."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    headers = {"Content-Type": content_type}
+    for body in bodies:
+        start = time.perf_counter()
+        connection.request("POST", "/decide", body, headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        server_latencies.append(int(response.headers["X-Decide-Latency-Us"]) * 1e-6)
+    connection.close()
+
+
+def percentile(values: list[float], q: float) -> float:
+    """The value below which a fraction q of the sorted values lie."""
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="requests per client")
+    parser.add_argument("--warmup", type=int, default=200, help="requests per client before measuring")
+    parser.add_argument("--points", type=int, default=100, help="points per frame")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2], help="worker processes of the server")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4], help="concurrent clients")
+    parser.add_argument("--binary", action="store_true", help="send the frames as float64 instead of JSON")
+    parser.add_argument("--config", help="JSON file with parameters, LCM and PUV for the server")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    frames = [[(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(args.points)] for _ in range(256)]
+    if args.binary:
+        content_type = "application/octet-stream"
+        bodies = [struct.pack(f"<{2 * len(frame)}d", *[value for point in frame for value in point]) for frame in frames]
+    else:
+        content_type = "application/json"
+        bodies = [json.dumps({"points": frame}).encode() for frame in frames]
+
+    print(f"{args.points} points per frame, {'binary' if args.binary else 'JSON'} bodies")
+    print(f"{'workers':>7} {'clients':>7} {'req/s':>8} {'p50 us':>8} {'p99 us':>8} {'max us':>8} "
+          f"{'server p50':>11} {'server p99':>11}")
+    for workers in args.workers:
+        port = free_port()
+        server = start_server(port, workers, args.config)
+        try:
+            for clients in args.clients:
+                warmup = [bodies[i % len(bodies)] for i in range(args.warmup)]
+                requests = [bodies[i % len(bodies)] for i in range(args.requests)]
+                threads = [threading.Thread(target=client, args=(port, warmup, content_type, [], []))
+                           for _ in range(clients)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                latencies, server_latencies = [], []
+                threads = [threading.Thread(target=client, args=(port, requests, content_type, latencies,
+                                                                 server_latencies)) for _ in range(clients)]
+                start = time.perf_counter()
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                elapsed = time.perf_counter() - start
+
+                latencies.sort()
+                server_latencies.sort()
+                print(f"{workers:>7} {clients:>7} {len(latencies) / elapsed:>8.0f} "
+                      f"{statistics.median(latencies) * 1e6:>8.0f} {percentile(latencies, 0.99) * 1e6:>8.0f} "
+                      f"{latencies[-1] * 1e6:>8.0f} {statistics.median(server_latencies) * 1e6:>11.0f} "
+                      f"{percentile(server_latencies, 0.99) * 1e6:>11.0f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+One track decided for M sites with decide_sites, compared with deciding it once per site.
+
+    python -m benchmarks.sites --points 10000 --sites 1 10 100 1000
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from decide import decide_sites
+from decision_logic import calculate_CMV, calculate_required_LICs
+from parameters import PARAMETERS_T
+from policy import Calculate_Launch_bits, compile_policy, pack_CMV
+
+from benchmarks.timing import random_points
+
+
+def random_sites(count: int, seed: int = 0) -> list[PARAMETERS_T]:
+    """Sites with random thresholds and a few distinct gap configurations."""
+    rng = random.Random(seed)
+    return [PARAMETERS_T(length_1=rng.uniform(0, 300), radius_1=rng.uniform(0, 150), epsilon=rng.uniform(0, 3),
+                         area_1=rng.uniform(0, 10000), q_pts=5, quads=3, n_pts=5, dist=rng.uniform(0, 100),
+                         k_pts=rng.choice([1, 10]), a_pts=rng.choice([1, 5]), b_pts=1, length_2=rng.uniform(0, 20),
+                         radius_2=rng.uniform(0, 20), area_2=rng.uniform(0, 100)) for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=10000, help="points of the track")
+    parser.add_argument("--sites", type=int, nargs="+", default=[1, 10, 100, 1000], help="numbers of sites")
+    parser.add_argument("--check", type=int, default=5, help="sites to time with one decision per site")
+    args = parser.parse_args()
+
+    points = np.array(random_points(args.points))
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    PUV = [True] * 15
+    policy = compile_policy(LCM, PUV)
+    required = calculate_required_LICs(LCM, PUV)
+
+    sites = random_sites(args.check)
+    start = time.perf_counter()
+    for parameters in sites:
+        Calculate_Launch_bits(policy, pack_CMV(calculate_CMV(points, parameters, required)))
+    per_site = (time.perf_counter() - start) / len(sites)
+
+    # The first call pays for importing and initializing parts of NumPy
+    decide_sites(points, random_sites(1), LCM, PUV)
+
+    print(f"{args.points} points")
+    print(f"{'sites':>6}  {'decide_sites':>14}  {'per site':>12}  {'one decision per site':>22}")
+    for count in args.sites:
+        sites = random_sites(count)
+        start = time.perf_counter()
+        decide_sites(points, sites, LCM, PUV)
+        elapsed = time.perf_counter() - start
+        print(f"{count:6d}  {elapsed:12.3f} s  {elapsed / count * 1e3:9.3f} ms  {per_site * count:20.3f} s")
+
+
+if __name__ == "__main__":
+    main()
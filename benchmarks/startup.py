@@ -0,0 +1,81 @@
+"""
+The start-up time of one short-lived decide process on a 100-point frame.
+
+    python -m benchmarks.startup --runs 20
+
+Every run starts a new interpreter that imports decide and decides one frame, as the processes
+a batch scheduler spawns do. The median time above that of an empty interpreter is compared with
+BUDGET_MS, and python -X importtime lists the slowest imports of one run. The benchmark exits
+with status 1 if the budget is exceeded or if the run imported NumPy.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Start-up and decision of decide on a 100-point frame, above the start-up of the interpreter
+BUDGET_MS = 60
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+
+DECIDE_SCRIPT = f"""
+import random, sys
+sys.path.insert(0, {SRC!r})
+from decide import LCM, PUV, decide, parameters
+rng = random.Random(0)
+decide([(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range({{points}})], parameters, LCM, PUV)
+print("numpy" in sys.modules)
+"""
+
+
+def run(arguments: list[str], runs: int) -> tuple[float, str]:
+    """The median wall time in seconds of runs processes of the interpreter, and the output of the last."""
+    # Without PYTHONDONTWRITEBYTECODE the modules are loaded from their cached bytecode
+    environment = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, *arguments], capture_output=True, text=True, env=environment,
+                                check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result.stdout + result.stderr
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="processes to start for every measurement")
+    parser.add_argument("--points", type=int, default=100, help="points of the frame")
+    parser.add_argument("--imports", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    script = DECIDE_SCRIPT.format(points=args.points)
+    run(["-c", script], 1)
+    empty, _ = run(["-c", "pass"], args.runs)
+    decide, output = run(["-c", script], args.runs)
+    numpy_imported = output.split()[-1] == "True"
+
+    _, importtime = run(["-X", "importtime", "-c", script], 1)
+    imports = []
+    for line in importtime.splitlines():
+        if line.startswith("import time:") and "|" in line and not line.endswith("imported package"):
+            own, cumulative, name = line[len("import time:"):].split("|")
+            if own.strip().isdigit():
+                imports.append((int(cumulative), int(own), name.rstrip()))
+
+    print(f"empty interpreter  {empty * 1e3:8.1f} ms")
+    print(f"decide             {decide * 1e3:8.1f} ms  ({(decide - empty) * 1e3:.1f} ms above the interpreter, "
+          f"budget {BUDGET_MS} ms)")
+    print(f"NumPy imported     {numpy_imported}")
+    print(f"\nslowest imports (cumulative and own time in ms)")
+    for cumulative, own, name in sorted(imports, reverse=True)[:args.imports]:
+        print(f"{cumulative / 1e3:8.1f} {own / 1e3:8.1f}  {name}")
+
+    if (decide - empty) * 1e3 > BUDGET_MS or numpy_imported:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+A parameter sweep over one track with sweep_CMV, compared with calculate_CMV for every variant.
+
+    python -m benchmarks.sweep --points 10000 --variants 1000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from decision_logic import calculate_CMV
+from parameters import PARAMETERS_T
+from sweep import parameter_grid, sweep_CMV
+
+from benchmarks.timing import random_points
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=10000, help="points of the track")
+    parser.add_argument("--variants", type=int, default=1000, help="values of length_1, times 3 radii and 2 gaps")
+    parser.add_argument("--check", type=int, default=20, help="variants to time with calculate_CMV")
+    args = parser.parse_args()
+
+    points = np.array(random_points(args.points))
+    base = PARAMETERS_T(q_pts=5, quads=3, n_pts=5, dist=50, length_2=10, radius_2=10, area_2=10)
+    grid = parameter_grid(base, length_1=np.linspace(0, 300, args.variants), radius_1=[10, 50, 140], k_pts=[1, 10])
+
+    start = time.perf_counter()
+    CMV = sweep_CMV(points, grid)
+    swept = time.perf_counter() - start
+
+    step = max(len(grid) // args.check, 1)
+    start = time.perf_counter()
+    for v in range(0, len(grid), step):
+        assert list(CMV[v]) == calculate_CMV(points, grid[v])
+    per_variant = (time.perf_counter() - start) / len(range(0, len(grid), step))
+
+    print(f"{len(grid)} variants of {args.points} points")
+    print(f"sweep_CMV      {swept:10.3f} s  {swept / len(grid) * 1e6:10.1f} us/variant")
+    print(f"calculate_CMV  {per_variant * len(grid):10.3f} s  {per_variant * 1e6:10.1f} us/variant (estimated)")
+
+
+if __name__ == "__main__":
+    main()
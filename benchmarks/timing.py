@@ -0,0 +1,69 @@
+"""
+Helpers shared by the benchmarks.
+"""
+
+import json
+import os
+import platform
+import random
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+
+def random_points(num_points: int, seed: int = 0, scale: float = 100.0) -> list[tuple[float, float]]:
+    """A track of num_points uniformly random points in [-scale, scale]^2."""
+    rng = random.Random(seed)
+    return [(rng.uniform(-scale, scale), rng.uniform(-scale, scale)) for _ in range(num_points)]
+
+
+def measure(function: Callable[[], object], repeat: int = 5, min_time: float = 0.02) -> tuple[float, int]:
+    """
+    The best time of one call of function, like timeit. Every measurement calls function as many
+    times as needed to take at least min_time, and the best of repeat measurements is used.
+
+    Parameters:
+        function (Callable[[], object]): The function to time.
+        repeat (int): Number of measurements.
+        min_time (float): Minimum duration of one measurement in seconds.
+
+    Returns:
+        tuple[float, int]: The seconds per call and the number of calls per measurement.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / loops, loops
+
+
+def environment() -> dict:
+    """The machine and software the benchmark ran on."""
+    return {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def write_results(path: str, results: list[dict], **metadata: object) -> None:
+    """Write the results and the environment as JSON."""
+    with open(path, "w") as file:
+        json.dump({"environment": environment(), **metadata, "results": results}, file, indent=2)
+        file.write("\n")
@@ -0,0 +1,122 @@
+"""
+A bounded LRU cache of CMVs and launch decisions, for frames that are decided more than once.
+
+Frames are keyed by a BLAKE2b hash of their coordinates as float64 values, so a frame that is
+sent again, as a list or as an array, finds the result of the first time. The cache is shared
+safely between threads; the decision itself is made outside the lock.
+
+    cache = DecisionCache(max_entries=10_000, max_bytes=8 * 2**20)
+    decider = Decider(parameters, LCM, PUV, cache=cache)
+"""
+
+import array
+import hashlib
+import itertools
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+
+
+def frame_key(points: list[tuple[float, float]] | np.ndarray) -> bytes:
+    """
+    A 128-bit hash of the coordinates of the points.
+
+    Parameters:
+        points (list[tuple[float, float]] | np.ndarray): The points (x, y), or an (N, 2) array.
+
+    Returns:
+        bytes: The digest of the float64 coordinates x0, y0, x1, y1, ...
+    """
+    if isinstance(points, np.ndarray):
+        buffer = np.ascontiguousarray(points, dtype=np.float64)
+    else:
+        buffer = array.array("d", itertools.chain.from_iterable(points))
+    return hashlib.blake2b(buffer, digest_size=16).digest()
+
+
+class DecisionCache:
+    """
+    An LRU cache limited both in entries and in bytes, with hit, miss and eviction counters.
+
+    Keys are (frame_key, configuration) pairs where the configuration is any hashable identity of
+    the parameters, LCM and PUV. Values are (CMV, launch) pairs.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 4 * 2**20) -> None:
+        """
+        Parameters:
+            max_entries (int): The maximum number of entries.
+            max_bytes (int): The maximum estimated memory of the entries.
+
+        Raises:
+            ValueError: If a limit is less than 1.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.evictions = 0
+        self.bytes = 0
+        self._entries: OrderedDict[Hashable, tuple[tuple, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> tuple[tuple[bool | None, ...], bool] | None:
+        """
+        The cached (CMV, launch) of key, which becomes the most recently used entry.
+
+        Parameters:
+            key (Hashable): The (frame_key, configuration) pair.
+
+        Returns:
+            tuple[tuple[bool | None, ...], bool] | None: The cached value, None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, CMV: tuple[bool | None, ...], launch: bool) -> None:
+        """
+        Store the CMV and launch decision of key, evicting the least recently used entries
+        until both limits hold.
+
+        Parameters:
+            key (Hashable): The (frame_key, configuration) pair.
+            CMV (tuple[bool | None, ...]): The Conditions Met Vector.
+            launch (bool): The launch decision.
+        """
+        value = (CMV, launch)
+        # The configuration is shared between entries and not counted
+        size = sys.getsizeof(key) + sys.getsizeof(key[0]) + sys.getsizeof(value) + sys.getsizeof(CMV)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        """The counters and the current size."""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions}
@@ -0,0 +1,102 @@
+"""
+The CMV of tracks far longer than fit in memory as Python objects, in blocks of bounded size.
+
+The track is read as an (N, 2) array, typically an np.memmap of a binary file, in blocks of
+chunk_size points. Consecutive blocks overlap by the largest span of any required LIC minus one,
+so every window (pair, triple or run of points) lies completely inside at least one block. Every
+block is evaluated with the vectorized LICs and only flags are carried from block to block: one
+per LIC, and one per side of the two-sided LICs 12, 13 and 14, which can be met by windows in
+different blocks. The conditions on the number of points use the length of the whole track.
+At most one block is converted to float64 at a time, so the memory does not grow with the track.
+
+    track = np.load("track.npy", mmap_mode="r")
+    CMV = calculate_CMV_chunked(track, parameters)
+"""
+
+import numpy as np
+
+from decision_logic import CHUNK_SIZE, THRESHOLD_LICS, VECTORIZED_LICS, lic_arguments, lic_span, threshold_tests
+from lic_vectorized import GeometryContext, metric_passes
+from parameters import PARAMETERS_T
+
+def chunk_overlap(parameters: PARAMETERS_T, required: list[bool] | None = None) -> int:
+    """
+    The number of points that consecutive blocks share: the largest span of any required LIC
+    minus one, and at least 2 so that every block has at least three points.
+
+    Parameters:
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        required (list[bool] | None): The LICs to calculate, all of them if None.
+
+    Returns:
+        int: The overlap in points.
+    """
+    spans = [lic_span(i, parameters) for i in range(15) if required is None or required[i]]
+    return max(spans + [3]) - 1
+
+
+def _lic_11_wrapped(points: np.ndarray, g_pts: int) -> bool:
+    """LIC 11 for a negative G_PTS, whose pairs join the first and the last points of the track."""
+    num_points = len(points)
+    first = max(num_points + 1 + g_pts, 0)
+    count = num_points - first
+    return num_points >= 3 and bool(np.any(points[first:, 0] - points[:count, 0] < 0))
+
+
+def calculate_CMV_chunked(points: np.ndarray, parameters: PARAMETERS_T, required: list[bool] | None = None,
+                          chunk_size: int = CHUNK_SIZE) -> list[bool | None]:
+    """
+    Calculate the Conditions Met Vector (CMV) of a long track block by block. The result is
+    identical to the one of calculate_CMV on the whole track.
+
+    Parameters:
+        points (np.ndarray): The points as an (N, 2) array, e.g. an np.memmap. Only one block at a
+            time is read into memory. Other sequences of points are converted to an array first.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        required (list[bool] | None): The LICs to calculate, see calculate_required_LICs. All if None.
+        chunk_size (int): Number of points per block, not counting the overlap.
+
+    Returns:
+        list of bool: The Conditions Met Vector (CMV), None for the LICs that are not required.
+
+    Raises:
+        ValueError: If chunk_size is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+    if not isinstance(points, np.ndarray):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    num_points = len(points)
+    indices = [i for i in range(15) if required is None or required[i]]
+    CMV = [False if i in indices else None for i in range(15)]
+
+    # The tests of every threshold LIC, each with a flag that is set once a window passes it
+    tests = {}
+    for i in THRESHOLD_LICS.intersection(indices):
+        if i == 11 and parameters.g_pts < -1:
+            CMV[11] = _lic_11_wrapped(points, parameters.g_pts)
+            continue
+        form = threshold_tests(i, parameters, num_points)
+        if form is not None:
+            name, gaps, lic_tests, either = form
+            tests[i] = (name, gaps, lic_tests, either, [False] * len(lic_tests))
+    others = [i for i in indices if i not in THRESHOLD_LICS]
+
+    overlap = chunk_overlap(parameters, required)
+    start = 0
+    while True:
+        block = np.ascontiguousarray(points[start:start + chunk_size + overlap], dtype=np.float64).reshape(-1, 2)
+        geometry = GeometryContext(block)
+        for i, (name, gaps, lic_tests, either, passed) in tests.items():
+            if CMV[i]:
+                continue
+            for t, (test, threshold) in enumerate(lic_tests):
+                passed[t] = passed[t] or metric_passes(geometry, name, gaps, test, threshold)
+            CMV[i] = any(passed) if either else all(passed)
+        for i in others:
+            if not CMV[i]:
+                CMV[i] = VECTORIZED_LICS[i](block, *lic_arguments(i, parameters), geometry=geometry)
+
+        if start + chunk_size + overlap >= num_points or all(CMV[i] for i in indices):
+            return CMV
+        start += chunk_size
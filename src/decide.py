@@ -1,10 +1,24 @@
+from __future__ import annotations
+
 import sys
 import os
+import time
+from collections.abc import Iterable, Sequence
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-from decision_logic import calculate_CMV, calculate_PUM, Calculate_FUV, Calculate_Launch
+from decision_logic import calculate_CMV, calculate_PUM, Calculate_FUV, Calculate_Launch, calculate_required_LICs
+from decision_logic import calculate_CMV_batch
+from instrumentation import Instrumentation
+from policy import compile_policy, pack_CMV, pack_CMV_batch, Calculate_Launch_bits, launch_table
+from policy import CompiledPolicies, Calculate_Launch_policies, compile_policies
 from parameters import PARAMETERS_T
 
+# NumPy is only imported for the batch functions and large frames, which keeps a single decision
+# of a small frame fast to start, see lazy.py and python -m benchmarks.startup
+TYPE_CHECKING = False  # as in decision_logic, without importing typing
+if TYPE_CHECKING:
+    import numpy as np
+
 points: list[tuple[float, float]] = [(0, 1), (2, 3), (4, 5), (6, 7), (8, 9), (10, 11)]
 num_points: int = len(points)
 LCM: list[list[str]] = [
@@ -32,25 +46,171 @@ launch: bool
 parameters:PARAMETERS_T = PARAMETERS_T()
 
 
-def decide(points: list[tuple[float, float]], parameters, LCM: list[list[str]], PUV: list[bool]) -> None:
+def decide(points: list[tuple[float, float]] | np.ndarray, parameters, LCM: list[list[str]], PUV: list[bool],
+           instrumentation: Instrumentation | None = None) -> None:
     """
     The main DECIDE function that determine whether to launch an interceptor.
+    Only the LICs that can affect the decision for the given LCM and PUV are calculated, and the
+    LCM and PUV are compiled to bitmasks so that no PUM is built. Use calculate_PUM and
+    Calculate_FUV on the CMV to inspect the full matrices.
 
     Parameters:
-        points (list[tuple[float, float]]): List of planar points (x, y).
+        points (list[tuple[float, float]] | np.ndarray): List of planar points (x, y), a track.Track,
+            or an (N, 2) array such as a memory-mapped track from track_io.load_track.
         parameters (object): Contains parameters for the LICs.
         LCM (list[list[str]]): Logical Connector Matrix.
         PUV (list[bool]): Preliminary Unlocking Vector.
+        instrumentation (Instrumentation | None): Records the time of every LIC and of the CMV,
+            policy and launch stages if given.
        
     """
-    CMV = calculate_CMV(points, parameters)
-    PUM = calculate_PUM(LCM, CMV)
-    FUV = Calculate_FUV(PUM, PUV)
-    is_launch = Calculate_Launch(FUV)
+    if instrumentation is not None:
+        is_launch = _decide_instrumented(points, parameters, LCM, PUV, instrumentation)
+    else:
+        CMV = calculate_CMV(points, parameters, calculate_required_LICs(LCM, PUV))
+        is_launch = Calculate_Launch_bits(compile_policy(LCM, PUV, validate=False), pack_CMV(CMV))
 
     # Print the result
     print("YES") if is_launch else print("NO")
-    
+
+
+def _decide_instrumented(points: list[tuple[float, float]] | np.ndarray, parameters, LCM: list[list[str]], PUV: list[bool],
+                         instrumentation: Instrumentation) -> bool:
+    """The launch decision of decide, recording every stage in instrumentation."""
+    start = time.perf_counter()
+    required = calculate_required_LICs(LCM, PUV)
+    policy = compile_policy(LCM, PUV, validate=False)
+    instrumentation.record_stage("policy", time.perf_counter() - start)
+
+    CMV = calculate_CMV(points, parameters, required, instrumentation)
+
+    start = time.perf_counter()
+    is_launch = Calculate_Launch_bits(policy, pack_CMV(CMV))
+    instrumentation.record_stage("launch", time.perf_counter() - start)
+    return is_launch
+
+
+def decide_batch(points: np.ndarray | list[list[tuple[float, float]]], parameters: PARAMETERS_T,
+                 LCM: list[list[str]], PUV: list[bool], lengths: np.ndarray | None = None,
+                 mask: np.ndarray | None = None) -> np.ndarray:
+    """
+    The DECIDE function for a batch of radar frames that share the same parameters, LCM and PUV.
+    All frames are evaluated together with the vectorized LICs, without a loop over the frames,
+    and the launch decisions are looked up in the launch table of the LCM and PUV.
+
+    Parameters:
+        points (np.ndarray | list[list[tuple[float, float]]]): A (B, N, 2) array of frames, or a list
+            of frames that may have different lengths.
+        parameters (PARAMETERS_T): Contains parameters for the LICs.
+        LCM (list[list[str]]): Logical Connector Matrix.
+        PUV (list[bool]): Preliminary Unlocking Vector.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded array.
+        mask (np.ndarray | None): A (B, N) mask of the valid points of a padded array, instead of lengths.
+
+    Returns:
+        np.ndarray: A (B,) boolean array, True for the frames that launch.
+    """
+    from lic_vectorized import as_frame_batch
+
+    points, lengths = as_frame_batch(points, lengths, mask)
+    CMV = calculate_CMV_batch(points, parameters, lengths, calculate_required_LICs(LCM, PUV))
+    return launch_table(compile_policy(LCM, PUV, validate=False))[pack_CMV_batch(CMV)]
+
+
+def decide_sites(points: list[tuple[float, float]] | np.ndarray, sites: Sequence[PARAMETERS_T],
+                 LCM: list[list[str]], PUV: list[bool]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The DECIDE function for one track seen by several sites, each with its own parameters. The
+    geometry of the track is calculated once per distinct gap configuration (K_PTS, A_PTS/B_PTS,
+    ...) and the thresholds of all sites are compared with it together, see sweep.Sweep, so
+    the cost barely grows with the number of sites.
+
+    Parameters:
+        points (list[tuple[float, float]] | np.ndarray): List of planar points (x, y), or an (N, 2) array.
+        sites (Sequence[PARAMETERS_T]): The parameters of every site.
+        LCM (list[list[str]]): Logical Connector Matrix.
+        PUV (list[bool]): Preliminary Unlocking Vector.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (M, 15) CMV of every site, False for the LICs that cannot
+            affect the decision, and the (M,) launch decisions.
+    """
+    from sweep import Sweep
+
+    # As decide and decide_batch, the LCM and PUV are not validated, see policy.validate_policy
+    policy = compile_policy(LCM, PUV, validate=False)
+    CMV = Sweep(points).calculate_CMV(sites, calculate_required_LICs(LCM, PUV))
+    return CMV, launch_table(policy)[pack_CMV_batch(CMV)]
+
+
+def decide_policies(points: list[tuple[float, float]] | np.ndarray, parameters: PARAMETERS_T,
+                    policies: CompiledPolicies | Iterable[tuple[list[list[str]], list[bool]]]) -> np.ndarray:
+    """
+    The DECIDE function for several candidate policies, e.g. for shadow rollouts. The CMV is
+    calculated once, for the LICs any of the policies needs, and all policies are applied to it
+    together with policy.Calculate_Launch_policies.
+
+    Parameters:
+        points (list[tuple[float, float]] | np.ndarray): List of planar points (x, y), or an (N, 2) array.
+        parameters (PARAMETERS_T): Contains parameters for the LICs.
+        policies (CompiledPolicies | Iterable[tuple[list[list[str]], list[bool]]]): The policies from
+            policy.compile_policies, or the (LCM, PUV) of every policy.
+
+    Returns:
+        np.ndarray: A (P,) boolean array, True for the policies that launch.
+    """
+    if not isinstance(policies, CompiledPolicies):
+        policies = compile_policies(policies, validate=False)
+    CMV = calculate_CMV(points, parameters, list(policies.required))
+    return Calculate_Launch_policies(policies, pack_CMV(CMV))
+
+
 if __name__ == "__main__":
-    decide(points, parameters, LCM, PUV)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Decide whether to launch an interceptor.")
+    parser.add_argument("--track", help="binary track file (.npy or raw float64) to decide instead of the points above, "
+                                        "see track_io.py")
+    commands = parser.add_subparsers(dest="command")
+    serve_parser = commands.add_parser("serve", help="run the local HTTP decide service")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    serve_parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    serve_parser.add_argument("--workers", type=int, default=0,
+                              help="number of worker processes, 0 to decide in the server process")
+    serve_parser.add_argument("--config", help="JSON file with parameters, LCM and PUV, the globals above if left out")
+    serve_parser.add_argument("--verbose", action="store_true", help="log every request")
+    batch_parser = commands.add_parser("batch", help="decide every scenario of a JSONL, CSV or binary file, "
+                                                     "see scenarios.py")
+    batch_parser.add_argument("input", nargs="?", default="-", help="scenario file, - for the standard input")
+    batch_parser.add_argument("--format", choices=["jsonl", "csv", "binary"],
+                              help="format of the input, from its extension if left out (jsonl for the standard input)")
+    batch_parser.add_argument("--output", default="-", help="file for the decisions, - for the standard output")
+    batch_parser.add_argument("--batch-size", type=int, default=1024, help="number of scenarios decided together")
+    batch_parser.add_argument("--details", action="store_true", help="write the CMV and FUV with every decision as JSON")
+    batch_parser.add_argument("--config", help="JSON file with parameters, LCM and PUV, the globals above if left out")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        from service import load_config, serve
+
+        config = load_config(args.config) if args.config else (parameters, LCM, PUV)
+        serve(*config, host=args.host, port=args.port, workers=args.workers, verbose=args.verbose)
+    elif args.command == "batch":
+        from contextlib import nullcontext
+        from decider import Decider
+        from scenarios import decide_file
+        from service import load_config
+
+        config = load_config(args.config) if args.config else (parameters, LCM, PUV)
+        output = nullcontext(sys.stdout) if args.output == "-" else open(args.output, "w")
+        with output as file:
+            count, elapsed = decide_file(args.input, Decider(*config), file, args.format, args.batch_size, args.details)
+        print(f"Decided {count} scenarios in {elapsed:.3f} s ({count / max(elapsed, 1e-9):.0f} scenarios/s)",
+              file=sys.stderr)
+    elif args.track:
+        from track_io import load_track
+
+        decide(load_track(args.track), parameters, LCM, PUV)
+    else:
+        decide(points, parameters, LCM, PUV)
 
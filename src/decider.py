@@ -0,0 +1,176 @@
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from cache import DecisionCache, frame_key
+from decision_logic import (CROSSOVER, ENGINES, LICS, lic_progress, progress_points, select_kernels,
+                            calculate_required_LICs, calculate_CMV_batch)
+from instrumentation import Instrumentation
+from lic_vectorized import as_frame_batch
+from parameters import PARAMETERS_T, compile_parameters
+from policy import compile_policy, launch_table, pack_CMV, pack_CMV_batch
+
+
+class Decider:
+    """
+    The DECIDE function for one configuration of parameters, LCM and PUV.
+
+    The configuration is validated and compiled when the Decider is created: the LICs that can
+    affect the decision are selected together with their arguments, and the LCM and PUV become
+    a launch table indexed by the packed CMV. A decision then only runs the selected LICs and
+    one table lookup, without validation or global state. A Decider is meant to be created
+    once, e.g. per worker process, and used for every radar frame.
+    """
+
+    def __init__(self, parameters: PARAMETERS_T, LCM: list[list[str]], PUV: list[bool], engine: str = "auto",
+                 cache: DecisionCache | None = None) -> None:
+        """
+        Parameters:
+            parameters (PARAMETERS_T): The parameters for the LICs.
+            LCM (list[list[str]]): Logical Connector Matrix.
+            PUV (list[bool]): Preliminary Unlocking Vector.
+            engine (str): "auto" to choose the scalar or vectorized LICs by the number of points,
+                see decision_logic.select_kernels, or "scalar" or "vectorized" for all frames.
+            cache (DecisionCache | None): Reuse the CMV and decision of frames seen before. The
+                cache can be shared with Deciders of other configurations.
+
+        Raises:
+            ValueError: If the parameters, LCM, PUV or engine are invalid.
+        """
+        compiled = compile_parameters(parameters)
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, not {engine!r}")
+        self.engine = engine
+        self.parameters = parameters
+        self.policy = compile_policy(LCM, PUV)
+        self.required = calculate_required_LICs(LCM, PUV)
+        self._table = launch_table(self.policy)
+        # bytes indexing gives a plain int, cheaper than indexing the array for one frame
+        self._table_bytes = self._table.tobytes()
+        self._lics = tuple((i, LICS[i], compiled.arguments[i]) for i in range(15) if self.required[i])
+        # Frames with fewer points only use the scalar LICs
+        if engine == "auto":
+            self._scalar_below = min((CROSSOVER[i] for i, _, _ in self._lics), default=0)
+        else:
+            self._scalar_below = float("inf") if engine == "scalar" else 0
+        self.cache = cache
+        self._configuration = (parameters, self.policy)
+
+    def _kernels(self, points: list[tuple[float, float]] | np.ndarray) -> list[tuple[int, Callable, object, tuple]]:
+        """The number, function, points and arguments of every required LIC for these points."""
+        if len(points) < self._scalar_below:
+            if isinstance(points, np.ndarray):
+                points = points.tolist()
+            return [(i, lic, points, arguments) for i, lic, arguments in self._lics]
+        kernels = select_kernels(points, self.engine)
+        return [(i, *kernels[i], arguments) for i, _, arguments in self._lics]
+
+    def calculate_CMV(self, points: list[tuple[float, float]] | np.ndarray) -> list[bool | None]:
+        """
+        The CMV of the points, None for the LICs that cannot affect the decision.
+
+        Parameters:
+            points (list[tuple[float, float]] | np.ndarray): List of planar points (x, y), or an (N, 2) array.
+
+        Returns:
+            list[bool | None]: The Conditions Met Vector.
+        """
+        if self.cache is not None:
+            return list(self._cached(points)[0])
+        CMV = [None] * 15
+        for i, lic, lic_points, arguments in self._kernels(points):
+            CMV[i] = lic(lic_points, *arguments)
+        return CMV
+
+    def _cached(self, points: list[tuple[float, float]] | np.ndarray) -> tuple[tuple[bool | None, ...], bool]:
+        """The CMV and launch decision from the cache, calculated and stored on a miss."""
+        key = (frame_key(points), self._configuration)
+        value = self.cache.get(key)
+        if value is None:
+            CMV = [None] * 15
+            for i, lic, lic_points, arguments in self._kernels(points):
+                CMV[i] = lic(lic_points, *arguments)
+            value = (tuple(CMV), self._table_bytes[pack_CMV(CMV)] == 1)
+            self.cache.put(key, *value)
+        return value
+
+    def decide(self, points: list[tuple[float, float]] | np.ndarray,
+               instrumentation: Instrumentation | None = None) -> bool:
+        """
+        Decide whether to launch an interceptor.
+
+        Parameters:
+            points (list[tuple[float, float]] | np.ndarray): List of planar points (x, y), or an (N, 2) array.
+            instrumentation (Instrumentation | None): Records the time of every LIC and of the CMV
+                and launch stages if given. With a cache only the time of the cache stage is recorded.
+
+        Returns:
+            bool: A decision for or against launch
+        """
+        if self.cache is not None:
+            if instrumentation is None:
+                return self._cached(points)[1]
+            start = time.perf_counter()
+            launch = self._cached(points)[1]
+            instrumentation.record_stage("cache", time.perf_counter() - start)
+            return launch
+        if instrumentation is not None:
+            return self._decide_instrumented(points, instrumentation)
+        bits = 0
+        for i, lic, lic_points, arguments in self._kernels(points):
+            if lic(lic_points, *arguments):
+                bits |= 1 << i
+        return self._table_bytes[bits] == 1
+
+    def _decide_instrumented(self, points: list[tuple[float, float]] | np.ndarray,
+                             instrumentation: Instrumentation) -> bool:
+        """decide, recording every LIC and stage in instrumentation."""
+        stage_start = time.perf_counter()
+        bits = 0
+        for i, lic, lic_points, arguments in self._kernels(points):
+            lic_points = progress_points(i, lic, lic_points)
+            start = time.perf_counter()
+            met = lic(lic_points, *arguments)
+            seconds = time.perf_counter() - start
+            instrumentation.record_lic(i, seconds, *lic_progress(i, lic_points, self.parameters))
+            if met:
+                bits |= 1 << i
+        start = time.perf_counter()
+        instrumentation.record_stage("CMV", start - stage_start)
+        launch = self._table_bytes[bits] == 1
+        instrumentation.record_stage("launch", time.perf_counter() - start)
+        return launch
+
+    def decide_batch(self, points: np.ndarray | list[list[tuple[float, float]]], lengths: np.ndarray | None = None,
+                     mask: np.ndarray | None = None) -> np.ndarray:
+        """
+        Decide for every frame of a batch with the vectorized LICs, see decide.decide_batch.
+
+        Parameters:
+            points (np.ndarray | list[list[tuple[float, float]]]): A (B, N, 2) array of frames, or a list
+                of frames that may have different lengths.
+            lengths (np.ndarray | None): Number of valid points of every frame of a padded array.
+            mask (np.ndarray | None): A (B, N) mask of the valid points of a padded array, instead of lengths.
+
+        Returns:
+            np.ndarray: A (B,) boolean array, True for the frames that launch.
+        """
+        return self._table[pack_CMV_batch(self.calculate_CMV_batch(points, lengths, mask))]
+
+    def calculate_CMV_batch(self, points: np.ndarray | list[list[tuple[float, float]]], lengths: np.ndarray | None = None,
+                            mask: np.ndarray | None = None) -> np.ndarray:
+        """
+        The CMV of every frame of a batch with the vectorized LICs, see decide_batch.
+
+        Parameters:
+            points (np.ndarray | list[list[tuple[float, float]]]): A (B, N, 2) array of frames, or a list
+                of frames that may have different lengths.
+            lengths (np.ndarray | None): Number of valid points of every frame of a padded array.
+            mask (np.ndarray | None): A (B, N) mask of the valid points of a padded array, instead of lengths.
+
+        Returns:
+            np.ndarray: A (B, 15) boolean array, False for the LICs that cannot affect the decision.
+        """
+        points, lengths = as_frame_batch(points, lengths, mask)
+        return calculate_CMV_batch(points, self.parameters, lengths, self.required)
@@ -1,42 +1,538 @@
+from __future__ import annotations
+
+import functools
+import itertools
+import math
+import operator
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
 from lic import *
-from parameters import PARAMETERS_T
+from parameters import LIC_PARAMETERS, PARAMETERS_T, compile_parameters
+from instrumentation import Instrumentation
+from lazy import is_numpy_instance, numpy_loaded
+
+# NumPy and lic_vectorized are imported by the functions that use them, see lazy.py
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, importing typing alone takes about 10 ms
+if TYPE_CHECKING:
+    import numpy as np
+    import lic_vectorized
+
+def _argument_getter(names: tuple[str, ...]) -> Callable[[PARAMETERS_T], tuple]:
+    """A function that returns the values of the fields names of PARAMETERS_T as a tuple."""
+    if len(names) > 1:
+        return operator.attrgetter(*names)
+    return lambda parameters: tuple(getattr(parameters, name) for name in names)
+
+
+# lic_arguments is called for every variant of a sweep, attrgetter avoids a generator per call
+_ARGUMENT_GETTERS = [_argument_getter(names) for names in LIC_PARAMETERS]
+
+LICS = [lic_0, lic_1, lic_2, lic_3, lic_4, lic_5, lic_6, lic_7, lic_8, lic_9, lic_10, lic_11, lic_12, lic_13, lic_14]
+
+
+
+@functools.cache
+def vectorized_lics() -> list[Callable]:
+    """The vectorized LICs from lic_vectorized in the order of LICS, imported on the first call."""
+    import lic_vectorized
+    return [getattr(lic_vectorized, lic.__name__) for lic in LICS]
+
+
+def __getattr__(name: str) -> object:
+    # VECTORIZED_LICS is created when it is first imported, not when this module is
+    if name == "VECTORIZED_LICS":
+        return vectorized_lics()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+ENGINES = ("auto", "scalar", "vectorized")
+
+# Memory-mapped tracks with more points are evaluated in blocks of this many points, see chunked.py
+CHUNK_SIZE = 1 << 16
+
+# The number of points from which the vectorized version of every LIC is faster than the scalar
+# one when neither can stop early, calibrated with python -m benchmarks.crossover
+CROSSOVER = [256, 96, 96, 128, 192, 256, 64, 192, 128, 128, 192, 512, 192, 128, 192]
+
+# The number of points below which the "auto" engine uses only the scalar LICs as long as NumPy has
+# not been imported: importing it takes about 100 ms, far more than the vectorized LICs save there
+COLD_START_POINTS = 1000
+
+
+def select_kernels(points: list[tuple[float, float]] | np.ndarray,
+                   engine: str = "auto") -> list[tuple[Callable, list | np.ndarray]]:
+    """
+    Choose between the scalar LICs from lic.py and the vectorized LICs from lic_vectorized for
+    every LIC. With engine "auto" a LIC is vectorized when the track has at least CROSSOVER
+    points for it. The points are converted once to the form each engine works on, and the
+    vectorized LICs share one GeometryContext.
+
+    Parameters:
+        points (list of tuples | np.ndarray): Points (X, Y), either as tuples or as an (N, 2) array.
+        engine (str): "auto", "scalar" or "vectorized".
+
+    Returns:
+        list[tuple[Callable, list | np.ndarray]]: For every LIC the function to call and the points
+            to call it with, followed by the arguments from lic_arguments.
+
+    Raises:
+        ValueError: If engine is unknown.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, not {engine!r}")
+    num_points = len(points)
+    if engine == "auto":
+        # Below COLD_START_POINTS importing NumPy takes longer than the vectorized LICs save
+        cold = num_points < COLD_START_POINTS and not numpy_loaded()
+        vectorized = [num_points >= crossover and not cold for crossover in CROSSOVER]
+    else:
+        vectorized = [engine == "vectorized"] * 15
+
+    kernels = []
+    if not all(vectorized):
+        scalar_points = points.tolist() if is_numpy_instance(points) else points
+        kernels = [(lic, scalar_points) for lic in LICS]
+    if any(vectorized):
+        import lic_vectorized
+        array = lic_vectorized.as_point_array(points)
+        geometry = lic_vectorized.GeometryContext(array)
+        kernels = [(functools.partial(vectorized_lics()[i], geometry=geometry), array) if vectorized[i] else kernels[i]
+                   for i in range(15)]
+    return kernels
+
+
+def lic_arguments(index: int, parameters: PARAMETERS_T) -> tuple:
+    """
+    The arguments after the points of LIC number index.
+
+    Parameters:
+        index (int): The number of the LIC.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+
+    Returns:
+        tuple: The values of the fields in LIC_PARAMETERS[index].
+    """
+    return _ARGUMENT_GETTERS[index](parameters)
+
+
+def lic_span(index: int, parameters: PARAMETERS_T) -> int:
+    """
+    The number of consecutive points that one window (pair or triple with its intervening
+    points) of LIC number index covers. For LIC 11 with a negative G_PTS the pairs are not
+    consecutive and the span is taken as 2.
+
+    Parameters:
+        index (int): The number of the LIC.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+
+    Returns:
+        int: The number of points in one window, see CompiledParameters.spans.
+    """
+    return compile_parameters(parameters, validate=False).spans[index]
+
 
-def calculate_CMV(points: list[tuple[float, float]], parameters: PARAMETERS_T) -> list[bool]:
+def lic_windows(index: int, parameters: PARAMETERS_T, num_points: int) -> int:
+    """
+    The number of windows LIC number index examines in a track of num_points points when it
+    does not stop early.
+
+    Parameters:
+        index (int): The number of the LIC.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        num_points (int): The number of points.
+
+    Returns:
+        int: The number of pairs, triples or (for LIC 4 and 6) runs of consecutive points.
+    """
+    if index == 11:
+        # lic_11 pairs every point with the one 1 + G_PTS later, counted from the end if negative
+        offset = 1 + parameters.g_pts
+        return min(num_points, -offset) if offset < 0 else max(num_points - offset, 0)
+    return max(num_points - lic_span(index, parameters) + 1, 0)
+
+
+class _CountingPoints:
+    """
+    The points of a scalar LIC, counting how far the LIC got: the number of points yielded by
+    every iterator over them.
+    """
+
+    def __init__(self, points: list[tuple[float, float]]) -> None:
+        self.points = points
+        self.counters: list[Iterator[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __getitem__(self, key: int | slice) -> tuple[float, float] | list[tuple[float, float]]:
+        return self.points[key]
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        # compress advances the counter once for every point it yields, without a Python frame
+        # per point, so that the LIC runs at nearly its own speed
+        counter = itertools.count(1)
+        self.counters.append(counter)
+        return itertools.compress(self.points, counter)
+
+    def yielded(self) -> list[int]:
+        """The number of points every iterator yielded, can only be called once."""
+        return [next(counter) - 1 for counter in self.counters]
+
+
+def progress_points(index: int, lic: Callable,
+                    points: list[tuple[float, float]] | np.ndarray) -> list[tuple[float, float]] | np.ndarray:
+    """
+    The points to call the kernel of LIC number index with so that lic_progress can tell how far
+    it got in the same call. A scalar LIC from lic.py gets points that count what its iterators
+    yield, a vectorized LIC gets the points unchanged.
+
+    Parameters:
+        index (int): The number of the LIC.
+        lic (Callable): The kernel that calculates the LIC, see select_kernels.
+        points (list of tuples | np.ndarray): The points to call it with.
+
+    Returns:
+        list of tuples | np.ndarray: The points to call it with instead.
+    """
+    return _CountingPoints(points) if lic is LICS[index] else points
+
+
+def lic_progress(index: int, points: list[tuple[float, float]] | np.ndarray,
+                 parameters: PARAMETERS_T) -> tuple[int, bool]:
+    """
+    The number of windows the kernel of LIC number index examined in the points and whether it
+    exited early, i.e. returned before its last window. The kernel must have been called once
+    with the points from progress_points. The vectorized LICs evaluate every window and never
+    exit early.
+
+    Parameters:
+        index (int): The number of the LIC.
+        points (list of tuples | np.ndarray): The points from progress_points it was called with.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+
+    Returns:
+        tuple[int, bool]: The windows examined, and True if that is fewer than lic_windows but
+            not 0, which a LIC that is not met only examines if it rejects its parameters.
+    """
+    windows = lic_windows(index, parameters, len(points))
+    if not isinstance(points, _CountingPoints):
+        return windows, False
+    yielded = points.yielded()
+    if not yielded:
+        examined = 0
+    else:
+        # The iterator over the unshifted points yields one point per window, and one more if a
+        # shifted one ends first. The windows of lic_4 and lic_6 are complete at their last point,
+        # and lic_4 also checks the windows before, so a hit before that is in its first window.
+        examined = min(yielded)
+        if index == 4:
+            examined = max(examined - parameters.q_pts + 1, 1)
+        elif index == 6:
+            examined = max(examined - parameters.n_pts + 1, 0)
+    examined = min(examined, windows)
+    return examined, 0 < examined < windows
+
+
+def threshold_tests(index: int, parameters: PARAMETERS_T,
+                    num_points: int) -> tuple[str, tuple[int, ...], tuple[tuple[str, float], ...], bool] | None:
+    """
+    LIC number index as comparisons of one metric with thresholds, with the same conditions on
+    the parameters and the number of points as the vectorized LIC.
+
+    Parameters:
+        index (int): The number of the LIC, one of THRESHOLD_LICS.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        num_points (int): The number of points of the track.
+
+    Returns:
+        tuple[str, tuple[int, ...], tuple[tuple[str, float], ...], bool] | None: The name and gaps
+            of the metric, the tests (">", "<" or "<=", threshold) that some window must pass, and
+            whether one test suffices instead of all of them. None if the LIC cannot be met.
+    """
+    p, n = parameters, num_points
+    c = compile_parameters(parameters, validate=False)
+    if index == 0:
+        return "distance", (0,), ((">", p.length_1),), False
+    if index == 1:
+        return None if p.radius_1 < 0 else ("radius", (0, 0), ((">", c.radius_1_limit),), False)
+    if index == 2:
+        if p.epsilon < 0 or p.epsilon >= math.pi:
+            return None
+        return "angle", (0, 0), (("<", c.angle_lower), (">", c.angle_upper)), True
+    if index == 3:
+        return None if p.area_1 < 0 else ("area", (0, 0), ((">", p.area_1),), False)
+    if index == 4:
+        if p.q_pts < 2 or p.q_pts > n or p.quads < 1 or p.quads > 3:
+            return None
+        return "quadrant_count", (p.q_pts,), ((">", p.quads),), False
+    if index == 5:
+        return "x_difference", (0,), (("<", 0.0),), False
+    if index == 6:
+        if p.dist < 0 or p.n_pts < 1 or n < 3:
+            return None
+        return "line_distance", (p.n_pts,), ((">", p.dist),), False
+    if index in (7, 12):
+        if p.k_pts < 1 or n < 3 or p.k_pts > n - 2 or (index == 12 and p.length_2 < 0):
+            return None
+        tests = ((">", p.length_1),) if index == 7 else ((">", p.length_1), ("<", p.length_2))
+        return "distance", (p.k_pts,), tests, False
+    if index in (8, 13):
+        if p.radius_1 < 0 or p.a_pts < 1 or p.b_pts < 1 or n < p.a_pts + p.b_pts + 3:
+            return None
+        if index == 8:
+            return "radius", (p.a_pts, p.b_pts), ((">", c.radius_1_limit),), False
+        if p.radius_2 < 0:
+            return None
+        return "radius", (p.a_pts, p.b_pts), ((">", c.radius_1_limit), ("<=", c.radius_2_limit)), False
+    if index == 9:
+        if p.c_pts < 1 or p.d_pts < 1 or n < 5 or p.c_pts + p.d_pts > n - 3:
+            return None
+        return "angle", (p.c_pts, p.d_pts), (("<", c.angle_lower), (">", c.angle_upper)), True
+    if index == 11:
+        return None if n < 3 else ("x_difference", (p.g_pts,), (("<", 0.0),), False)
+    if index in (10, 14):
+        if p.area_1 < 0 or p.e_pts < 1 or p.f_pts < 1 or n < 5 or p.e_pts + p.f_pts > n - 3:
+            return None
+        if index == 10:
+            return "area", (p.e_pts, p.f_pts), ((">", p.area_1),), False
+        if p.area_2 < 0:
+            return None
+        return "area", (p.e_pts, p.f_pts), ((">", p.area_1), ("<", p.area_2)), False
+    raise ValueError(f"LIC {index} does not compare a metric with a threshold")
+
+
+# The LICs that threshold_tests can express, all of them since LICs 4, 5 and 11 count quadrants
+# and compare X differences with 0
+THRESHOLD_LICS = frozenset(range(15))
+
+
+@dataclass(frozen=True)
+class Margin:
+    """
+    How far one test of a LIC was from flipping: the extreme of the metric over all windows that
+    decides the test, and the threshold it is compared with. For LICs 1, 8 and 13 the threshold
+    is the radius times REL_TOL. For LIC 4 the metric is the number of quadrants of a run of Q_PTS
+    points and the threshold QUADS, for LICs 5 and 11 the metric is X[j] - X[i] and the threshold 0.
+
+    Attributes:
+        metric (str): The name of the metric, see lic_vectorized.GeometryContext.
+        test (str): ">" if some window must be above the threshold, "<" or "<=" if below.
+        threshold (float): The threshold.
+        extreme (float | None): The largest value for ">", the smallest otherwise, None if no
+            window has a value.
+    """
+
+    metric: str
+    test: str
+    threshold: float
+    extreme: float | None
+
+    @property
+    def distance(self) -> float | None:
+        """The signed distance of the extreme from the threshold, positive on the side that passes the test."""
+        if self.extreme is None:
+            return None
+        return self.extreme - self.threshold if self.test == ">" else self.threshold - self.extreme
+
+
+def calculate_margins(geometry: lic_vectorized.GeometryContext, parameters: PARAMETERS_T,
+                      required: list[bool] | None = None) -> list[tuple[Margin, ...] | None]:
+    """
+    The margins of the LICs from the metric arrays of a GeometryContext. Metrics that the LICs
+    already computed are read from the context, refined around the thresholds, so the margins
+    agree with their results.
+
+    Parameters:
+        geometry (lic_vectorized.GeometryContext): The geometry of a single frame.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        required (list[bool] | None): The LICs to report, see calculate_required_LICs. All if None.
+
+    Returns:
+        list[tuple[Margin, ...] | None]: One Margin per test of every LIC, an empty tuple if the
+            LIC cannot be met for these parameters and number of points, and None for the LICs
+            that are not required.
+    """
+    from lic_vectorized import metric_extremes
+    margins = [None] * 15
+    for i in sorted(THRESHOLD_LICS):
+        if required is not None and not required[i]:
+            continue
+        form = threshold_tests(i, parameters, len(geometry.points))
+        if form is None:
+            margins[i] = ()
+            continue
+        name, gaps, tests, _ = form
+        extremes = metric_extremes(geometry.metric(name, gaps))
+        margins[i] = tuple(Margin(name, test, threshold, None if extremes is None else extremes[test == ">"])
+                           for test, threshold in tests)
+    return margins
+
+
+def calculate_required_LICs(LCM: list[list[str]], PUV: list[bool]) -> list[bool]:
+    """
+    Determine which CMV entries can affect the launch decision.
+
+    Row i of the PUM is only read by Calculate_FUV when PUV[i] is True, and within that row only
+    the elements where LCM[i][j] is not NOTUSED depend on the CMV, namely on CMV[i] and CMV[j].
+    Every other CMV entry has no effect on the FUV and does not have to be calculated.
+
+    Parameters:
+        LCM (list[List[str]]): A matrix of bolean operations, ANDD, ORR or NOTUSED.
+        PUV (list[bool]): PUV[i] is False if lic_i should be ignored.
+
+    Returns:
+        list[bool]: True for every LIC whose result is needed.
+    """
+    size = len(PUV)
+    required = [False] * size
+    for i in range(size):
+        if not PUV[i]:
+            continue
+        for j in range(size):
+            if i != j and LCM[i][j] != "NOTUSED":
+                required[i] = True
+                required[j] = True
+    return required
+
+
+def calculate_CMV(points: list[tuple[float, float]] | np.ndarray, parameters: PARAMETERS_T,
+                  required: list[bool] | None = None, instrumentation: Instrumentation | None = None,
+                  engine: str = "auto",
+                  margins: bool = False) -> list[bool | None] | tuple[list[bool | None], list[tuple[Margin, ...] | None]]:
     """
     Calculate the Conditions Met Vector (CMV) based on the given points and parameters.
 
     This function iterates over all 15 Launch Interceptor Conditions (LICs) and sets 
     the corresponding element in the CMV to True if the LIC is met, and False otherwise.
+    If required is given, only the LICs marked in it are calculated and the other
+    elements are set to None. Every LIC is calculated with the scalar or the vectorized
+    engine, whichever is faster for the number of points, see select_kernels.
 
     Parameters:
-        points (list of tuples): A list of tuples representing points (X, Y).
-        parameters (dict): A dictionary containing the parameters for the LICs.
+        points (list of tuples | Track | np.ndarray): Points (X, Y), either as tuples, as a track.Track or
+            as an (N, 2) array. A memory-mapped track (see track_io.load_track) of more than CHUNK_SIZE points is read in
+            blocks by calculate_CMV_chunked, unless instrumentation or margins are requested.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        required (list[bool] | None): The LICs to calculate, see calculate_required_LICs. All if None.
+        instrumentation (Instrumentation | None): Records the time and windows of every LIC and the
+            time of the CMV stage if given.
+        engine (str): "auto", or "scalar" or "vectorized" to use one engine for all LICs.
+        margins (bool): Also return how far every LIC was from flipping, see calculate_margins. The
+            LICs are then calculated with the vectorized engine and the margins are read from the
+            metric arrays they computed, without a second pass over the points.
         
     Returns:
         list of bool: The Conditions Met Vector (CMV) which is set to True if the LIC is met, and False otherwise.
+            With margins, a tuple of the CMV and the margins.
     """
 
-    CMV = [False] * 15
-
-    CMV[0] = lic_0(points, parameters.length_1)
-    CMV[1] = lic_1(points, parameters.radius_1)
-    CMV[2] = lic_2(points, parameters.epsilon)
-    CMV[3] = lic_3(points, parameters.area_1)
-    CMV[4] = lic_4(points, parameters.q_pts, parameters.quads)
-    CMV[5] = lic_5(points)
-    CMV[6] = lic_6(points, parameters.n_pts, parameters.dist)
-    CMV[7] = lic_7(points, parameters.k_pts, parameters.length_1)
-    CMV[8] = lic_8(points, parameters.radius_1, parameters.a_pts, parameters.b_pts)
-    CMV[9] = lic_9(points, parameters.c_pts, parameters.d_pts, parameters.epsilon)
-    CMV[10] = lic_10(points, parameters.e_pts, parameters.f_pts, parameters.area_1)
-    CMV[11] = lic_11(points, parameters.g_pts)
-    CMV[12] = lic_12(points, parameters.k_pts, parameters.length_1, parameters.length_2)
-    CMV[14] = lic_14(points, parameters.e_pts, parameters.f_pts, parameters.area_1, parameters.area_2)
-    CMV[13] = lic_13(points, parameters.radius_1, parameters.radius_2, parameters.a_pts, parameters.b_pts)
+    if is_numpy_instance(points, "memmap") and len(points) > CHUNK_SIZE and instrumentation is None and not margins:
+        # Imported here since chunked builds on this module
+        from chunked import calculate_CMV_chunked
+        return calculate_CMV_chunked(points, parameters, required)
+
+    CMV = [False] * 15 if required is None else [None] * 15
+
+    if margins:
+        import lic_vectorized
+        array = lic_vectorized.as_point_array(points)
+        geometry = lic_vectorized.GeometryContext(array)
+        kernels = [(functools.partial(lic, geometry=geometry), array) for lic in vectorized_lics()]
+    else:
+        kernels = select_kernels(points, engine)
+
+    if instrumentation is not None:
+        _calculate_CMV_instrumented(kernels, parameters, required, instrumentation, CMV)
+    else:
+        for i, (lic, lic_points) in enumerate(kernels):
+            if required is None or required[i]:
+                CMV[i] = lic(lic_points, *lic_arguments(i, parameters))
+
+    if margins:
+        return CMV, calculate_margins(geometry, parameters, required)
+    return CMV
+
 
+def _calculate_CMV_instrumented(kernels: list[tuple[Callable, list | np.ndarray]], parameters: PARAMETERS_T,
+                                required: list[bool] | None, instrumentation: Instrumentation,
+                                CMV: list[bool | None]) -> list[bool | None]:
+    """
+    calculate_CMV that records every LIC and the whole stage in instrumentation. The windows of a
+    LIC are counted in the call that is timed, see progress_points.
+    """
+    stage_start = time.perf_counter()
+    for i, (lic, lic_points) in enumerate(kernels):
+        if required is None or required[i]:
+            arguments = lic_arguments(i, parameters)
+            lic_points = progress_points(i, lic, lic_points)
+            start = time.perf_counter()
+            CMV[i] = lic(lic_points, *arguments)
+            seconds = time.perf_counter() - start
+            instrumentation.record_lic(i, seconds, *lic_progress(i, lic_points, parameters))
+    instrumentation.record_stage("CMV", time.perf_counter() - stage_start)
     return CMV
 
 
+def calculate_CMV_vectorized(points: list[tuple[float, float]] | np.ndarray, parameters: PARAMETERS_T,
+                             required: list[bool] | None = None) -> list[bool | None]:
+    """
+    Calculate the Conditions Met Vector (CMV) with the vectorized LICs from lic_vectorized.
+
+    The points are converted once to a contiguous (N, 2) float64 array, after which every LIC
+    evaluates all of its pairs or triples with whole-array operations. The LICs share one
+    GeometryContext, so distances, areas, radii and angles that several LICs need are computed
+    once. The result is identical to the one of calculate_CMV.
+
+    Parameters:
+        points (list of tuples | np.ndarray): Points (X, Y), either as tuples or as an (N, 2) array.
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        required (list[bool] | None): The LICs to calculate, see calculate_required_LICs. All if None.
+
+    Returns:
+        list of bool: The Conditions Met Vector (CMV) which is set to True if the LIC is met, and False otherwise.
+    """
+    import lic_vectorized
+    points = lic_vectorized.as_point_array(points)
+    geometry = lic_vectorized.GeometryContext(points)
+
+    CMV = [False] * 15 if required is None else [None] * 15
+
+    for i, lic in enumerate(vectorized_lics()):
+        if required is None or required[i]:
+            CMV[i] = lic(points, *lic_arguments(i, parameters), geometry=geometry)
+
+    return CMV
+
+
+def calculate_CMV_batch(points: np.ndarray, parameters: PARAMETERS_T, lengths: np.ndarray | None = None,
+                        required: list[bool] | None = None) -> np.ndarray:
+    """
+    Calculate the Conditions Met Vector (CMV) of every frame of a batch with the vectorized LICs.
+
+    Parameters:
+        points (np.ndarray): The frames as an array of shape (B, N, 2).
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        lengths (np.ndarray | None): Number of valid points of every frame if the frames are padded.
+        required (list[bool] | None): The LICs to calculate, see calculate_required_LICs. All if None.
+            The columns of the other LICs are left False and have no meaning.
+
+    Returns:
+        np.ndarray: A (B, 15) boolean matrix, row b is the CMV of frame b.
+    """
+    import numpy as np
+    import lic_vectorized
+    geometry = lic_vectorized.GeometryContext(points, lengths)
+
+    CMV = np.zeros((points.shape[0], 15), dtype=bool)
+
+    for i, lic in enumerate(vectorized_lics()):
+        if required is None or required[i]:
+            CMV[:, i] = lic(points, *lic_arguments(i, parameters), lengths=lengths, geometry=geometry)
+
+    return CMV
+
 
 def calculate_PUM(LCM: list[list[str]], CMV: list[bool]) -> list[list[bool]]:
     """
@@ -99,3 +595,52 @@ def Calculate_Launch(FUV: list[bool]) -> bool:
         bool: A decision for or against launch 
     """
     return all(FUV)
+
+
+def calculate_PUM_batch(LCM: list[list[str]], CMV: np.ndarray) -> np.ndarray:
+    """
+    Calculate the Preliminary Unlocking Matrix (PUM) of every CMV in a batch, see calculate_PUM.
+
+    Parameters:
+        LCM (list[List[str]]): A matrix of bolean operations, ANDD, ORR or NOTUSED.
+        CMV (np.ndarray): A (B, 15) boolean matrix with one CMV per row.
+
+    Returns:
+        np.ndarray: A (B, 15, 15) boolean array with one PUM per frame.
+    """
+    import numpy as np
+    LCM = np.asarray(LCM)
+    size = CMV.shape[-1]
+    off_diagonal = ~np.eye(size, dtype=bool)
+    CMV_i = CMV[..., :, np.newaxis]
+    CMV_j = CMV[..., np.newaxis, :]
+    PUM = np.where((LCM == "ANDD") & off_diagonal, CMV_i & CMV_j, True)
+    return np.where((LCM == "ORR") & off_diagonal, CMV_i | CMV_j, PUM)
+
+
+def Calculate_FUV_batch(PUM: np.ndarray, PUV: list[bool]) -> np.ndarray:
+    """
+    Calculate the Final Unlocking Vector (FUV) of every PUM in a batch, see Calculate_FUV.
+
+    Parameters:
+        PUM (np.ndarray): A (B, 15, 15) boolean array with one PUM per frame.
+        PUV (list[bool]): PUV[i] is False if lic_i should be ignored.
+
+    Returns:
+        np.ndarray: A (B, 15) boolean matrix with one FUV per row.
+    """
+    import numpy as np
+    return ~np.asarray(PUV, dtype=bool) | PUM.all(axis=-1)
+
+
+def Calculate_Launch_batch(FUV: np.ndarray) -> np.ndarray:
+    """
+    Calculate the launch decision of every FUV in a batch, see Calculate_Launch.
+
+    Parameters:
+        FUV (np.ndarray): A (B, 15) boolean matrix with one FUV per row.
+
+    Returns:
+        np.ndarray: A (B,) boolean array, True for the frames that launch.
+    """
+    return FUV.all(axis=-1)
@@ -0,0 +1,153 @@
+"""
+Opt-in instrumentation of the DECIDE pipeline.
+
+Pass an Instrumentation to calculate_CMV, decide or Decider.decide to record how long every
+LIC and every stage takes, how many windows (pairs or triples) each LIC examined and how
+often a LIC returned before its last window. A scalar LIC counts its windows in the call that
+is timed, on points that count what it iterates over. Without one the pipeline only checks
+`instrumentation is None` once per LIC, so it costs next to nothing when disabled.
+
+    instrumentation = Instrumentation()
+    for points in frames:
+        decider.decide(points, instrumentation)
+    print(instrumentation.report())
+
+Subclass Instrumentation and override record_lic or record_stage to receive every
+measurement as a callback instead of, or in addition to, the histograms.
+"""
+
+import bisect
+import math
+
+# Upper bounds of the histogram buckets, 100 ns to about 100 s in steps of a factor 2
+BUCKET_BOUNDS = tuple(1e-7 * 2 ** k for k in range(30))
+
+
+class Histogram:
+    """A histogram of durations with buckets that grow by a factor 2."""
+
+    def __init__(self) -> None:
+        # The last bucket holds everything above the largest bound
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """
+        Add one duration.
+
+        Parameters:
+            seconds (float): The duration in seconds.
+        """
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        """The mean duration, 0 if empty."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        The upper bound of the bucket that contains quantile q, e.g. q = 0.99 for the p99.
+
+        Parameters:
+            q (float): The quantile in [0, 1].
+
+        Returns:
+            float: An upper bound of the quantile in seconds, 0 if empty.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict:
+        """The summary and the non-empty buckets, keyed by their upper bound."""
+        bounds = [*BUCKET_BOUNDS, math.inf]
+        return {"count": self.count, "total": self.total, "mean": self.mean,
+                "min": self.min if self.count else 0.0, "max": self.max,
+                "p50": self.quantile(0.5), "p99": self.quantile(0.99),
+                "buckets": {str(bound): count for bound, count in zip(bounds, self.counts) if count}}
+
+
+class Instrumentation:
+    """
+    Collects the measurements of many calls into histograms and counters.
+
+    Attributes:
+        lic_times (list[Histogram]): The wall time of every LIC.
+        lic_windows (list[int]): The number of windows (pairs, triples or runs of points) every LIC
+            examined, summed over all calls. The vectorized LICs examine all of them.
+        lic_calls (list[int]): The number of times every LIC was calculated.
+        lic_early_exits (list[int]): The number of times a scalar LIC returned before its last
+            window because an earlier one met it.
+        stage_times (dict[str, Histogram]): The wall time of every stage, e.g. CMV or launch.
+    """
+
+    def __init__(self) -> None:
+        self.lic_times = [Histogram() for _ in range(15)]
+        self.lic_windows = [0] * 15
+        self.lic_calls = [0] * 15
+        self.lic_early_exits = [0] * 15
+        self.stage_times: dict[str, Histogram] = {}
+
+    def record_lic(self, index: int, seconds: float, windows: int, early_exit: bool) -> None:
+        """
+        Record one calculation of a LIC.
+
+        Parameters:
+            index (int): The number of the LIC.
+            seconds (float): Its wall time.
+            windows (int): The number of windows it examined, see decision_logic.lic_progress.
+            early_exit (bool): Whether it returned before its last window.
+        """
+        self.lic_times[index].add(seconds)
+        self.lic_windows[index] += windows
+        self.lic_calls[index] += 1
+        self.lic_early_exits[index] += bool(early_exit)
+
+    def record_stage(self, name: str, seconds: float) -> None:
+        """
+        Record one run of a stage of the pipeline.
+
+        Parameters:
+            name (str): The name of the stage.
+            seconds (float): Its wall time.
+        """
+        if name not in self.stage_times:
+            self.stage_times[name] = Histogram()
+        self.stage_times[name].add(seconds)
+
+    def as_dict(self) -> dict:
+        """All measurements in a form that can be written as JSON."""
+        return {
+            "lics": [{"lic": i, "calls": self.lic_calls[i], "windows": self.lic_windows[i],
+                      "early_exits": self.lic_early_exits[i], "time": self.lic_times[i].as_dict()}
+                     for i in range(15)],
+            "stages": {name: histogram.as_dict() for name, histogram in self.stage_times.items()},
+        }
+
+    def report(self) -> str:
+        """A table of the LICs and stages, the most expensive first."""
+        lines = [f"{'':>10} {'calls':>8} {'total ms':>10} {'mean us':>10} {'p99 us':>10} {'windows':>10} {'early':>6}"]
+        for i in sorted(range(15), key=lambda i: -self.lic_times[i].total):
+            if self.lic_calls[i]:
+                times = self.lic_times[i]
+                lines.append(f"{'lic_' + str(i):>10} {self.lic_calls[i]:>8} {times.total * 1e3:>10.2f} "
+                             f"{times.mean * 1e6:>10.1f} {times.quantile(0.99) * 1e6:>10.1f} "
+                             f"{self.lic_windows[i]:>10} {self.lic_early_exits[i]:>6}")
+        for name, times in self.stage_times.items():
+            lines.append(f"{name:>10} {times.count:>8} {times.total * 1e3:>10.2f} "
+                         f"{times.mean * 1e6:>10.1f} {times.quantile(0.99) * 1e6:>10.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,30 @@
+"""
+Checks for NumPy objects that do not import NumPy.
+
+Importing NumPy takes longer than deciding a small frame with the scalar LICs, so the modules on
+the path of a single decision (decide, decision_logic, policy) import NumPy and lic_vectorized
+inside the functions that use them. To tell whether the points are an array they use these
+helpers: a value can only be a NumPy object if NumPy has been imported already.
+"""
+
+import sys
+
+
+def numpy_loaded() -> bool:
+    """Whether NumPy has been imported by any module."""
+    return "numpy" in sys.modules
+
+
+def is_numpy_instance(value: object, name: str = "ndarray") -> bool:
+    """
+    isinstance(value, getattr(numpy, name)), without importing NumPy.
+
+    Parameters:
+        value (object): The value to check.
+        name (str): The name of a NumPy type, e.g. "ndarray", "memmap" or "bool_".
+
+    Returns:
+        bool: True if value is an instance of the NumPy type.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, getattr(numpy, name))
@@ -1,9 +1,50 @@
-import numpy as np
+"""
+The 15 Launch Interceptor Conditions (LICs).
+
+Every LIC takes the points as a list of (x, y) tuples, or as any sequence that indexes, slices and
+iterates like one, such as a track.Track. The windows are formed by iterating over shifted views
+of the sequence, see shifted, so a list is never sliced in the loops.
+"""
+
 import math
+from collections import deque
+from itertools import islice
 
 # Tolerance for exact float matching
 REL_TOL = 1 + 1e-09
 
+
+def shifted(points, offset: int):
+    """
+    Iterate over the points from index offset on, like points[offset:] but without copying a list.
+    A negative offset counts from the end, as in a slice.
+
+    Parameters:
+        points (list[tuple[float, float]] | Track): The points.
+        offset (int): The index of the first point.
+
+    Returns:
+        Iterable[tuple[float, float]]: The points from offset on.
+    """
+    if offset < 0:
+        return points[offset:]
+    return islice(points, offset, None)
+
+def euclidean_distance(p1: tuple[float, float], p2: tuple[float, float]) -> float:
+    """
+    Calculate the euclidean distance between two points.
+
+    Parameters:
+        p1 (tuple[float, float]): First point (x, y)
+        p2 (tuple[float, float]): Second point (x, y)
+
+    Returns:
+        float: The distance between p1 and p2.
+    """
+    dx = p1[0] - p2[0]
+    dy = p1[1] - p2[1]
+    return math.sqrt(dx * dx + dy * dy)
+
 def lic_0(points: list[tuple[float, float]], length_1: float) -> bool:
     """
     Determines if there exists at least one set of two consecutive data points
@@ -18,17 +59,17 @@ def lic_0(points: list[tuple[float, float]], length_1: float) -> bool:
     """
     if len(points) < 2:
         return False
-    for i in range(len(points) - 1):
-        if np.linalg.norm(np.array(points[i]) - np.array(points[i + 1])) > length_1:
+    for p1, p2 in zip(points, shifted(points, 1)):
+        if euclidean_distance(p1, p2) > length_1:
             return True
     return False
 
 def minimum_radius(points: list[tuple[float, float]]) -> float:
-    points = np.array(points)
+    p1, p2, p3 = points
     # Calculate sides of the triangle formed by the points
-    a = np.linalg.norm(points[0] - points[1])
-    b = np.linalg.norm(points[0] - points[2])
-    c = np.linalg.norm(points[1] - points[2])
+    a = euclidean_distance(p1, p2)
+    b = euclidean_distance(p1, p3)
+    c = euclidean_distance(p2, p3)
 
     # Calculate the smallest radius
     if (b*b + c*c - a*a) * (a*a + c*c - b*b) * (a*a + b*b - c*c) <= 0:
@@ -36,7 +77,7 @@ def minimum_radius(points: list[tuple[float, float]]) -> float:
         min_radius = max(a,b,c)/2
     else:
         min_radius = (
-            a * b * c / np.sqrt((a + b + c) * (b + c - a) * (a + c - b) * (a + b - c))
+            a * b * c / math.sqrt((a + b + c) * (b + c - a) * (a + c - b) * (a + b - c))
         )
     return min_radius
 
@@ -56,10 +97,11 @@ def lic_1(points: list[tuple[float, float]], radius: float) -> bool:
     if radius < 0:
         return False
 
-    for corners in zip(points, points[1:], points[2:]):
+    limit = radius * REL_TOL
+    for corners in zip(points, shifted(points, 1), shifted(points, 2)):
         min_radius = minimum_radius(corners)
         # Return True if the min radius is larger and thus uncontainable by radius
-        if min_radius > radius * REL_TOL:
+        if min_radius > limit:
             return True
 
     # If all sets are containable
@@ -123,23 +165,18 @@ def lic_2(points: list[tuple[float, float]], epsilon: float) -> bool:
     if epsilon < 0 or epsilon >= math.pi:
         return False
 
-    for i in range(len(points) - 2):
-        p1 = points[i]
-        p2 = points[i + 1]
-        p3 = points[i + 2]
-
+    lower, upper = math.pi - epsilon, math.pi + epsilon
+    for p1, p2, p3 in zip(points, shifted(points, 1), shifted(points, 2)):
         if p1 == p2 or p2 == p3 or p1 == p3:
             continue
 
         angle = calculate_angle(p1, p2, p3)
-        if angle is not None and (
-            angle < math.pi - epsilon or angle > math.pi + epsilon
-        ):
+        if angle is not None and (angle < lower or angle > upper):
             return True
     return False
 
 
-def area_of_triangle(set: np.ndarray):
+def area_of_triangle(set: tuple[tuple[float, float], ...]) -> float:
     p1 = set[0]
     p2 = set[1]
     p3 = set[2]
@@ -169,13 +206,36 @@ def lic_3(points: list[tuple[float, float]], area: float) -> bool:
     if area < 0:
         return False
 
-    for set in zip(points, points[1:], points[2:]):
+    for set in zip(points, shifted(points, 1), shifted(points, 2)):
         if area_of_triangle(set) > area:
             return True
 
     # No sets create a large enough triangle
     return False
 
+def get_quadrant(point: tuple[float, float]) -> int | None:
+    """
+    Determine the quadrant of a given point. Where there is ambiguity the priority
+    is I, II, III, IV.
+
+    Parameters:
+        point (tuple[float, float]): The point (x, y)
+
+    Returns:
+        int | None: The quadrant from 1 to 4, None if the point lies in none of them.
+    """
+    x, y = point
+    if x >= 0 and y >= 0:
+        return 1  # Quadrant I
+    elif x <= 0 and y >= 0:
+        return 2  # Quadrant II
+    elif x <= 0 and y <= 0:
+        return 3  # Quadrant III
+    elif x >= 0 and y <= 0:
+        return 4
+    else:
+        return None
+
 def lic_4(points: list[tuple[float, float]], q_pts: int, quads: int) -> bool:
     """
     There exists at least one set of Q_PTS consecutive data points that lie in more than QUADS
@@ -195,30 +255,28 @@ def lic_4(points: list[tuple[float, float]], q_pts: int, quads: int) -> bool:
     """
     if q_pts < 2 or q_pts > len(points) or quads < 1 or quads > 3:
         return False
-    
-    def get_quadrant(point):
-        """Determine the quadrant of a given point."""
-        x, y = point
-        if x >= 0 and y >= 0:
-            return 1  # Quadrant I
-        elif x <= 0 and y >= 0:
-            return 2  # Quadrant II
-        elif x <= 0 and y <= 0:
-            return 3  # Quadrant III
-        elif x >= 0 and y <= 0:
-            return 4
-        else:
-            return None
-    
-    for i in range(len(points) - q_pts + 1):
-        quadrants = set()
-        for j in range(i, i + q_pts):
-            quadrant = get_quadrant(points[j])
-            if quadrant is not None:
-                quadrants.add(quadrant)
-            if len(quadrants) > quads:
-                return True
-            
+
+    # Slide a window over the points, classifying every point once when it enters. The window
+    # keeps how many of its points lie in each quadrant (counts[0] for points in none of them),
+    # so moving it by one point is constant work. Every window of fewer than Q_PTS points is the
+    # start of the first full window, so the condition can be checked after every point.
+    window = deque()
+    counts = [0] * 5
+    distinct = 0
+    for point in points:
+        quadrant = get_quadrant(point) or 0
+        window.append(quadrant)
+        if quadrant and counts[quadrant] == 0:
+            distinct += 1
+        counts[quadrant] += 1
+        if len(window) > q_pts:
+            leaving = window.popleft()
+            counts[leaving] -= 1
+            if leaving and counts[leaving] == 0:
+                distinct -= 1
+        if distinct > quads:
+            return True
+
     return False
 
 
@@ -234,12 +292,41 @@ def lic_5(points: list[tuple[float, float]]) -> bool:
     Returns:
         bool: True if the x values of two consecutive data points are decreasing, False otherwise.
     """
-    for (x_i, _), (x_j, _) in zip(points, points[1:]):
+    for (x_i, _), (x_j, _) in zip(points, shifted(points, 1)):
         if x_j - x_i < 0:
             return True
     return False
 
 
+def distance_to_line(first: tuple[float, float], last: tuple[float, float], point: tuple[float, float]) -> float:
+    """
+    Calculated the distance of point to the line defined by first and last.
+    If first and last are equal then the distance is calculated from the coincident point instead.
+
+    Parameters:
+        first (tuple[float, float]): The first point that defines the line.
+        last (tuple[float, float]): The second point that defines the line.
+        point (tuple[float, float]): The point that the distance is calculated to.
+
+    Returns:
+        float: the distance from point to the line defined by first and last,
+            if first and last are equal the distance is calculated from the coincident point.
+    """
+    x1, y1 = first
+    x2, y2 = last
+    x, y = point
+
+    #If first and last are equal the distance is calculated from the coincident point.
+    if first == last:
+        return math.sqrt((x - x1)**2 + (y - y1)**2)
+
+    #Line equation Ax + By + C = 0
+    A = y2 - y1
+    B = x1 - x2
+    C = x2 * y1 - x1 * y2
+
+    return abs(A * x + B * y + C) / math.sqrt(A**2 + B**2)
+
 def lic_6(points: list[tuple[float, float]], n_pts: int, dist: float):
     """
     There exists at least one set of N PTS consecutive data points such that at least one of the
@@ -260,46 +347,19 @@ def lic_6(points: list[tuple[float, float]], n_pts: int, dist: float):
             and last point in the set, if the first and last point are equal then the distance
             is from the coincident point instead. False otherwise.
     """
-    def distance_to_line(first: tuple[float, float], last: tuple[float, float], point: tuple[float, float]):
-        """
-        Calculated the distance of point to the line defined by first and last.
-        If first and last are equal then the distance is calculated from the coincident point instead.
-
-        Parameters:
-            first (tuple[float, float]): The first point that defines the line.
-            last (tuple[float, float]): The second point that defines the line.
-            point (tuple[float, float]): The point that the distance is calculated to.
-
-        Returns:
-            float: the distance from point to the line defined by first and last,
-                if first and last are equal the distance is calculated from the coincident point.
-        """
-        x1, y1 = first
-        x2, y2 = last
-        x, y = point
-
-        #If first and last are equal the distance is calculated from the coincident point.
-        if first == last:
-            return math.sqrt((x - x1)**2 + (y - y1)**2)
-        
-        #Line equation Ax + By + C = 0
-        A = y2 - y1
-        B = x1 - x2
-        C = x2 * y1 - x1 * y2
-
-        return abs(A * x + B * y + C) / math.sqrt(A**2 + B**2)
-
-
     if len(points) < 3:
         return False
     
-    if dist < 0:
+    if dist < 0 or n_pts < 1:
         return False
     
-    for i in range(len(points) - n_pts + 1):
-        subset = points[i:i + n_pts]
-        first, last = subset[0], subset[-1]
-        for point in subset:
+    # Slide a window of N PTS points over a single iterator, so no window is copied out of the points
+    iterator = iter(points)
+    window = deque(islice(iterator, n_pts - 1), maxlen=n_pts)
+    for last in iterator:
+        window.append(last)
+        first = window[0]
+        for point in window:
             if distance_to_line(first, last, point) > dist:
                 return True
     
@@ -324,10 +384,8 @@ def lic_7(points: list[tuple[float, float]], k_pts: int, length_1: float) -> boo
     if NUMPOINTS < 3 or k_pts < 1 or k_pts > NUMPOINTS - 2:
         return False
 
-    for i in range(NUMPOINTS - k_pts - 1):
-        x1, y1 = points[i]
-        x2, y2 = points[i + k_pts + 1]  # Separated by k_pts indexing
-        euclidean_dist = np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    for (x1, y1), (x2, y2) in zip(points, shifted(points, k_pts + 1)):  # Separated by k_pts points
+        euclidean_dist = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
         if euclidean_dist > length_1:
             return True
     return False
@@ -356,11 +414,12 @@ def lic_8(points: list[tuple[float, float]], radius: float, a_pts: int, b_pts: i
     if radius < 0 or a_pts < 1 or b_pts <1 or len(points) < a_pts + b_pts + 3:
         return False
 
-    for corners in zip(points, points[1+a_pts:],points[2+a_pts+b_pts:]):
+    limit = radius * REL_TOL
+    for corners in zip(points, shifted(points, 1 + a_pts), shifted(points, 2 + a_pts + b_pts)):
         min_radius = minimum_radius(corners)
 
         # Return True if the min radius is larger and thus uncontainable by radius
-        if min_radius  > radius * REL_TOL:
+        if min_radius  > limit:
             return True
 
     # If all sets are containable
@@ -391,16 +450,13 @@ def lic_9(points: list[tuple[float, float]], c_pts: int, d_pts: int, epsilon: fl
     if c_pts < 1 or d_pts < 1 or c_pts + d_pts > (len(points) - 3) or len(points) < 5:
         return False
 
-    for i in range(len(points) - c_pts - d_pts - 2):
-        p1 = points[i]
-        p2 = points[i + c_pts + 1]
-        p3 = points[i + c_pts + d_pts + 2]
-
+    lower, upper = math.pi - epsilon, math.pi + epsilon
+    for p1, p2, p3 in zip(points, shifted(points, c_pts + 1), shifted(points, c_pts + d_pts + 2)):
         if p1 == p2 or p2 == p3 or p1 == p3:
             continue
 
         angle = calculate_angle(p1, p2, p3)
-        if angle is not None and (angle < math.pi - epsilon or angle > math.pi + epsilon):
+        if angle is not None and (angle < lower or angle > upper):
             return True
 
     return False
@@ -437,7 +493,7 @@ def lic_10(points: list[tuple[float, float]], e_pts: int, f_pts: int, area1) ->
     if e_pts + f_pts > len(points) - 3:
         return False
 
-    for set in zip(points, points[1+e_pts:], points[2+e_pts + f_pts:]):
+    for set in zip(points, shifted(points, 1 + e_pts), shifted(points, 2 + e_pts + f_pts)):
         if area_of_triangle(set) > area1:
             return True
 
@@ -460,7 +516,7 @@ def lic_11(points: list[tuple[float, float]], g_pts: int):
     """
     if len(points) < 3:
         return False
-    for (x_i, _), (x_j, _) in zip(points, points[1 + g_pts:]):
+    for (x_i, _), (x_j, _) in zip(points, shifted(points, 1 + g_pts)):
         if x_j - x_i < 0:
             return True
     return False
@@ -487,9 +543,7 @@ def lic_12(
     condition_2 = False
 
     # Check points separated by exactly k_pts intervening points
-    for i in range(NUMPOINTS - k_pts - 1):
-        x1, y1 = points[i]
-        x2, y2 = points[i + k_pts + 1]
+    for (x1, y1), (x2, y2) in zip(points, shifted(points, k_pts + 1)):
         distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
         # Check condition 1 (distance > LENGTH1)
@@ -537,18 +591,22 @@ def lic_13(points: list[tuple[float, float]], radius1: float, radius2: float, a_
     
     radius1_uncont = False
     radius2_cont = False
+    limit1, limit2 = radius1 * REL_TOL, radius2 * REL_TOL
 
-    for corners in zip(points, points[1+a_pts:],points[2+a_pts+b_pts:]):
+    for corners in zip(points, shifted(points, 1 + a_pts), shifted(points, 2 + a_pts + b_pts)):
         min_radius = minimum_radius(corners)
 
         # Compare the min radius to radius1 and radius2
-        if min_radius  > radius1 * REL_TOL:
+        if min_radius  > limit1:
             radius1_uncont = True
-        if min_radius  <= radius2 * REL_TOL:
+        if min_radius  <= limit2:
             radius2_cont = True
 
-    # Return True only if both radii conditions are satisfied
-    return radius1_uncont and radius2_cont
+        # Both radii conditions are satisfied
+        if radius1_uncont and radius2_cont:
+            return True
+
+    return False
 
 def lic_14(points: list[tuple[float, float]], e_pts: int, f_pts: int, area1: float, area2: float):
     """
@@ -593,12 +651,12 @@ def lic_14(points: list[tuple[float, float]], e_pts: int, f_pts: int, area1: flo
 
     smaller_triangle_exists = False
     larger_triangle_exists = False
-    for set in zip(points, points[1 + e_pts:], points[2 + e_pts + f_pts:]):
-        set = np.array(set)
-        if area_of_triangle(set) > area1:
+    for set in zip(points, shifted(points, 1 + e_pts), shifted(points, 2 + e_pts + f_pts)):
+        area = area_of_triangle(set)
+        if area > area1:
             larger_triangle_exists = True
 
-        if area_of_triangle(set) < area2:
+        if area < area2:
             smaller_triangle_exists = True
 
         if smaller_triangle_exists and larger_triangle_exists:
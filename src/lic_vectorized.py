@@ -0,0 +1,914 @@
+"""
+Vectorized versions of the 15 Launch Interceptor Conditions.
+
+Every LIC takes the points as one float64 array of shape (N, 2) and evaluates all of its
+pairs or triples at once through strided views instead of looping over a list of tuples.
+The functions have the same names, arguments and return values as the ones in lic.py.
+
+All functions also accept a batch of frames of shape (B, N, 2), in which case a LIC returns
+a boolean array with one result per frame. Frames of different lengths are padded to N
+points and passed together with their lengths; windows that reach into the padding are ignored.
+
+Metrics whose scalar counterpart goes through libm (math.acos) can differ from the vectorized
+result in the last bit. Such values are recomputed with the scalar helper from lic.py whenever
+they lie within GUARD_BAND of a threshold, so that both engines always agree on the CMV.
+Distances and radii are computed with the same operations as in lic.py, the same recomputation
+keeps them in agreement should that ever change.
+"""
+
+import itertools
+import math
+from collections.abc import Callable
+
+import numpy as np
+
+from lic import REL_TOL, euclidean_distance, minimum_radius, calculate_angle
+
+
+# Relative distance from a threshold within which a metric is recomputed by the scalar helper
+GUARD_BAND = 1e-9
+
+
+def as_point_array(points: list[tuple[float, float]] | np.ndarray) -> np.ndarray:
+    """
+    Convert points to a contiguous float64 array of shape (N, 2).
+    Arrays that already have this layout are returned without copying.
+
+    Parameters:
+        points (list[tuple[float, float]] | np.ndarray): Planar points (x, y).
+
+    Returns:
+        np.ndarray: The points as an (N, 2) float64 array.
+    """
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    if points.size == 0:
+        return points.reshape(0, 2)
+    return points
+
+
+def as_frame_batch(frames: list[list[tuple[float, float]]] | np.ndarray, lengths: np.ndarray | None = None,
+                   mask: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Convert a batch of frames to a contiguous float64 array of shape (B, N, 2).
+
+    Frames of different lengths are padded with zeros to the length of the longest frame. The
+    number of valid points per frame can also be given for an array that is already padded,
+    either as lengths or as a (B, N) mask that is True for the valid points at the start of a frame.
+
+    Parameters:
+        frames (list[list[tuple[float, float]]] | np.ndarray): The frames of the batch.
+        lengths (np.ndarray | None): Number of valid points of every frame.
+        mask (np.ndarray | None): True for the valid points of every frame.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray | None]: The padded points and the lengths of the frames,
+            None if all frames have the same length.
+    """
+    if mask is not None:
+        lengths = np.count_nonzero(mask, axis=-1)
+    if isinstance(frames, np.ndarray):
+        points = np.ascontiguousarray(frames, dtype=np.float64)
+        if points.ndim != 3:
+            # A batch without frames has no length to infer, e.g. np.zeros((0, 10))
+            points = points.reshape(len(points), -1 if points.size else 0, 2)
+    else:
+        frame_lengths = np.array([len(frame) for frame in frames], dtype=np.int64)
+        points = np.zeros((len(frames), frame_lengths.max(initial=0), 2))
+        for b, frame in enumerate(frames):
+            points[b, :len(frame)] = np.reshape(frame, (-1, 2))
+        if lengths is None and np.any(frame_lengths != points.shape[1]):
+            lengths = frame_lengths
+    return points, None if lengths is None else np.asarray(lengths, dtype=np.int64)
+
+
+def window_views(points: np.ndarray, offsets: tuple[int, ...]) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Create strided views of the x and y coordinates for every window of points with the given
+    offsets from the first point of the window. Window i consists of the points i + offset.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2).
+        offsets (tuple[int, ...]): Non-negative, increasing offsets of the points in a window.
+
+    Returns:
+        list[tuple[np.ndarray, np.ndarray]]: One (x, y) pair of views per offset.
+    """
+    count = max(points.shape[-2] - offsets[-1], 0)
+    return [(points[..., o:o + count, 0], points[..., o:o + count, 1]) for o in offsets]
+
+
+def window_mask(points: np.ndarray, offsets: tuple[int, ...], lengths: np.ndarray | None) -> np.ndarray | None:
+    """
+    Find the windows that lie completely inside their frame when the frames of a batch
+    have different lengths.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or a batch of shape (B, N, 2).
+        offsets (tuple[int, ...]): Offsets of the points in a window.
+        lengths (np.ndarray | None): Number of valid points of every frame, None if all are valid.
+
+    Returns:
+        np.ndarray | None: True for every window inside its frame, None if all windows are.
+    """
+    if lengths is None:
+        return None
+    count = max(points.shape[-2] - offsets[-1], 0)
+    return np.arange(count) + offsets[-1] < np.asarray(lengths)[..., np.newaxis]
+
+
+def num_points(points: np.ndarray, lengths: np.ndarray | None) -> int | np.ndarray:
+    """The number of points of the frame, or of every frame of a batch."""
+    return points.shape[-2] if lengths is None else np.asarray(lengths)
+
+
+def any_window(hits: np.ndarray, points: np.ndarray, offsets: tuple[int, ...],
+               lengths: np.ndarray | None) -> np.ndarray:
+    """Reduce per-window results to one result per frame, ignoring windows outside their frame."""
+    mask = window_mask(points, offsets, lengths)
+    if mask is not None:
+        hits = hits & mask
+    return hits.any(axis=-1)
+
+
+def as_result(value: np.ndarray) -> bool | np.ndarray:
+    """A plain bool for a single frame, a boolean array with one entry per frame for a batch."""
+    return bool(value) if np.ndim(value) == 0 else value
+
+
+def not_met(points: np.ndarray) -> bool | np.ndarray:
+    """The result of a LIC that is not met by any frame."""
+    return as_result(np.zeros(points.shape[:-2], dtype=bool))
+
+
+def _is_exact_product(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """True where a * b is representable, i.e. the product is computed without rounding."""
+    p = a * b
+    c = 134217729.0 * a
+    a_high = c - (c - a)
+    a_low = a - a_high
+    c = 134217729.0 * b
+    b_high = c - (c - b)
+    b_low = b - b_high
+    return ((a_high * b_high - p) + a_high * b_low + a_low * b_high) + a_low * b_low == 0
+
+
+def _is_exact_sum(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """True where a + b is representable, i.e. the sum is computed without rounding."""
+    s = a + b
+    b_virtual = s - a
+    return (a - (s - b_virtual)) + (b - b_virtual) == 0
+
+
+def exact_distances(points: np.ndarray, offsets: tuple[int, ...]) -> np.ndarray:
+    """
+    Find the windows where the squared distance between every two of its points is computed
+    without rounding. Those distances do not depend on the order of evaluation, so the vectorized
+    and the scalar engine are guaranteed to produce the same value for them.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2).
+        offsets (tuple[int, ...]): Offsets of the points in a window.
+
+    Returns:
+        np.ndarray: True for every window whose distances are exact.
+    """
+    views = window_views(points, offsets)
+    exact = True
+    for i in range(len(views)):
+        for j in range(i + 1, len(views)):
+            dx = views[i][0] - views[j][0]
+            dy = views[i][1] - views[j][1]
+            with np.errstate(over="ignore", invalid="ignore"):
+                exact = exact & _is_exact_product(dx, dx) & _is_exact_product(dy, dy)
+                exact = exact & _is_exact_sum(dx * dx, dy * dy)
+    return exact
+
+
+def refine_metric(metric: np.ndarray, thresholds: tuple[float, ...], points: np.ndarray, offsets: tuple[int, ...],
+                  scalar_metric: Callable, exact_by_distance: bool = False,
+                  lengths: np.ndarray | None = None) -> np.ndarray:
+    """
+    Recompute the values of metric that are within GUARD_BAND of any threshold with the
+    scalar function from lic.py, so that comparisons against the thresholds are exact.
+
+    Parameters:
+        metric (np.ndarray): Metric per window, modified in place.
+        thresholds (tuple[float, ...]): Thresholds the metric will be compared with.
+        points (np.ndarray): Points of shape (N, 2).
+        offsets (tuple[int, ...]): Offsets of the points in a window.
+        scalar_metric (Callable): Takes the points of one window as tuples and returns the metric,
+            or None if it is undefined.
+        exact_by_distance (bool): The metric only depends on the distances within the window, so
+            windows found by exact_distances do not have to be recomputed.
+        lengths (np.ndarray | None): Number of valid points of every frame, None if all are valid.
+
+    Returns:
+        np.ndarray: The refined metric.
+    """
+    near = np.zeros(metric.shape, dtype=bool)
+    for threshold in thresholds:
+        near |= np.abs(metric - threshold) < GUARD_BAND * abs(threshold)
+    mask = window_mask(points, offsets, lengths)
+    if mask is not None:
+        near &= mask
+    if exact_by_distance and near.any():
+        near &= ~exact_distances(points, offsets)
+
+    for index in zip(*np.nonzero(near)):
+        *batch, i = index
+        window = [tuple(float(v) for v in points[(*batch, i + o)]) for o in offsets]
+        value = scalar_metric(*window)
+        metric[index] = np.nan if value is None else value
+    return metric
+
+
+def pair_distances(points: np.ndarray, gap: int) -> np.ndarray:
+    """
+    Distances between all pairs of points separated by exactly gap intervening points.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2).
+        gap (int): Number of intervening points.
+
+    Returns:
+        np.ndarray: The distance for every pair.
+    """
+    (x1, y1), (x2, y2) = window_views(points, (0, gap + 1))
+    dx = x2 - x1
+    dy = y2 - y1
+    return np.sqrt(dx * dx + dy * dy)
+
+
+def triangle_areas(points: np.ndarray, gap_1: int, gap_2: int) -> np.ndarray:
+    """
+    Areas of all triangles formed by three points separated by gap_1 and gap_2 intervening points.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2).
+        gap_1 (int): Number of points between the first and second point.
+        gap_2 (int): Number of points between the second and third point.
+
+    Returns:
+        np.ndarray: The area for every triangle.
+    """
+    (x1, y1), (x2, y2), (x3, y3) = window_views(points, (0, gap_1 + 1, gap_1 + gap_2 + 2))
+    return (1/2) * np.abs(x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2))
+
+
+def minimum_radii(points: np.ndarray, gap_1: int, gap_2: int) -> np.ndarray:
+    """
+    Radius of the smallest circle containing each set of three points separated by gap_1 and gap_2
+    intervening points, as computed by minimum_radius in lic.py.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2).
+        gap_1 (int): Number of points between the first and second point.
+        gap_2 (int): Number of points between the second and third point.
+
+    Returns:
+        np.ndarray: The minimum radius for every set of three points.
+    """
+    (x1, y1), (x2, y2), (x3, y3) = window_views(points, (0, gap_1 + 1, gap_1 + gap_2 + 2))
+    a = np.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+    b = np.sqrt((x1 - x3) ** 2 + (y1 - y3) ** 2)
+    c = np.sqrt((x2 - x3) ** 2 + (y2 - y3) ** 2)
+
+    not_acute = (b*b + c*c - a*a) * (a*a + c*c - b*b) * (a*a + b*b - c*c) <= 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        circumradius = a * b * c / np.sqrt((a + b + c) * (b + c - a) * (a + c - b) * (a + b - c))
+    return np.where(not_acute, np.maximum(np.maximum(a, b), c) / 2, circumradius)
+
+
+def line_distances(points: np.ndarray, n_pts: int) -> np.ndarray:
+    """
+    Largest distance of the points of every run of n_pts consecutive points from the line joining
+    the first and last point of the run, or from the first point if they coincide, as in LIC 6.
+    All runs are evaluated at once for each position within the run. NaN distances are ignored.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2).
+        n_pts (int): Number of consecutive points.
+
+    Returns:
+        np.ndarray: The largest distance for every run, NaN if all of its distances are.
+    """
+    offsets = (0, n_pts - 1)
+    (x1, y1), (x2, y2) = window_views(points, offsets)
+    coincide = (x1 == x2) & (y1 == y2)
+    A = y2 - y1
+    B = x1 - x2
+    C = x2 * y1 - x1 * y2
+    norm = np.sqrt(A**2 + B**2)
+
+    largest = np.full(x1.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for j in range(n_pts):
+            x, y = window_views(points, (j, n_pts - 1))[0]
+            distance = np.where(coincide,
+                                np.sqrt((x - x1)**2 + (y - y1)**2),
+                                np.abs(A * x + B * y + C) / norm)
+            np.fmax(largest, distance, out=largest)
+    return largest
+
+
+def vertex_angles(points: np.ndarray, gap_1: int, gap_2: int) -> np.ndarray:
+    """
+    Angles at the second point of all sets of three points separated by gap_1 and gap_2
+    intervening points, as computed by calculate_angle in lic.py. The angle is NaN when any
+    two of the points coincide.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2).
+        gap_1 (int): Number of points between the first point and the vertex.
+        gap_2 (int): Number of points between the vertex and the third point.
+
+    Returns:
+        np.ndarray: The angle in radians for every set of three points.
+    """
+    (x1, y1), (x2, y2), (x3, y3) = window_views(points, (0, gap_1 + 1, gap_1 + gap_2 + 2))
+    v1x, v1y = x1 - x2, y1 - y2
+    v2x, v2y = x3 - x2, y3 - y2
+    dot_product = v1x * v2x + v1y * v2y
+    mag_v1 = np.sqrt(v1x ** 2 + v1y ** 2)
+    mag_v2 = np.sqrt(v2x ** 2 + v2y ** 2)
+    determinant = v1x * v2y - v1y * v2x
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_theta = np.clip(dot_product / (mag_v1 * mag_v2), -1, 1)
+    angle = np.where(determinant == 0, np.where(dot_product > 0, 0.0, math.pi), np.arccos(cos_theta))
+
+    coincide = ((x1 == x2) & (y1 == y2)) | ((x2 == x3) & (y2 == y3)) | ((x1 == x3) & (y1 == y3))
+    return np.where(coincide | (mag_v1 == 0) | (mag_v2 == 0), np.nan, angle)
+
+
+def quadrants(points: np.ndarray) -> np.ndarray:
+    """
+    Quadrant index (0 for I up to 3 for IV) of every point, with the priority I, II, III, IV
+    for points on an axis. Points that lie in no quadrant (NaN coordinates) get -1.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+
+    Returns:
+        np.ndarray: The quadrant of every point.
+    """
+    x, y = points[..., 0], points[..., 1]
+    return np.select([(x >= 0) & (y >= 0), (x <= 0) & (y >= 0), (x <= 0) & (y <= 0), (x >= 0) & (y <= 0)],
+                     [0, 1, 2, 3], default=-1)
+
+
+def quadrant_counts(points: np.ndarray, q_pts: int) -> np.ndarray:
+    """
+    The number of distinct quadrants of every run of Q_PTS consecutive points. The points of
+    each quadrant are counted with a cumulative sum, so every run takes constant time.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        q_pts (int): Number of consecutive points, at least 1.
+
+    Returns:
+        np.ndarray: The number of quadrants per run.
+    """
+    one_hot = quadrants(points)[..., np.newaxis] == np.arange(4)
+    counts = np.zeros(one_hot.shape[:-2] + (one_hot.shape[-2] + 1, 4), dtype=np.int64)
+    np.cumsum(one_hot, axis=-2, out=counts[..., 1:, :])
+    return np.count_nonzero(counts[..., q_pts:, :] - counts[..., :-q_pts, :], axis=-1)
+
+
+def x_differences(points: np.ndarray, gap: int) -> np.ndarray:
+    """
+    X[j] - X[i] for all pairs of points separated by exactly gap intervening points, i < j. A gap
+    below -1 pairs the points as lic.lic_11 does, every point i with the point i + gap + 1
+    counted from the end, which needs frames of the same length.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        gap (int): Number of intervening points.
+
+    Returns:
+        np.ndarray: The difference for every pair.
+    """
+    if gap >= -1:
+        (x_i, _), (x_j, _) = window_views(points, (0, gap + 1))
+        return x_j - x_i
+    x = points[..., 0]
+    count = min(x.shape[-1], -1 - gap)
+    return x[..., x.shape[-1] - count:] - x[..., :count]
+
+
+class GeometryContext:
+    """
+    Geometry of one frame, or one batch of frames, that is shared by all LICs of an evaluation.
+
+    Several LICs use the same metric on the same windows: LICs 7 and 12 both need the distances of
+    the pairs separated by K_PTS points, LICs 8 and 13 the minimum radii and LICs 10 and 14 the
+    areas of the triples separated by A_PTS/B_PTS and E_PTS/F_PTS points. Every metric array is
+    computed at most once and cached by the name of the metric and the gaps of the window.
+    Values that are refined by a LIC stay refined for the next LIC that reads them.
+    """
+
+    METRICS = {
+        "distance": pair_distances,
+        "area": triangle_areas,
+        "radius": minimum_radii,
+        "angle": vertex_angles,
+        "x_difference": x_differences,
+        # Keyed by N_PTS or Q_PTS, the number of points of a run, instead of gaps
+        "line_distance": line_distances,
+        "quadrant_count": quadrant_counts,
+    }
+
+    def __init__(self, points: np.ndarray, lengths: np.ndarray | None = None) -> None:
+        """
+        Parameters:
+            points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+            lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        """
+        self.points = points
+        self.lengths = lengths
+        self._metrics = {}
+
+    def metric(self, name: str, gaps: tuple[int, ...]) -> np.ndarray:
+        """
+        The metric for every window with the given gaps, computed on first use.
+
+        Parameters:
+            name (str): One of the keys of METRICS, e.g. "distance" or "angle".
+            gaps (tuple[int, ...]): Number of intervening points between consecutive points of a window.
+
+        Returns:
+            np.ndarray: The metric per window.
+        """
+        key = (name, gaps)
+        if key not in self._metrics:
+            self._metrics[key] = self.METRICS[name](self.points, *gaps)
+        return self._metrics[key]
+
+    def __len__(self) -> int:
+        """The number of metric arrays computed so far."""
+        return len(self._metrics)
+
+
+def _has_sharp_angle(geometry: GeometryContext, gap_1: int, gap_2: int, epsilon: float) -> np.ndarray:
+    """Shared part of LIC 2 and LIC 9: an angle outside [PI - EPSILON, PI + EPSILON] exists."""
+    lower, upper = math.pi - epsilon, math.pi + epsilon
+    offsets = (0, gap_1 + 1, gap_1 + gap_2 + 2)
+    angles = refine_metric(geometry.metric("angle", (gap_1, gap_2)), (lower, upper), geometry.points, offsets,
+                           calculate_angle, lengths=geometry.lengths)
+    return any_window((angles < lower) | (angles > upper), geometry.points, offsets, geometry.lengths)
+
+
+def _radii(geometry: GeometryContext, a_pts: int, b_pts: int, thresholds: tuple[float, ...]) -> np.ndarray:
+    """Minimum radii, exact around the given thresholds."""
+    return refine_metric(geometry.metric("radius", (a_pts, b_pts)), thresholds, geometry.points,
+                         (0, a_pts + 1, a_pts + b_pts + 2), lambda *corners: minimum_radius(corners),
+                         exact_by_distance=True, lengths=geometry.lengths)
+
+
+def _exceeds_radius(geometry: GeometryContext, a_pts: int, b_pts: int, radius: float) -> np.ndarray:
+    """Shared part of LIC 1 and LIC 8: a set of three points has a minimum radius above RADIUS1."""
+    limit = radius * REL_TOL
+    radii = _radii(geometry, a_pts, b_pts, (limit,))
+    return any_window(radii > limit, geometry.points, (0, a_pts + 1, a_pts + b_pts + 2), geometry.lengths)
+
+
+def lic_0(points: np.ndarray, length_1: float, lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 0: two consecutive data points are a distance greater than LENGTH1 apart.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        length_1 (float): Threshold distance.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    distances = refine_metric(geometry.metric("distance", (0,)), (length_1,), points, (0, 1), euclidean_distance,
+                              exact_by_distance=True, lengths=lengths)
+    return as_result(any_window(distances > length_1, points, (0, 1), lengths))
+
+
+def lic_1(points: np.ndarray, radius: float, lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 1: three consecutive data points cannot be contained within a circle of RADIUS1.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        radius (float): Radius of a circle.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    if radius < 0:
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    return as_result(_exceeds_radius(geometry, 0, 0, radius))
+
+
+def lic_2(points: np.ndarray, epsilon: float, lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 2: three consecutive data points form an angle < PI - EPSILON or > PI + EPSILON.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        epsilon (float): Deviation from PI.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    if epsilon < 0 or epsilon >= math.pi:
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    return as_result(_has_sharp_angle(geometry, 0, 0, epsilon))
+
+
+def lic_3(points: np.ndarray, area: float, lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 3: three consecutive data points form a triangle with area greater than AREA1.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        area (float): Threshold area.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    if area < 0:
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    return as_result(any_window(geometry.metric("area", (0, 0)) > area, points, (0, 1, 2), lengths))
+
+
+def lic_4(points: np.ndarray, q_pts: int, quads: int, lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 4: Q_PTS consecutive data points lie in more than QUADS quadrants.
+    The quadrants of every window are counted in constant time, see quadrant_counts.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        q_pts (int): Number of consecutive points.
+        quads (int): Number of quadrants.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    frame_ok = q_pts <= num_points(points, lengths)
+    if q_pts < 2 or quads < 1 or quads > 3 or not np.any(frame_ok):
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    hits = geometry.metric("quadrant_count", (q_pts,)) > quads
+    return as_result(any_window(hits, points, (0, q_pts - 1), lengths) & frame_ok)
+
+
+def lic_5(points: np.ndarray, lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 5: two consecutive data points with X[j] - X[i] < 0.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    return as_result(any_window(geometry.metric("x_difference", (0,)) < 0, points, (0, 1), lengths))
+
+
+def lic_6(points: np.ndarray, n_pts: int, dist: float, lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 6: one of N_PTS consecutive data points lies a distance greater than DIST from
+    the line joining the first and last of these points, or from the first point if they coincide.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        n_pts (int): Number of consecutive points.
+        dist (float): Minimum distance from line.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    frame_ok = num_points(points, lengths) >= 3
+    if dist < 0 or n_pts < 1 or not np.any(frame_ok):
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    hits = geometry.metric("line_distance", (n_pts,)) > dist
+    return as_result(any_window(hits, points, (0, n_pts - 1), lengths) & frame_ok)
+
+
+def lic_7(points: np.ndarray, k_pts: int, length_1: float, lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 7: two data points separated by K_PTS intervening points are more than
+    LENGTH1 apart.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        k_pts (int): Number of intervening points.
+        length_1 (float): Threshold distance.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    n = num_points(points, lengths)
+    frame_ok = (n >= 3) & (k_pts <= n - 2)
+    if k_pts < 1 or not np.any(frame_ok):
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    hits = geometry.metric("distance", (k_pts,)) > length_1
+    return as_result(any_window(hits, points, (0, k_pts + 1), lengths) & frame_ok)
+
+
+def lic_8(points: np.ndarray, radius: float, a_pts: int, b_pts: int,
+          lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 8: three data points separated by A_PTS and B_PTS intervening points cannot be
+    contained within a circle of RADIUS1.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        radius (float): Radius of a circle.
+        a_pts (int): Number of points between the first and second point.
+        b_pts (int): Number of points between the second and third point.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    frame_ok = num_points(points, lengths) >= a_pts + b_pts + 3
+    if radius < 0 or a_pts < 1 or b_pts < 1 or not np.any(frame_ok):
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    return as_result(_exceeds_radius(geometry, a_pts, b_pts, radius) & frame_ok)
+
+
+def lic_9(points: np.ndarray, c_pts: int, d_pts: int, epsilon: float,
+          lengths: np.ndarray | None = None,
+          geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 9: three data points separated by C_PTS and D_PTS intervening points form an
+    angle < PI - EPSILON or > PI + EPSILON.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        c_pts (int): Number of points between the first point and the vertex.
+        d_pts (int): Number of points between the vertex and the third point.
+        epsilon (float): Deviation from PI.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    n = num_points(points, lengths)
+    frame_ok = (c_pts + d_pts <= n - 3) & (n >= 5)
+    if c_pts < 1 or d_pts < 1 or not np.any(frame_ok):
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    return as_result(_has_sharp_angle(geometry, c_pts, d_pts, epsilon) & frame_ok)
+
+
+def lic_10(points: np.ndarray, e_pts: int, f_pts: int, area1: float,
+           lengths: np.ndarray | None = None,
+           geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 10: three data points separated by E_PTS and F_PTS intervening points form a
+    triangle with area greater than AREA1.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        e_pts (int): Number of points between the first and second point.
+        f_pts (int): Number of points between the second and third point.
+        area1 (float): Threshold area.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    n = num_points(points, lengths)
+    frame_ok = (n >= 5) & (e_pts + f_pts <= n - 3)
+    if area1 < 0 or e_pts < 1 or f_pts < 1 or not np.any(frame_ok):
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    hits = geometry.metric("area", (e_pts, f_pts)) > area1
+    return as_result(any_window(hits, points, (0, e_pts + 1, e_pts + f_pts + 2), lengths) & frame_ok)
+
+
+def lic_11(points: np.ndarray, g_pts: int, lengths: np.ndarray | None = None,
+           geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 11: two data points separated by G_PTS intervening points with X[j] - X[i] < 0.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        g_pts (int): Number of intervening points.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    n = num_points(points, lengths)
+    frame_ok = n >= 3
+    if not np.any(frame_ok):
+        return not_met(points)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    if g_pts >= -1:
+        hits = geometry.metric("x_difference", (g_pts,)) < 0
+        return as_result(any_window(hits, points, (0, 1 + g_pts), lengths) & frame_ok)
+    if lengths is None:
+        return as_result(np.any(geometry.metric("x_difference", (g_pts,)) < 0, axis=-1) & frame_ok)
+
+    # Same pairs as zip(points, points[1 + g_pts:]) when the offset counts from the end of the frame
+    x = points[..., 0]
+    first = np.maximum(np.asarray(n) + 1 + g_pts, 0)[..., np.newaxis]
+    i = np.arange(x.shape[-1])
+    j = np.minimum(first + i, x.shape[-1] - 1)
+    x_j = np.take_along_axis(x, np.broadcast_to(j, x.shape), axis=-1)
+    hits = (x_j - x < 0) & (first + i < np.asarray(n)[..., np.newaxis])
+    return as_result(hits.any(axis=-1) & frame_ok)
+
+
+def lic_12(points: np.ndarray, k_pts: int, length_1: float, length_2: float,
+           lengths: np.ndarray | None = None,
+           geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 12: two data points separated by K_PTS intervening points are more than LENGTH1
+    apart, and two such points are less than LENGTH2 apart.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        k_pts (int): Number of intervening points.
+        length_1 (float): Distance that one pair must exceed.
+        length_2 (float): Distance that one pair must be below.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    n = num_points(points, lengths)
+    frame_ok = (n >= 3) & (k_pts <= n - 2)
+    if k_pts < 1 or length_2 < 0 or not np.any(frame_ok):
+        return not_met(points)
+    offsets = (0, k_pts + 1)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    distances = geometry.metric("distance", (k_pts,))
+    return as_result(any_window(distances > length_1, points, offsets, lengths)
+                     & any_window(distances < length_2, points, offsets, lengths) & frame_ok)
+
+
+def lic_13(points: np.ndarray, radius1: float, radius2: float, a_pts: int, b_pts: int,
+           lengths: np.ndarray | None = None,
+           geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 13: three data points separated by A_PTS and B_PTS intervening points cannot be
+    contained within a circle of RADIUS1, and three such points can be contained within RADIUS2.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        radius1 (float): Radius that one set must not fit in.
+        radius2 (float): Radius that one set must fit in.
+        a_pts (int): Number of points between the first and second point.
+        b_pts (int): Number of points between the second and third point.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    frame_ok = num_points(points, lengths) >= a_pts + b_pts + 3
+    if radius1 < 0 or radius2 < 0 or a_pts < 1 or b_pts < 1 or not np.any(frame_ok):
+        return not_met(points)
+    offsets = (0, a_pts + 1, a_pts + b_pts + 2)
+    limit_1, limit_2 = radius1 * REL_TOL, radius2 * REL_TOL
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    radii = _radii(geometry, a_pts, b_pts, (limit_1, limit_2))
+    return as_result(any_window(radii > limit_1, points, offsets, lengths)
+                     & any_window(radii <= limit_2, points, offsets, lengths) & frame_ok)
+
+
+def lic_14(points: np.ndarray, e_pts: int, f_pts: int, area1: float, area2: float,
+           lengths: np.ndarray | None = None,
+           geometry: GeometryContext | None = None) -> bool | np.ndarray:
+    """
+    Vectorized LIC 14: three data points separated by E_PTS and F_PTS intervening points form a
+    triangle with area greater than AREA1, and three such points form one with area less than AREA2.
+
+    Parameters:
+        points (np.ndarray): Points of shape (N, 2) or (B, N, 2).
+        e_pts (int): Number of points between the first and second point.
+        f_pts (int): Number of points between the second and third point.
+        area1 (float): Area that one triangle must exceed.
+        area2 (float): Area that one triangle must be below.
+        lengths (np.ndarray | None): Number of valid points of every frame of a padded batch.
+        geometry (GeometryContext | None): Geometry shared with the other LICs of the evaluation.
+
+    Returns:
+        bool | np.ndarray: True if the condition is met, False otherwise.
+    """
+    n = num_points(points, lengths)
+    frame_ok = (n >= 5) & (e_pts + f_pts <= n - 3)
+    if e_pts < 1 or f_pts < 1 or area2 < 0 or area1 < 0 or not np.any(frame_ok):
+        return not_met(points)
+    offsets = (0, e_pts + 1, e_pts + f_pts + 2)
+    if geometry is None:
+        geometry = GeometryContext(points, lengths)
+    areas = geometry.metric("area", (e_pts, f_pts))
+    return as_result(any_window(areas > area1, points, offsets, lengths)
+                     & any_window(areas < area2, points, offsets, lengths) & frame_ok)
+
+
+def metric_extremes(metric: np.ndarray) -> tuple[float, float] | None:
+    """
+    The smallest and largest value of a metric of a single frame, NaN values excluded.
+
+    Parameters:
+        metric (np.ndarray): Metric per window.
+
+    Returns:
+        tuple[float, float] | None: The extremes, None if there is no window with a value.
+    """
+    metric = metric[~np.isnan(metric)]
+    return (float(metric.min()), float(metric.max())) if metric.size else None
+
+
+# The scalar helper of every metric that is refined around thresholds, and whether it only depends on distances
+SCALAR_METRICS = {
+    "distance": (euclidean_distance, True),
+    "radius": (lambda *corners: minimum_radius(corners), True),
+    "angle": (calculate_angle, False),
+}
+
+
+def metric_passes(geometry: GeometryContext, name: str, gaps: tuple[int, ...], test: str, threshold: float) -> bool:
+    """
+    Whether some window of a single frame passes a test against a threshold. Only when the deciding
+    extreme is within GUARD_BAND of the threshold is the metric refined with the scalar helper.
+
+    Parameters:
+        geometry (GeometryContext): The geometry of the frame.
+        name (str): The name of the metric.
+        gaps (tuple[int, ...]): The gaps of the windows.
+        test (str): ">" if some window must be above the threshold, "<" or "<=" if below.
+        threshold (float): The threshold.
+
+    Returns:
+        bool: True if some window passes the test.
+    """
+    metric = geometry.metric(name, gaps)
+    extremes = metric_extremes(metric)
+    if extremes is None:
+        return False
+    value = extremes[1] if test == ">" else extremes[0]
+    if name in SCALAR_METRICS and abs(value - threshold) < GUARD_BAND * abs(threshold):
+        scalar_metric, exact_by_distance = SCALAR_METRICS[name]
+        offsets = tuple(itertools.accumulate((0, *(gap + 1 for gap in gaps))))
+        extremes = metric_extremes(refine_metric(metric, (threshold,), geometry.points, offsets, scalar_metric,
+                                                 exact_by_distance))
+        if extremes is None:
+            return False
+        value = extremes[1] if test == ">" else extremes[0]
+    if test == ">":
+        return value > threshold
+    return value < threshold if test == "<" else value <= threshold
@@ -0,0 +1,140 @@
+"""
+Parallel DECIDE over many radar frames with a pool of worker processes.
+
+Every worker builds its own Decider once, in the pool initializer, so the parameters, LCM
+and PUV are sent once per worker and not with every task. The frames are sent in chunks and
+only a bounded number of chunks is in flight at a time, so an iterable of frames that does
+not fit in memory, e.g. a whole day of recordings, can be streamed through the pool.
+"""
+
+import itertools
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from decider import Decider
+from parameters import PARAMETERS_T
+
+# The Decider of a worker process, created by _init_worker
+_decider: Decider | None = None
+
+
+def _init_worker(parameters: PARAMETERS_T, LCM: list[list[str]], PUV: list[bool]) -> None:
+    """Create the Decider of the worker process."""
+    global _decider
+    _decider = Decider(parameters, LCM, PUV)
+
+
+def _decide_frames(frames: list[list[tuple[float, float]]]) -> list[bool]:
+    """Decide every frame with the Decider of the worker process."""
+    return [_decider.decide(points) for points in frames]
+
+
+def _decide_chunk(start: int, frames: list[list[tuple[float, float]]]) -> tuple[int, list[bool]]:
+    """Decide every frame of a chunk, start is the index of the first frame."""
+    return start, _decide_frames(frames)
+
+
+class ParallelDecider:
+    """
+    A pool of worker processes that decide radar frames with the same parameters, LCM and PUV.
+
+    Use it as a context manager, or call shutdown when done:
+
+        with ParallelDecider(parameters, LCM, PUV, workers=8) as pool:
+            launches = pool.decide_all(frames)
+    """
+
+    def __init__(self, parameters: PARAMETERS_T, LCM: list[list[str]], PUV: list[bool],
+                 workers: int | None = None, chunk_size: int = 256) -> None:
+        """
+        Parameters:
+            parameters (PARAMETERS_T): The parameters for the LICs.
+            LCM (list[list[str]]): Logical Connector Matrix.
+            PUV (list[bool]): Preliminary Unlocking Vector.
+            workers (int | None): Number of worker processes, the number of CPUs if None.
+            chunk_size (int): Number of frames sent to a worker at a time.
+
+        Raises:
+            ValueError: If the configuration is invalid or chunk_size is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+        # Validate here so that an invalid configuration fails before any worker starts
+        Decider(parameters, LCM, PUV)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                             initargs=(parameters, LCM, PUV))
+
+    def __enter__(self) -> "ParallelDecider":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown()
+
+    def submit(self, frames: list[list[tuple[float, float]]]) -> Future:
+        """
+        Decide a few frames in one worker, e.g. those of one request to a service.
+
+        Parameters:
+            frames (list[list[tuple[float, float]]]): The radar frames.
+
+        Returns:
+            Future: A future of the list of launch decisions.
+        """
+        return self._executor.submit(_decide_frames, frames)
+
+    def _chunks(self, frames: Iterable[list[tuple[float, float]]]) -> Iterator[tuple[int, list]]:
+        """Split the frames into chunks of chunk_size frames, with the index of their first frame."""
+        frames = iter(frames)
+        start = 0
+        while chunk := list(itertools.islice(frames, self.chunk_size)):
+            yield start, chunk
+            start += len(chunk)
+
+    def imap(self, frames: Iterable[list[tuple[float, float]]], ordered: bool = True) -> Iterator[tuple[int, bool]]:
+        """
+        Decide the frames and yield the results as they become available.
+
+        Parameters:
+            frames (Iterable[list[tuple[float, float]]]): The radar frames, read lazily.
+            ordered (bool): Yield the results in input order. Otherwise every chunk is yielded as
+                soon as it is done, which keeps all workers busy when chunks take different times.
+
+        Returns:
+            Iterator[tuple[int, bool]]: The index of every frame and its launch decision.
+        """
+        max_pending = 2 * self.workers
+        chunks = (self._executor.submit(_decide_chunk, start, chunk) for start, chunk in self._chunks(frames))
+        pending = deque(itertools.islice(chunks, max_pending))
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+            pending.extend(itertools.islice(chunks, len(done)))
+
+            for future in done:
+                start, launches = future.result()
+                yield from enumerate(launches, start)
+
+    def decide_all(self, frames: Iterable[list[tuple[float, float]]]) -> list[bool]:
+        """
+        Decide all frames.
+
+        Parameters:
+            frames (Iterable[list[tuple[float, float]]]): The radar frames.
+
+        Returns:
+            list[bool]: The launch decisions in input order.
+        """
+        return [launch for _, launch in self.imap(frames)]
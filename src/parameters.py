@@ -1,6 +1,10 @@
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 
-@dataclass
+from lic import REL_TOL
+
+@dataclass(frozen=True, slots=True)
 class PARAMETERS_T:
     length_1: float = 1.0
     radius_1: float = 1.0
@@ -21,3 +25,119 @@ class PARAMETERS_T:
     length_2: float = 1.0
     radius_2: float = 1.0
     area_2: float = 1.0
+
+
+# The fields of PARAMETERS_T that every LIC takes after the points, in order
+LIC_PARAMETERS = [
+    ("length_1",),
+    ("radius_1",),
+    ("epsilon",),
+    ("area_1",),
+    ("q_pts", "quads"),
+    (),
+    ("n_pts", "dist"),
+    ("k_pts", "length_1"),
+    ("radius_1", "a_pts", "b_pts"),
+    ("c_pts", "d_pts", "epsilon"),
+    ("e_pts", "f_pts", "area_1"),
+    ("g_pts",),
+    ("k_pts", "length_1", "length_2"),
+    ("radius_1", "radius_2", "a_pts", "b_pts"),
+    ("e_pts", "f_pts", "area_1", "area_2"),
+]
+
+
+def validate_parameters(parameters: PARAMETERS_T) -> None:
+    """
+    Check the ranges of the parameters that do not depend on the number of points, as listed in
+    the README. The bounds that do depend on it, such as q_pts <= NUMPOINTS, are checked by the
+    LICs since they make a LIC not met rather than invalid.
+
+    Parameters:
+        parameters (PARAMETERS_T): The parameters for the LICs.
+
+    Raises:
+        ValueError: If a parameter is out of its range.
+    """
+    p = parameters
+    for name in ("length_1", "radius_1", "area_1", "dist", "length_2", "radius_2", "area_2"):
+        if not getattr(p, name) >= 0:
+            raise ValueError(f"{name} must be at least 0, not {getattr(p, name)}")
+    for name in ("k_pts", "a_pts", "b_pts", "c_pts", "d_pts", "e_pts", "f_pts", "g_pts"):
+        if getattr(p, name) < 1:
+            raise ValueError(f"{name} must be at least 1, not {getattr(p, name)}")
+    if not 0 <= p.epsilon < math.pi:
+        raise ValueError(f"epsilon must be in [0, pi), not {p.epsilon}")
+    if p.q_pts < 2:
+        raise ValueError(f"q_pts must be at least 2, not {p.q_pts}")
+    if not 1 <= p.quads <= 3:
+        raise ValueError(f"quads must be in [1, 3], not {p.quads}")
+    if p.n_pts < 3:
+        raise ValueError(f"n_pts must be at least 3, not {p.n_pts}")
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledParameters:
+    """
+    PARAMETERS_T together with the thresholds the LICs derive from it, computed once.
+
+    Attributes:
+        parameters (PARAMETERS_T): The parameters.
+        radius_1_limit (float): RADIUS1 * REL_TOL, which a minimum radius must exceed (LICs 1, 8, 13).
+        radius_2_limit (float): RADIUS2 * REL_TOL, which a minimum radius must not exceed (LIC 13).
+        angle_lower (float): PI - EPSILON, an angle below it is sharp (LICs 2 and 9).
+        angle_upper (float): PI + EPSILON, an angle above it is sharp (LICs 2 and 9).
+        arguments (tuple[tuple, ...]): The arguments of every LIC after the points, the values of
+            the fields in LIC_PARAMETERS.
+        offsets (tuple[tuple[int, ...], ...]): The offsets of the points of one window of every LIC
+            from its first point, e.g. (0, A_PTS + 1, A_PTS + B_PTS + 2) for LIC 8, and the first
+            and last point of a run for LICs 4 and 6. For LIC 11 a negative offset counts from the
+            end of the track.
+        spans (tuple[int, ...]): The number of consecutive points one window of every LIC covers,
+            2 for LIC 11 with a negative G_PTS.
+    """
+
+    parameters: PARAMETERS_T
+    radius_1_limit: float
+    radius_2_limit: float
+    angle_lower: float
+    angle_upper: float
+    arguments: tuple[tuple, ...]
+    offsets: tuple[tuple[int, ...], ...]
+    spans: tuple[int, ...]
+
+
+def _window_offsets(p: PARAMETERS_T) -> tuple[tuple[int, ...], ...]:
+    """The offsets of the points of one window of every LIC, see CompiledParameters."""
+    pair, triple = (0, 1), (0, 1, 2)
+    k, ab = (0, p.k_pts + 1), (0, p.a_pts + 1, p.a_pts + p.b_pts + 2)
+    ef = (0, p.e_pts + 1, p.e_pts + p.f_pts + 2)
+    return (pair, triple, triple, triple, (0, p.q_pts - 1), pair, (0, p.n_pts - 1), k, ab,
+            (0, p.c_pts + 1, p.c_pts + p.d_pts + 2), ef, (0, p.g_pts + 1), k, ab, ef)
+
+
+@lru_cache(maxsize=64)
+def compile_parameters(parameters: PARAMETERS_T, validate: bool = True) -> CompiledParameters:
+    """
+    Validate the parameters once and derive the thresholds, arguments and window offsets of the
+    LICs. The result is cached, since PARAMETERS_T is immutable and hashable.
+
+    Parameters:
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        validate (bool): Check the parameters with validate_parameters.
+
+    Returns:
+        CompiledParameters: The parameters and the values derived from them.
+
+    Raises:
+        ValueError: If validate is True and a parameter is out of its range.
+    """
+    if validate:
+        validate_parameters(parameters)
+    p = parameters
+    arguments = tuple(tuple(getattr(p, name) for name in names) for names in LIC_PARAMETERS)
+    offsets = _window_offsets(p)
+    # A negative G_PTS pairs points that are not consecutive, taken as a span of 2
+    spans = tuple(max(offset[-1] + 1, 2) if i == 11 else offset[-1] + 1 for i, offset in enumerate(offsets))
+    return CompiledParameters(p, p.radius_1 * REL_TOL, p.radius_2 * REL_TOL, math.pi - p.epsilon, math.pi + p.epsilon,
+                              arguments, offsets, spans)
@@ -0,0 +1,280 @@
+"""
+The launch policy, i.e. the LCM and PUV, compiled to bitmasks.
+
+A CMV is packed into a 15-bit integer where bit i is CMV[i]. For an active row i of the PUM
+(PUV[i] is True) every ANDD element needs CMV[i] and CMV[j], and every ORR element needs
+CMV[i] or CMV[j]. So if CMV[i] is True the row holds when all ANDD columns are set, and if it
+is False the row holds when there is no ANDD column and all ORR columns are set. Both cases
+become one mask test, (bits & mask) == mask, and the launch decision a handful of integer
+operations instead of building the 15x15 PUM.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from lazy import is_numpy_instance
+
+# NumPy is imported by the batch functions, a single decision does not need it
+TYPE_CHECKING = False  # as in decision_logic, without importing typing
+if TYPE_CHECKING:
+    import numpy as np
+
+ANDD, ORR, NOTUSED = "ANDD", "ORR", "NOTUSED"
+
+# Number of different packed CMVs
+NUM_CMVS = 1 << 15
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """
+    Per-row masks of the active PUM rows.
+
+    Attributes:
+        rows (tuple[int, ...]): The indices of the rows with PUV[i] True.
+        masks_if_set (tuple[int, ...]): The bits row i needs when CMV[i] is True.
+        masks_if_clear (tuple[int, ...]): The bits row i needs when CMV[i] is False. It contains
+            bit i itself when the row has an ANDD element, so that the row can never hold.
+    """
+    rows: tuple[int, ...]
+    masks_if_set: tuple[int, ...]
+    masks_if_clear: tuple[int, ...]
+
+
+def validate_policy(LCM: list[list[str]], PUV: list[bool]) -> None:
+    """
+    Check that the LCM is a symmetric 15x15 matrix of ANDD, ORR and NOTUSED and that the PUV
+    has 15 booleans. Because of the symmetry only the upper triangle is checked for valid
+    operators, the lower triangle is compared with it.
+
+    Parameters:
+        LCM (list[list[str]]): Logical Connector Matrix.
+        PUV (list[bool]): Preliminary Unlocking Vector.
+
+    Raises:
+        ValueError: If the LCM or PUV is invalid.
+    """
+    if len(PUV) != 15 or any(not isinstance(value, bool) and not is_numpy_instance(value, "bool_") for value in PUV):
+        raise ValueError("PUV must contain 15 booleans")
+    if len(LCM) != 15 or any(len(row) != 15 for row in LCM):
+        raise ValueError("LCM must be a 15x15 matrix")
+    for i in range(15):
+        for j in range(i, 15):
+            if LCM[i][j] not in (ANDD, ORR, NOTUSED):
+                raise ValueError(f"LCM[{i}][{j}] must be ANDD, ORR or NOTUSED, not {LCM[i][j]!r}")
+            if LCM[j][i] != LCM[i][j]:
+                raise ValueError(f"LCM must be symmetric, LCM[{i}][{j}] != LCM[{j}][{i}]")
+
+
+def compile_policy(LCM: list[list[str]], PUV: list[bool], validate: bool = True) -> CompiledPolicy:
+    """
+    Compile the LCM and PUV to the row masks of a CompiledPolicy.
+
+    Parameters:
+        LCM (list[list[str]]): Logical Connector Matrix.
+        PUV (list[bool]): Preliminary Unlocking Vector.
+        validate (bool): Check the LCM and PUV with validate_policy first.
+
+    Returns:
+        CompiledPolicy: The compiled policy.
+    """
+    if validate:
+        validate_policy(LCM, PUV)
+    rows, masks_if_set, masks_if_clear = [], [], []
+    for i in range(len(PUV)):
+        if not PUV[i]:
+            continue
+        and_mask = sum(1 << j for j in range(len(PUV)) if j != i and LCM[i][j] == ANDD)
+        or_mask = sum(1 << j for j in range(len(PUV)) if j != i and LCM[i][j] == ORR)
+        rows.append(i)
+        masks_if_set.append(and_mask)
+        masks_if_clear.append(or_mask | (1 << i) if and_mask else or_mask)
+    return CompiledPolicy(tuple(rows), tuple(masks_if_set), tuple(masks_if_clear))
+
+
+def pack_CMV(CMV: list[bool | None]) -> int:
+    """
+    Pack a CMV into an integer where bit i is CMV[i]. Entries that were not calculated (None)
+    become 0.
+
+    Parameters:
+        CMV (list[bool | None]): The Conditions Met Vector.
+
+    Returns:
+        int: The CMV as a 15-bit integer.
+    """
+    bits = 0
+    for i, met in enumerate(CMV):
+        if met:
+            bits |= 1 << i
+    return bits
+
+
+def pack_CMV_batch(CMV: np.ndarray) -> np.ndarray:
+    """
+    Pack every row of a (B, 15) CMV matrix into a 15-bit integer, see pack_CMV.
+
+    Parameters:
+        CMV (np.ndarray): A (B, 15) boolean matrix with one CMV per row.
+
+    Returns:
+        np.ndarray: A (B,) uint16 array.
+    """
+    import numpy as np
+    weights = np.left_shift(np.uint16(1), np.arange(CMV.shape[-1], dtype=np.uint16))
+    return np.bitwise_or.reduce(np.where(CMV, weights, np.uint16(0)), axis=-1)
+
+
+def Calculate_FUV_bits(policy: CompiledPolicy, bits: int) -> int:
+    """
+    The Final Unlocking Vector (FUV) of a packed CMV as an integer where bit i is FUV[i].
+
+    Parameters:
+        policy (CompiledPolicy): The compiled LCM and PUV.
+        bits (int): The CMV packed by pack_CMV.
+
+    Returns:
+        int: The FUV as a 15-bit integer.
+    """
+    FUV = 0x7FFF
+    for i, mask_if_set, mask_if_clear in zip(policy.rows, policy.masks_if_set, policy.masks_if_clear):
+        mask = mask_if_set if bits >> i & 1 else mask_if_clear
+        if bits & mask != mask:
+            FUV &= ~(1 << i)
+    return FUV
+
+
+def Calculate_Launch_bits(policy: CompiledPolicy, bits: int) -> bool:
+    """
+    The launch decision for a packed CMV, stopping at the first active row that does not hold.
+
+    Parameters:
+        policy (CompiledPolicy): The compiled LCM and PUV.
+        bits (int): The CMV packed by pack_CMV.
+
+    Returns:
+        bool: A decision for or against launch
+    """
+    for i, mask_if_set, mask_if_clear in zip(policy.rows, policy.masks_if_set, policy.masks_if_clear):
+        mask = mask_if_set if bits >> i & 1 else mask_if_clear
+        if bits & mask != mask:
+            return False
+    return True
+
+
+def Calculate_Launch_bits_batch(policy: CompiledPolicy, bits: np.ndarray) -> np.ndarray:
+    """
+    The launch decision for every packed CMV of a batch.
+
+    Parameters:
+        policy (CompiledPolicy): The compiled LCM and PUV.
+        bits (np.ndarray): A (B,) integer array of CMVs packed by pack_CMV_batch.
+
+    Returns:
+        np.ndarray: A (B,) boolean array, True for the frames that launch.
+    """
+    import numpy as np
+    bits = np.asarray(bits, dtype=np.int64)[..., np.newaxis]
+    rows = np.array(policy.rows, dtype=np.int64)
+    masks = np.where(bits >> rows & 1, np.array(policy.masks_if_set, dtype=np.int64),
+                     np.array(policy.masks_if_clear, dtype=np.int64))
+    return np.all(bits & masks == masks, axis=-1)
+
+
+@lru_cache(maxsize=16)
+def launch_table(policy: CompiledPolicy) -> np.ndarray:
+    """
+    The launch decision for every one of the 2^15 packed CMVs, so that a decision is one
+    indexed load, table[bits] for a single CMV or table[bits_array] for a batch. The table is
+    built with one vectorized pass over all CMVs and the last tables are cached, so switching
+    back to a recent LCM and PUV does not build it again.
+
+    Parameters:
+        policy (CompiledPolicy): The compiled LCM and PUV.
+
+    Returns:
+        np.ndarray: A read-only (32768,) boolean array indexed by the packed CMV.
+    """
+    import numpy as np
+    table = Calculate_Launch_bits_batch(policy, np.arange(NUM_CMVS))
+    table.flags.writeable = False
+    return table
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledPolicies:
+    """
+    The row masks of several compiled policies stacked into arrays, so that all policies are
+    applied to a CMV, or a batch of CMVs, in one array operation. Every policy has all 15 rows;
+    the rows with PUV[i] False have empty masks, which always hold.
+
+    Attributes:
+        masks_if_set (np.ndarray): A (P, 15) array, the bits row i of policy p needs when CMV[i] is True.
+        masks_if_clear (np.ndarray): A (P, 15) array, the bits row i of policy p needs when CMV[i] is False.
+        required (tuple[bool, ...]): The LICs that can affect the decision of any of the policies.
+    """
+    masks_if_set: np.ndarray
+    masks_if_clear: np.ndarray
+    required: tuple[bool, ...]
+
+    def __len__(self) -> int:
+        return len(self.masks_if_set)
+
+
+def compile_policies(policies: Iterable[tuple[list[list[str]], list[bool]] | CompiledPolicy],
+                     validate: bool = True) -> CompiledPolicies:
+    """
+    Compile several LCMs and PUVs, e.g. candidate policies of an A/B evaluation, into one
+    CompiledPolicies.
+
+    Parameters:
+        policies (Iterable[tuple[list[list[str]], list[bool]] | CompiledPolicy]): The (LCM, PUV) of
+            every policy, or policies already compiled by compile_policy.
+        validate (bool): Check every LCM and PUV with validate_policy first.
+
+    Returns:
+        CompiledPolicies: The stacked policies, in the order given.
+
+    Raises:
+        ValueError: If an LCM or PUV is invalid.
+    """
+    import numpy as np
+    policies = [policy if isinstance(policy, CompiledPolicy) else compile_policy(*policy, validate=validate)
+                for policy in policies]
+    masks_if_set = np.zeros((len(policies), 15), dtype=np.uint16)
+    masks_if_clear = np.zeros((len(policies), 15), dtype=np.uint16)
+    required = 0
+    for p, policy in enumerate(policies):
+        rows = list(policy.rows)
+        masks_if_set[p, rows] = policy.masks_if_set
+        masks_if_clear[p, rows] = policy.masks_if_clear
+        for i, mask_if_set, mask_if_clear in zip(policy.rows, policy.masks_if_set, policy.masks_if_clear):
+            # A row with no ANDD or ORR element holds for every CMV
+            if mask_if_set | mask_if_clear:
+                required |= mask_if_set | mask_if_clear | 1 << i
+    for masks in (masks_if_set, masks_if_clear):
+        masks.flags.writeable = False
+    return CompiledPolicies(masks_if_set, masks_if_clear, tuple(bool(required >> i & 1) for i in range(15)))
+
+
+def Calculate_Launch_policies(policies: CompiledPolicies, bits: int | np.ndarray) -> np.ndarray:
+    """
+    The launch decision of every policy for a packed CMV or a batch of packed CMVs, with one
+    mask test per row of every policy and without a launch table per policy.
+
+    Parameters:
+        policies (CompiledPolicies): The compiled policies.
+        bits (int | np.ndarray): A CMV packed by pack_CMV, or a (B,) array packed by pack_CMV_batch.
+
+    Returns:
+        np.ndarray: A (P,) boolean array for one CMV, or a (B, P) array for a batch, True where
+            policy p launches for CMV b.
+    """
+    import numpy as np
+    bits = np.asarray(bits, dtype=np.uint16)[..., np.newaxis, np.newaxis]
+    is_set = (bits >> np.arange(15, dtype=np.uint16) & 1).astype(bool)
+    masks = np.where(is_set, policies.masks_if_set, policies.masks_if_clear)
+    return np.all(bits & masks == masks, axis=-1)
@@ -0,0 +1,196 @@
+"""
+Decide scenario files with millions of frames, read and decided in batches of constant size.
+
+A scenario is one radar frame, decided with the parameters, LCM and PUV of one configuration.
+The input is never read as a whole: the frames are parsed lazily, grouped into batches that are
+decided together with the vectorized LICs (Decider.decide_batch), and the decisions of a batch
+are written to the output in one call. Run it with
+
+    python src/decide.py batch scenarios.jsonl --config config.json --output decisions.txt
+    python src/decide.py batch - --format csv < scenarios.csv
+
+The input formats are
+
+    jsonl   one frame per line, either {"points": [[x, y], ...]} or a list [[x, y], ...]
+    csv     one frame per line, x0,y0,x1,y1,... (an empty line is a frame without points)
+    binary  for every frame a little-endian uint32 N, then N little-endian float64 pairs x, y
+
+and the output has one line per frame, YES or NO, or with details a JSON object
+{"launch": true, "CMV": [...], "FUV": [...]} in which the LICs that cannot affect the decision
+are false in the CMV.
+"""
+
+import contextlib
+import csv
+import itertools
+import json
+import os
+import struct
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO, TextIO
+
+import numpy as np
+
+from decider import Decider
+from policy import Calculate_FUV_bits, launch_table, pack_CMV_batch
+
+FORMATS = ("jsonl", "csv", "binary")
+
+# Frames decided together, enough for the vectorized LICs to amortize their overhead
+BATCH_SIZE = 1024
+
+# The header of a frame of the binary format, its number of points
+_FRAME_HEADER = struct.Struct("<I")
+
+
+def format_of(path: str) -> str:
+    """
+    The format of a scenario file from its extension: .jsonl or .json, .csv, and binary otherwise.
+
+    Parameters:
+        path (str): The path of the file, "-" for the standard input, which is read as JSONL.
+
+    Returns:
+        str: One of FORMATS.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if path == "-" or extension in (".jsonl", ".json"):
+        return "jsonl"
+    return "csv" if extension == ".csv" else "binary"
+
+
+def read_jsonl(file: TextIO) -> Iterator[np.ndarray]:
+    """The frames of a JSONL scenario file as (N, 2) arrays, skipping empty lines."""
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        scenario = json.loads(line)
+        if isinstance(scenario, dict):
+            scenario = scenario["points"]
+        try:
+            yield np.array(scenario, dtype=np.float64).reshape(-1, 2)
+        except ValueError:
+            raise ValueError(f"line {line_number} is not a list of points [x, y]") from None
+
+
+def read_csv(file: TextIO) -> Iterator[np.ndarray]:
+    """The frames of a CSV scenario file as (N, 2) arrays, an empty line is a frame without points."""
+    for line_number, row in enumerate(csv.reader(file), 1):
+        if len(row) % 2:
+            raise ValueError(f"line {line_number} has an odd number of coordinates")
+        try:
+            yield np.array(row, dtype=np.float64).reshape(-1, 2)
+        except ValueError:
+            raise ValueError(f"line {line_number} is not a list of numbers x0,y0,x1,y1,...") from None
+
+
+def read_binary(file: BinaryIO) -> Iterator[np.ndarray]:
+    """The frames of a binary scenario file as (N, 2) arrays."""
+    while header := file.read(_FRAME_HEADER.size):
+        if len(header) < _FRAME_HEADER.size:
+            raise ValueError("the scenario file ends inside the header of a frame")
+        (num_points,) = _FRAME_HEADER.unpack(header)
+        body = file.read(16 * num_points)
+        if len(body) < 16 * num_points:
+            raise ValueError("the scenario file ends inside a frame")
+        yield np.frombuffer(body, dtype="<f8").astype(np.float64).reshape(-1, 2)
+
+
+def write_binary(frames: Iterable[list[tuple[float, float]] | np.ndarray], file: BinaryIO) -> int:
+    """
+    Write frames in the binary scenario format.
+
+    Parameters:
+        frames (Iterable[list[tuple[float, float]] | np.ndarray]): The frames.
+        file (BinaryIO): A file opened for writing bytes.
+
+    Returns:
+        int: The number of frames written.
+    """
+    count = 0
+    for frame in frames:
+        points = np.asarray(frame, dtype="<f8").reshape(-1, 2)
+        file.write(_FRAME_HEADER.pack(len(points)))
+        file.write(points.tobytes())
+        count += 1
+    return count
+
+
+def _unpack(bits: int) -> list[bool]:
+    """The 15 booleans packed into bits by pack_CMV."""
+    return [bool(bits >> i & 1) for i in range(15)]
+
+
+def decide_scenarios(frames: Iterable[np.ndarray], decider: Decider, output: TextIO, batch_size: int = BATCH_SIZE,
+                     details: bool = False) -> int:
+    """
+    Decide a stream of frames batch by batch and write one line per frame, see the module
+    documentation for the output. Only one batch of frames is held in memory at a time.
+
+    Parameters:
+        frames (Iterable[np.ndarray]): The frames, e.g. from read_jsonl, read_csv or read_binary.
+        decider (Decider): The configuration to decide the frames with.
+        output (TextIO): The file the decisions are written to.
+        batch_size (int): Number of frames decided together.
+        details (bool): Write the CMV and FUV of every frame with its decision as a JSON object.
+
+    Returns:
+        int: The number of frames decided.
+
+    Raises:
+        ValueError: If batch_size is less than 1.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, not {batch_size}")
+    table = launch_table(decider.policy)
+    frames = iter(frames)
+    count = 0
+    while batch := list(itertools.islice(frames, batch_size)):
+        bits = pack_CMV_batch(decider.calculate_CMV_batch(batch))
+        if details:
+            lines = [json.dumps({"launch": bool(table[b]), "CMV": _unpack(b),
+                                 "FUV": _unpack(Calculate_FUV_bits(decider.policy, b))})
+                     for b in bits.tolist()]
+        else:
+            lines = np.where(table[bits], "YES", "NO").tolist()
+        lines.append("")
+        output.write("\n".join(lines))
+        count += len(batch)
+    return count
+
+
+def decide_file(path: str, decider: Decider, output: TextIO, scenario_format: str | None = None,
+                batch_size: int = BATCH_SIZE, details: bool = False) -> tuple[int, float]:
+    """
+    Decide every frame of a scenario file with decide_scenarios.
+
+    Parameters:
+        path (str): The scenario file, "-" for the standard input.
+        decider (Decider): The configuration to decide the frames with.
+        output (TextIO): The file the decisions are written to.
+        scenario_format (str | None): One of FORMATS, from the extension of path if None.
+        batch_size (int): Number of frames decided together.
+        details (bool): Write the CMV and FUV of every frame with its decision.
+
+    Returns:
+        tuple[int, float]: The number of frames and the seconds spent reading and deciding them.
+
+    Raises:
+        ValueError: If the format is unknown or the file is not in the format.
+    """
+    scenario_format = scenario_format or format_of(path)
+    if scenario_format not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}, not {scenario_format!r}")
+    binary = scenario_format == "binary"
+    if path == "-":
+        file = contextlib.nullcontext(sys.stdin.buffer if binary else sys.stdin)
+    else:
+        file = open(path, "rb") if binary else open(path, newline="")
+
+    start = time.perf_counter()
+    with file as scenarios:
+        reader = {"jsonl": read_jsonl, "csv": read_csv, "binary": read_binary}[scenario_format]
+        count = decide_scenarios(reader(scenarios), decider, output, batch_size, details)
+    return count, time.perf_counter() - start
@@ -0,0 +1,210 @@
+"""
+A local HTTP service that decides radar frames, built on the standard library.
+
+The service keeps a compiled Decider, or a pool of worker processes that each hold one, for
+its whole lifetime, so a request only pays for the decision itself. Start it with
+
+    python src/decide.py serve --port 8080 --workers 4
+
+and POST frames to /decide, either as JSON
+
+    {"points": [[x, y], ...]}            ->  {"launch": true}
+    {"frames": [[[x, y], ...], ...]}     ->  {"launches": [true, false, ...]}
+
+or as a binary body (Content-Type: application/octet-stream) of little-endian float64 values
+x0, y0, x1, y1, ... for one frame. GET /health answers {"status": "ok"}.
+
+The X-Decide-Latency-Us header of a decision is the time the handler spent on the request, from
+reading the body to the encoded response, and Server-Timing splits it into parse, decide and
+encode. Neither covers the HTTP parsing before the handler or writing the response;
+python -m benchmarks.service measures the latency seen by the client.
+"""
+
+import array
+import json
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from decider import Decider
+from parallel import ParallelDecider
+from parameters import PARAMETERS_T
+
+
+def load_config(path: str) -> tuple[PARAMETERS_T, list[list[str]], list[bool]]:
+    """
+    Read the parameters, LCM and PUV from a JSON file of the form
+    {"parameters": {"length_1": 1.0, ...}, "LCM": [[...], ...], "PUV": [...]}.
+    Parameters that are left out keep their default values.
+
+    Parameters:
+        path (str): The path of the JSON file.
+
+    Returns:
+        tuple[PARAMETERS_T, list[list[str]], list[bool]]: The parameters, LCM and PUV.
+    """
+    with open(path) as file:
+        config = json.load(file)
+    return PARAMETERS_T(**config.get("parameters", {})), config["LCM"], config["PUV"]
+
+
+def parse_binary_frame(body: bytes) -> list[tuple[float, float]]:
+    """
+    The points of a binary frame of little-endian float64 values x0, y0, x1, y1, ...
+
+    Parameters:
+        body (bytes): The request body.
+
+    Returns:
+        list[tuple[float, float]]: The points (x, y).
+
+    Raises:
+        ValueError: If the body is not a whole number of points.
+    """
+    if len(body) % 16:
+        raise ValueError("a binary frame must be a sequence of float64 (x, y) pairs")
+    values = array.array("d", body)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return list(zip(values[0::2], values[1::2]))
+
+
+class DecideHandler(BaseHTTPRequestHandler):
+    """Handles the requests of a DecideServer."""
+
+    # Keep connections open between requests
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately, Nagle's algorithm would delay the body
+    disable_nagle_algorithm = True
+    server: "DecideServer"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        start = time.perf_counter()
+        if self.path != "/decide":
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+        try:
+            body = self.rfile.read(self._content_length())
+            single, frames = self._parse(body)
+        except (ValueError, KeyError, TypeError) as error:
+            self._send_json(400, {"error": str(error)})
+            return
+
+        parsed = time.perf_counter()
+        launches = self.server.decide(frames)
+        decided = time.perf_counter()
+        result = {"launch": launches[0]} if single else {"launches": launches}
+        body = json.dumps(result).encode()
+        end = time.perf_counter()
+
+        timings = {"parse": parsed - start, "decide": decided - parsed, "encode": end - decided}
+        self._send(200, body, {"X-Decide-Latency-Us": f"{(end - start) * 1e6:.0f}",
+                               "Server-Timing": ", ".join(f"{name};dur={seconds * 1e3:.3f}"
+                                                          for name, seconds in timings.items())})
+
+    def _content_length(self) -> int:
+        """The length of the request body from its Content-Length header."""
+        length = self.headers.get("Content-Length")
+        if length is None or not length.strip().isdigit():
+            # The end of the body is unknown, so the connection cannot be reused
+            self.close_connection = True
+            raise ValueError(f"a valid Content-Length is required, not {length!r}")
+        return int(length)
+
+    def _parse(self, body: bytes) -> tuple[bool, list[list[tuple[float, float]]]]:
+        """Whether the body holds a single frame, and its frames."""
+        if self.headers.get("Content-Type") == "application/octet-stream":
+            return True, [parse_binary_frame(body)]
+        request = json.loads(body)
+        if "points" in request:
+            return True, [[(float(x), float(y)) for x, y in request["points"]]]
+        return False, [[(float(x), float(y)) for x, y in frame] for frame in request["frames"]]
+
+    def _send_json(self, status: int, content: dict, headers: dict[str, str] | None = None) -> None:
+        self._send(status, json.dumps(content).encode(), headers)
+
+    def _send(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class DecideServer(ThreadingHTTPServer):
+    """
+    An HTTP server that decides frames for one configuration of parameters, LCM and PUV.
+
+    With workers=0 the frames are decided in the server process, which has the lowest latency.
+    With workers > 0 they are sent to a pool of worker processes, so that concurrent requests
+    are decided in parallel. Every request then pays for a round trip to a worker, about 0.7 ms
+    on a single core, which more than doubles the latency of a 100-point frame. Workers only
+    pay off with several cores, concurrent clients and frames that take much longer to decide
+    than the round trip.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], parameters: PARAMETERS_T, LCM: list[list[str]],
+                 PUV: list[bool], workers: int = 0, verbose: bool = False) -> None:
+        """
+        Parameters:
+            address (tuple[str, int]): The host and port to listen on, port 0 picks a free port.
+            parameters (PARAMETERS_T): The parameters for the LICs.
+            LCM (list[list[str]]): Logical Connector Matrix.
+            PUV (list[bool]): Preliminary Unlocking Vector.
+            workers (int): Number of worker processes, 0 to decide in the server process.
+            verbose (bool): Log every request.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        self.decider = Decider(parameters, LCM, PUV)
+        self.pool = ParallelDecider(parameters, LCM, PUV, workers) if workers > 0 else None
+        self.verbose = verbose
+        super().__init__(address, DecideHandler)
+
+    def decide(self, frames: list[list[tuple[float, float]]]) -> list[bool]:
+        """The launch decisions of the frames of one request."""
+        if self.pool is None:
+            return [self.decider.decide(points) for points in frames]
+        return self.pool.submit(frames).result()
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.pool is not None:
+            self.pool.shutdown()
+
+
+def serve(parameters: PARAMETERS_T, LCM: list[list[str]], PUV: list[bool], host: str = "127.0.0.1",
+          port: int = 8080, workers: int = 0, verbose: bool = False) -> None:
+    """
+    Run a DecideServer until it is interrupted.
+
+    Parameters:
+        parameters (PARAMETERS_T): The parameters for the LICs.
+        LCM (list[list[str]]): Logical Connector Matrix.
+        PUV (list[bool]): Preliminary Unlocking Vector.
+        host (str): The address to listen on, localhost by default.
+        port (int): The port to listen on.
+        workers (int): Number of worker processes, 0 to decide in the server process.
+        verbose (bool): Log every request.
+    """
+    with DecideServer((host, port), parameters, LCM, PUV, workers, verbose) as server:
+        print(f"Serving DECIDE on http://{server.server_address[0]}:{server.server_address[1]}/decide")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
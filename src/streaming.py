@@ -0,0 +1,205 @@
+import math
+
+from lic import (euclidean_distance, minimum_radius, calculate_angle, area_of_triangle,
+                 get_quadrant, distance_to_line)
+from parameters import PARAMETERS_T, CompiledParameters, compile_parameters
+
+
+class StreamingCMV:
+    """
+    Incremental Conditions Met Vector (CMV) for radar points that arrive one at a time.
+
+    Every appended point only evaluates the pairs and triples that end in it. Once a LIC is
+    met it stays met, so each LIC keeps a latched flag (two for LICs 12, 13 and 14, one per
+    part of the condition). LIC 4 keeps the number of points per quadrant in its current window
+    and LIC 6 checks the one new window of N_PTS points. The last points are kept in a ring
+    buffer that is as long as the largest window any LIC needs, so memory does not grow with
+    the track. After every point the CMV is identical to calculate_CMV on all points so far.
+    """
+
+    def __init__(self, parameters: PARAMETERS_T) -> None:
+        """
+        Parameters:
+            parameters (PARAMETERS_T): The parameters for the LICs.
+        """
+        self.parameters = parameters
+        # The thresholds and windows derived from the parameters, used for every new point
+        self._limits = compile_parameters(parameters, validate=False)
+        spans = self._limits.spans
+        # For every LIC the number of points from each point of the window ending in the newest
+        # point back to the newest one, see _back
+        self._back_offsets = [tuple(offset[-1] - o for o in offset) for offset in self._limits.offsets]
+        p = parameters
+        self._span = max(3, p.q_pts + 1, *spans, -p.g_pts)
+        self._buffer = [None] * self._span
+        self._head = []
+        self.num_points = 0
+
+        # Flags of the LICs that have been met by a window so far
+        self._met = [False] * 15
+        self._long_pair = self._short_pair = False
+        self._wide_triple = self._narrow_triple = False
+        self._large_triangle = self._small_triangle = False
+        self._quadrant_counts = {1: 0, 2: 0, 3: 0, 4: 0, None: 0}
+        self._CMV = [False] * 15
+
+    @property
+    def CMV(self) -> list[bool]:
+        """The CMV of all points appended so far."""
+        return list(self._CMV)
+
+    def _back(self, steps: int) -> tuple[float, float]:
+        """The point appended steps points before the newest one."""
+        return self._buffer[(self.num_points - 1 - steps) % self._span]
+
+    def extend(self, points: list[tuple[float, float]]) -> list[bool]:
+        """
+        Append several points in order.
+
+        Parameters:
+            points (list[tuple[float, float]]): The new points (x, y).
+
+        Returns:
+            list[bool]: The CMV after the last point.
+        """
+        for point in points:
+            self.append(point)
+        return self.CMV
+
+    def append(self, point: tuple[float, float]) -> list[bool]:
+        """
+        Append one point and update the CMV with the windows that end in it.
+
+        Parameters:
+            point (tuple[float, float]): The new point (x, y).
+
+        Returns:
+            list[bool]: The CMV of all points including the new one.
+        """
+        p = self.parameters
+        point = tuple(point)
+        self._buffer[self.num_points % self._span] = point
+        if len(self._head) < -(1 + p.g_pts):
+            self._head.append(point)
+        self.num_points += 1
+        n = self.num_points
+        met = self._met
+
+        if n >= 2:
+            previous = self._back(1)
+            # LIC 0 and LIC 5
+            met[0] = met[0] or euclidean_distance(previous, point) > p.length_1
+            met[5] = met[5] or point[0] - previous[0] < 0
+
+        if n >= 3:
+            p1, p2 = self._back(2), self._back(1)
+            # LIC 1
+            if p.radius_1 >= 0 and not met[1]:
+                met[1] = minimum_radius((p1, p2, point)) > self._limits.radius_1_limit
+            # LIC 2
+            if 0 <= p.epsilon < math.pi and not met[2]:
+                met[2] = self._is_sharp_angle(p1, p2, point, self._limits)
+            # LIC 3
+            if p.area_1 >= 0 and not met[3]:
+                met[3] = area_of_triangle((p1, p2, point)) > p.area_1
+
+        self._update_lic_4(point)
+        self._update_lic_6()
+        self._update_pairs()
+        self._update_triples()
+
+        CMV = self._CMV
+        CMV[:6] = met[:6]
+        CMV[6] = met[6] and n >= 3
+        CMV[7:11] = met[7:11]
+        CMV[11] = self._lic_11()
+        CMV[12] = self._long_pair and self._short_pair
+        CMV[13] = self._wide_triple and self._narrow_triple
+        CMV[14] = self._large_triangle and self._small_triangle
+        return self.CMV
+
+    @staticmethod
+    def _is_sharp_angle(p1: tuple[float, float], p2: tuple[float, float], p3: tuple[float, float],
+                        limits: CompiledParameters) -> bool:
+        """The angle at p2 is defined and lies outside [PI - EPSILON, PI + EPSILON], as in LIC 2 and 9."""
+        if p1 == p2 or p2 == p3 or p1 == p3:
+            return False
+        angle = calculate_angle(p1, p2, p3)
+        return angle is not None and (angle < limits.angle_lower or angle > limits.angle_upper)
+
+    def _update_lic_4(self, point: tuple[float, float]) -> None:
+        """Slide the window of Q_PTS points by one and count the quadrants in it."""
+        p = self.parameters
+        if p.q_pts < 2 or p.quads < 1 or p.quads > 3:
+            return
+        counts = self._quadrant_counts
+        counts[get_quadrant(point)] += 1
+        if self.num_points > p.q_pts:
+            counts[get_quadrant(self._back(p.q_pts))] -= 1
+        if self.num_points >= p.q_pts and not self._met[4]:
+            self._met[4] = (counts[1] > 0) + (counts[2] > 0) + (counts[3] > 0) + (counts[4] > 0) > p.quads
+
+    def _update_lic_6(self) -> None:
+        """Check the window of N_PTS points that ends in the new point."""
+        p = self.parameters
+        if p.dist < 0 or p.n_pts < 1 or self.num_points < p.n_pts or self._met[6]:
+            return
+        first, last = self._back(self._back_offsets[6][0]), self._back(0)
+        self._met[6] = any(distance_to_line(first, last, self._back(j)) > p.dist for j in range(p.n_pts))
+
+    def _update_pairs(self) -> None:
+        """LIC 7 and LIC 12, the pair separated by K_PTS points that ends in the new point."""
+        p = self.parameters
+        if p.k_pts < 1 or self.num_points < self._limits.spans[7]:
+            return
+        x1, y1 = self._back(self._back_offsets[7][0])
+        x2, y2 = self._back(0)
+        distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+        self._met[7] = self._met[7] or distance > p.length_1
+        if p.length_2 >= 0:
+            self._long_pair = self._long_pair or distance > p.length_1
+            self._short_pair = self._short_pair or distance < p.length_2
+
+    def _update_triples(self) -> None:
+        """LICs 8, 9, 10, 13 and 14, the triples that end in the new point."""
+        p = self.parameters
+        n = self.num_points
+        met = self._met
+        spans, offsets = self._limits.spans, self._back_offsets
+
+        if p.a_pts >= 1 and p.b_pts >= 1 and n >= spans[8]:
+            first, middle, _ = offsets[8]
+            corners = (self._back(first), self._back(middle), self._back(0))
+            radius = minimum_radius(corners)
+            if p.radius_1 >= 0:
+                met[8] = met[8] or radius > self._limits.radius_1_limit
+            if p.radius_1 >= 0 and p.radius_2 >= 0:
+                self._wide_triple = self._wide_triple or radius > self._limits.radius_1_limit
+                self._narrow_triple = self._narrow_triple or radius <= self._limits.radius_2_limit
+
+        if p.c_pts >= 1 and p.d_pts >= 1 and n >= spans[9] and not met[9]:
+            first, middle, _ = offsets[9]
+            met[9] = self._is_sharp_angle(self._back(first), self._back(middle), self._back(0), self._limits)
+
+        if p.e_pts >= 1 and p.f_pts >= 1 and n >= spans[10]:
+            first, middle, _ = offsets[10]
+            area = area_of_triangle((self._back(first), self._back(middle), self._back(0)))
+            if p.area_1 >= 0:
+                met[10] = met[10] or area > p.area_1
+            if p.area_1 >= 0 and p.area_2 >= 0:
+                self._large_triangle = self._large_triangle or area > p.area_1
+                self._small_triangle = self._small_triangle or area < p.area_2
+
+    def _lic_11(self) -> bool:
+        """LIC 11, latched for G_PTS >= 0, otherwise the pairs between the first and last points."""
+        g_pts = self.parameters.g_pts
+        n = self.num_points
+        if g_pts >= 0:
+            if not self._met[11] and n >= self._limits.spans[11]:
+                self._met[11] = self._back(0)[0] - self._back(self._back_offsets[11][0])[0] < 0
+            return self._met[11] and n >= 3
+        if n < 3:
+            return False
+        # Same pairs as zip(points, points[1 + g_pts:]) when the offset counts from the end
+        first = max(n + 1 + g_pts, 0)
+        return any(self._back(n - 1 - (first + i))[0] - self._head[i][0] < 0 for i in range(n - first))
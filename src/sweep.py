@@ -0,0 +1,230 @@
+"""
+Evaluate one track against a grid of parameter variants, e.g. for calibration.
+
+Most LICs ask whether some window (pair or triple of points) has a metric above or below a
+threshold, which only depends on the largest and smallest value of the metric over all windows.
+The sweep computes every metric array once per gap configuration, in one GeometryContext shared
+by the whole grid, and compares the thresholds of all variants with the extremes at once. Only a
+threshold within GUARD_BAND of an extreme is left to the vectorized LIC, which refines the metric
+around it so that the result is the same as for calculate_CMV. Every LIC is evaluated once per
+distinct set of arguments.
+
+    grid = parameter_grid(PARAMETERS_T(), length_1=np.linspace(0, 50, 1000), radius_1=[1, 2, 4])
+    CMV = sweep_CMV(points, grid)           # (3000, 15) booleans
+    launches = sweep_decide(points, grid, LCM, PUV)
+"""
+
+import dataclasses
+import itertools
+from collections.abc import Iterable
+
+import numpy as np
+
+from decision_logic import THRESHOLD_LICS, VECTORIZED_LICS, calculate_required_LICs, lic_arguments, threshold_tests
+from lic_vectorized import GUARD_BAND, GeometryContext, as_point_array, metric_extremes
+from parameters import PARAMETERS_T
+from policy import compile_policy, launch_table, pack_CMV_batch
+
+
+# The tests of threshold_tests as NumPy comparisons of a metric value with thresholds
+COMPARISONS = {">": np.greater, "<": np.less, "<=": np.less_equal}
+
+
+def parameter_grid(base: PARAMETERS_T | None = None, **values: Iterable) -> list[PARAMETERS_T]:
+    """
+    All combinations of the given values of some parameters, the others taken from base.
+
+    Parameters:
+        base (PARAMETERS_T | None): The values of the parameters that are not swept, the defaults if None.
+        **values (Iterable): The values of every swept parameter, e.g. length_1=[1, 2, 3].
+
+    Returns:
+        list[PARAMETERS_T]: One variant per combination, the last parameter varying fastest.
+    """
+    base = PARAMETERS_T() if base is None else base
+    names = list(values)
+    return [dataclasses.replace(base, **dict(zip(names, combination)))
+            for combination in itertools.product(*(list(values[name]) for name in names))]
+
+
+def passes(extremes: tuple[float, float] | None, test: str, threshold: float) -> bool | None:
+    """
+    Whether some window passes a test, from the smallest and largest value of the metric.
+
+    Parameters:
+        extremes (tuple[float, float] | None): The smallest and largest value over all windows,
+            NaN values excluded, None if there is no such window.
+        test (str): ">", "<" or "<=".
+        threshold (float): The threshold.
+
+    Returns:
+        bool | None: The result, or None if the extreme is within GUARD_BAND of the threshold,
+            where the vectorized LIC may refine it.
+    """
+    if extremes is None:
+        return False
+    value = extremes[1] if test == ">" else extremes[0]
+    if abs(value - threshold) < GUARD_BAND * abs(threshold):
+        return None
+    if test == ">":
+        return value > threshold
+    return value < threshold if test == "<" else value <= threshold
+
+
+class Sweep:
+    """
+    One track evaluated for many parameter variants. The metric arrays, their extremes and the
+    LICs without a threshold are cached across variants, so variants that share gap parameters
+    (K_PTS, A_PTS/B_PTS, ...) share all work but the comparisons with their thresholds.
+    """
+
+    def __init__(self, points: list[tuple[float, float]] | np.ndarray) -> None:
+        """
+        Parameters:
+            points (list[tuple[float, float]] | np.ndarray): List of planar points (x, y), or an (N, 2) array.
+        """
+        self.points = as_point_array(points)
+        self.geometry = GeometryContext(self.points)
+        self._extremes: dict[tuple, tuple[float, float] | None] = {}
+        self._results: dict[tuple, bool] = {}
+
+    def extremes(self, name: str, gaps: tuple[int, ...]) -> tuple[float, float] | None:
+        """The smallest and largest value of a metric, see passes."""
+        key = (name, gaps)
+        if key not in self._extremes:
+            self._extremes[key] = metric_extremes(self.geometry.metric(name, gaps))
+        return self._extremes[key]
+
+    def lic(self, index: int, parameters: PARAMETERS_T) -> bool:
+        """
+        Whether LIC number index is met, the same result as the vectorized LIC.
+
+        Parameters:
+            index (int): The number of the LIC.
+            parameters (PARAMETERS_T): The parameters for the LICs.
+
+        Returns:
+            bool: True if the condition is met, False otherwise.
+        """
+        arguments = lic_arguments(index, parameters)
+        key = (index, arguments)
+        if key in self._results:
+            return self._results[key]
+
+        met = None
+        if index in THRESHOLD_LICS:
+            form = threshold_tests(index, parameters, len(self.points))
+            if form is None:
+                met = False
+            else:
+                name, gaps, tests, either = form
+                extremes = self.extremes(name, gaps)
+                results = [passes(extremes, test, threshold) for test, threshold in tests]
+                if (True in results) if either else (False in results):
+                    met = either
+                elif None not in results:
+                    met = not either
+        if met is None:
+            met = VECTORIZED_LICS[index](self.points, *arguments, geometry=self.geometry)
+        self._results[key] = met
+        return met
+
+    def calculate_CMV(self, grid: Iterable[PARAMETERS_T], required: list[bool] | None = None) -> np.ndarray:
+        """
+        The CMV of the track for every variant of the grid.
+
+        Parameters:
+            grid (Iterable[PARAMETERS_T]): The parameter variants.
+            required (list[bool] | None): The LICs to calculate, all of them if None.
+                The others are False.
+
+        Returns:
+            np.ndarray: A (V, 15) boolean array with the CMV of every variant.
+        """
+        indices = [i for i in range(15) if required is None or required[i]]
+        grid = list(grid)
+        CMV = np.zeros((len(grid), 15), dtype=bool)
+        for i in indices:
+            # Variants with the same arguments for the LIC have the same result
+            distinct: dict[tuple, int] = {}
+            inverse = np.array([distinct.setdefault(lic_arguments(i, parameters), len(distinct))
+                                for parameters in grid], dtype=np.intp)
+            variants = [grid[v] for v in np.unique(inverse, return_index=True)[1]]
+            if i in THRESHOLD_LICS:
+                met = self._threshold_lic(i, variants)
+            else:
+                met = np.array([self.lic(i, parameters) for parameters in variants], dtype=bool)
+            CMV[:, i] = met[inverse]
+        return CMV
+
+    def _threshold_lic(self, index: int, grid: list[PARAMETERS_T]) -> np.ndarray:
+        """
+        One of THRESHOLD_LICS for every variant. The variants are grouped by metric and tests, and
+        the thresholds of a group are compared with the extremes of its metric in one step, the
+        same comparisons as passes. Only the variants with a threshold in the guard band use lic.
+        """
+        met = np.zeros(len(grid), dtype=bool)
+        groups: dict[tuple, tuple[list[int], list[tuple[float, ...]]]] = {}
+        for v, parameters in enumerate(grid):
+            form = threshold_tests(index, parameters, len(self.points))
+            if form is not None:
+                name, gaps, tests, either = form
+                rows, thresholds = groups.setdefault((name, gaps, tuple(test for test, _ in tests), either), ([], []))
+                rows.append(v)
+                thresholds.append(tuple(threshold for _, threshold in tests))
+
+        for (name, gaps, tests, either), (rows, thresholds) in groups.items():
+            rows, thresholds = np.array(rows), np.array(thresholds, dtype=np.float64)
+            # NaN extremes for a metric without windows fail every test
+            extremes = self.extremes(name, gaps) or (np.nan, np.nan)
+            values = np.array([extremes[1] if test == ">" else extremes[0] for test in tests])
+            near = np.abs(values - thresholds) < GUARD_BAND * np.abs(thresholds)
+            passed = np.column_stack([COMPARISONS[test](values[t], thresholds[:, t]) for t, test in enumerate(tests)])
+            if either:
+                met[rows] = (passed & ~near).any(axis=1)
+                undecided = ~met[rows] & near.any(axis=1)
+            else:
+                failed = (~passed & ~near).any(axis=1)
+                met[rows] = ~failed & ~near.any(axis=1)
+                undecided = ~failed & near.any(axis=1)
+            for v in rows[undecided]:
+                met[v] = self.lic(index, grid[v])
+        return met
+
+
+def sweep_CMV(points: list[tuple[float, float]] | np.ndarray, grid: Iterable[PARAMETERS_T],
+              required: list[bool] | None = None) -> np.ndarray:
+    """
+    The CMV of one track for every variant of a parameter grid, see Sweep.
+
+    Parameters:
+        points (list[tuple[float, float]] | np.ndarray): List of planar points (x, y), or an (N, 2) array.
+        grid (Iterable[PARAMETERS_T]): The parameter variants, e.g. from parameter_grid.
+        required (list[bool] | None): The LICs to calculate, all of them if None. The others are False.
+
+    Returns:
+        np.ndarray: A (V, 15) boolean array, row v is the CMV for grid[v].
+    """
+    return Sweep(points).calculate_CMV(grid, required)
+
+
+def sweep_decide(points: list[tuple[float, float]] | np.ndarray, grid: Iterable[PARAMETERS_T],
+                 LCM: list[list[str]], PUV: list[bool]) -> np.ndarray:
+    """
+    The launch decision for one track for every variant of a parameter grid.
+
+    Parameters:
+        points (list[tuple[float, float]] | np.ndarray): List of planar points (x, y), or an (N, 2) array.
+        grid (Iterable[PARAMETERS_T]): The parameter variants, e.g. from parameter_grid.
+        LCM (list[list[str]]): Logical Connector Matrix.
+        PUV (list[bool]): Preliminary Unlocking Vector.
+
+    Returns:
+        np.ndarray: A (V,) boolean array, True for the variants that launch.
+
+    Raises:
+        ValueError: If the LCM or PUV are invalid.
+    """
+    policy = compile_policy(LCM, PUV)
+    CMV = sweep_CMV(points, grid, calculate_required_LICs(LCM, PUV))
+    return launch_table(policy)[pack_CMV_batch(CMV)]
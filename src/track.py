@@ -0,0 +1,112 @@
+"""
+A compact track of planar points stored as two columns of float64 values.
+
+A list of N (x, y) tuples costs about 120 bytes per point (a list slot, a tuple and two float
+objects); a Track stores the x and y coordinates in two buffers of 8 bytes per value. It behaves
+like the list where the LICs use one: len(track), track[i] gives the tuple (x, y), iterating gives
+the tuples one at a time, and track[a:b:step] is a view of the same buffers instead of a copy.
+np.asarray(track) gives the (N, 2) array the vectorized LICs work on.
+
+    track = Track.from_points(points)    # one conversion of a list of tuples
+    calculate_CMV(track, parameters)
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
+
+import numpy as np
+
+
+class Track:
+    """
+    Planar points as memoryviews of float64 columns, e.g. of two array('d') or of NumPy arrays.
+
+    Attributes:
+        x (memoryview): The x coordinates.
+        y (memoryview): The y coordinates.
+    """
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: object, y: object) -> None:
+        """
+        Parameters:
+            x (object): A buffer of float64 values, e.g. array('d'), a 1-D float64 array or a memoryview.
+            y (object): A buffer of as many float64 values.
+
+        Raises:
+            ValueError: If the columns are not float64 or have different lengths.
+        """
+        x, y = memoryview(x), memoryview(y)
+        if x.format != "d" or y.format != "d" or x.ndim != 1 or y.ndim != 1:
+            raise ValueError("the columns of a Track must be one-dimensional buffers of float64 values")
+        if len(x) != len(y):
+            raise ValueError(f"the columns of a Track must have the same length, not {len(x)} and {len(y)}")
+        self.x = x
+        self.y = y
+
+    @classmethod
+    def from_points(cls, points: Iterable[tuple[float, float]] | np.ndarray) -> "Track":
+        """
+        Convert points to a Track.
+
+        Parameters:
+            points (Iterable[tuple[float, float]] | np.ndarray): The points (x, y), or an (N, 2) array.
+
+        Returns:
+            Track: The points, the same object if points already is a Track.
+        """
+        if isinstance(points, Track):
+            return points
+        if isinstance(points, np.ndarray):
+            points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+            return cls(np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1]))
+        points = points if isinstance(points, list) else list(points)
+        return cls(array("d", map(itemgetter(0), points)), array("d", map(itemgetter(1), points)))
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, index: int | slice) -> "tuple[float, float] | Track":
+        if isinstance(index, slice):
+            # Views of valid columns are valid, skip the checks of __init__
+            view = Track.__new__(Track)
+            view.x = self.x[index]
+            view.y = self.y[index]
+            return view
+        return self.x[index], self.y[index]
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return zip(self.x, self.y)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Track):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __repr__(self) -> str:
+        return f"Track({len(self)} points)"
+
+    def __array__(self, dtype: object = None, copy: bool | None = None) -> np.ndarray:
+        """
+        The points as an (N, 2) array, which is always a new array.
+
+        Raises:
+            ValueError: If copy is False, since the two columns cannot be viewed as one array.
+        """
+        if copy is False:
+            raise ValueError("a Track cannot be converted to an array without a copy")
+        points = np.empty((len(self), 2), dtype=np.float64)
+        points[:, 0] = self.x
+        points[:, 1] = self.y
+        return points if dtype is None else points.astype(dtype, copy=False)
+
+    def tolist(self) -> list[tuple[float, float]]:
+        """The points as a list of (x, y) tuples."""
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the two columns."""
+        return self.x.nbytes + self.y.nbytes
@@ -0,0 +1,138 @@
+"""
+Binary track files that are memory-mapped instead of parsed.
+
+A track is stored either as a .npy file of shape (N, 2) or as a raw file of little-endian
+float64 values x0, y0, x1, y1, ... (any other extension). load_track maps the file into memory
+without reading it, so opening a multi-GB archive is immediate and the LICs read the pages they
+need straight from the page cache. Convert CSV or JSON tracks once with
+
+    python src/track_io.py track.csv track.npy
+
+where a CSV file has one "x,y" point per line, optionally after a header line, and a JSON file
+holds a list of [x, y] pairs or an object {"points": [[x, y], ...]}.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+# Points converted at a time when writing a track
+BLOCK_SIZE = 1 << 16
+
+
+def load_track(path: str | os.PathLike) -> np.ndarray:
+    """
+    Map a binary track file into memory.
+
+    Parameters:
+        path (str | os.PathLike): A .npy file, or a raw file of little-endian float64 values.
+
+    Returns:
+        np.ndarray: A read-only (N, 2) view of the file.
+
+    Raises:
+        ValueError: If the file does not hold (x, y) pairs.
+    """
+    if os.fspath(path).endswith(".npy"):
+        points = np.load(path, mmap_mode="r")
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError(f"{path} holds an array of shape {points.shape}, not (N, 2)")
+        return points
+    size = os.path.getsize(path)
+    if size % 16:
+        raise ValueError(f"{path} is not a sequence of float64 (x, y) pairs")
+    if size == 0:
+        return np.zeros((0, 2))
+    return np.memmap(path, dtype="<f8", mode="r", shape=(size // 16, 2))
+
+
+def _read_csv(path: str | os.PathLike) -> Iterator[tuple[float, float]]:
+    """The points of a CSV file, skipping a header line and empty lines."""
+    with open(path, newline="") as file:
+        for line, row in enumerate(csv.reader(file)):
+            if not row:
+                continue
+            try:
+                x, y = float(row[0]), float(row[1])
+            except ValueError:
+                if line == 0:
+                    continue
+                raise ValueError(f"{path}, line {line + 1}: {row} is not a point x,y") from None
+            yield x, y
+
+
+def read_text_track(path: str | os.PathLike) -> Iterator[tuple[float, float]]:
+    """
+    The points of a CSV or JSON track, see the module documentation for the formats.
+
+    Parameters:
+        path (str | os.PathLike): A .json file, or a CSV file with any other extension.
+
+    Returns:
+        Iterator[tuple[float, float]]: The points (x, y). CSV files are read lazily.
+    """
+    if not os.fspath(path).endswith(".json"):
+        return _read_csv(path)
+    with open(path) as file:
+        track = json.load(file)
+    if isinstance(track, dict):
+        track = track["points"]
+    return ((float(x), float(y)) for x, y in track)
+
+
+def save_track(points: Iterable[tuple[float, float]] | np.ndarray, path: str | os.PathLike) -> int:
+    """
+    Write points as a binary track, BLOCK_SIZE points at a time. A .npy file needs the number of
+    points up front, so points that are not an array are first written as a raw file next to it.
+
+    Parameters:
+        points (Iterable[tuple[float, float]] | np.ndarray): The points (x, y).
+        path (str | os.PathLike): A .npy file, or a raw file with any other extension.
+
+    Returns:
+        int: The number of points written.
+    """
+    if os.fspath(path).endswith(".npy"):
+        if not isinstance(points, np.ndarray):
+            raw = os.fspath(path) + ".part"
+            try:
+                save_track(points, raw)
+                points = load_track(raw)
+                return save_track(points, path)
+            finally:
+                os.remove(raw)
+        track = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(len(points), 2))
+        for start in range(0, len(points), BLOCK_SIZE):
+            track[start:start + BLOCK_SIZE] = points[start:start + BLOCK_SIZE]
+        track.flush()
+        return len(points)
+
+    if isinstance(points, np.ndarray):
+        blocks = (points[start:start + BLOCK_SIZE] for start in range(0, len(points), BLOCK_SIZE))
+    else:
+        points = iter(points)
+        blocks = iter(lambda: list(itertools.islice(points, BLOCK_SIZE)), [])
+    count = 0
+    with open(path, "wb") as file:
+        for block in blocks:
+            file.write(np.asarray(block, dtype="<f8").reshape(-1, 2).tobytes())
+            count += len(block)
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert a CSV or JSON track to a binary track file.")
+    parser.add_argument("input", help="CSV file with one x,y point per line, or a JSON file")
+    parser.add_argument("output", help=".npy file, or raw little-endian float64 file with any other extension")
+    args = parser.parse_args()
+    count = save_track(read_text_track(args.input), args.output)
+    print(f"Wrote {count} points to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
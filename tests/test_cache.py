@@ -0,0 +1,84 @@
+import threading
+import numpy as np
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from cache import DecisionCache, frame_key
+from decider import Decider
+from parameters import PARAMETERS_T
+
+
+def test_frame_key() -> None:
+    points = [(0, 1), (2.5, 3), (4, -5)]
+    assert frame_key(points) == frame_key(np.array(points))
+    assert frame_key(points) != frame_key(points[:2])
+    assert frame_key([(1, 0)]) != frame_key([(0, 1)])
+    assert len(frame_key([])) == 16
+
+
+def test_cache_limits() -> None:
+    cache = DecisionCache(max_entries=2)
+    for i in range(3):
+        cache.put((bytes([i]), "config"), (True,), True)
+    assert len(cache) == 2
+    assert cache.get((bytes([0]), "config")) is None
+    assert cache.get((bytes([2]), "config")) == ((True,), True)
+    assert cache.stats()["evictions"] == 1
+
+    # Entries larger than the byte limit do not stay
+    small = DecisionCache(max_bytes=100)
+    small.put((b"frame", "config"), (True,) * 15, False)
+    assert len(small) == 0 and small.bytes == 0
+
+    with pytest.raises(ValueError):
+        DecisionCache(max_entries=0)
+
+
+def test_cache_least_recently_used() -> None:
+    cache = DecisionCache(max_entries=2)
+    cache.put((b"a", "config"), (), True)
+    cache.put((b"b", "config"), (), True)
+    cache.get((b"a", "config"))
+    cache.put((b"c", "config"), (), True)
+    assert cache.get((b"a", "config")) is not None
+    assert cache.get((b"b", "config")) is None
+
+
+def test_decider_cache() -> None:
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    cache = DecisionCache()
+    decider = Decider(PARAMETERS_T(length_1=2), LCM, [True] * 15, cache=cache)
+    other = Decider(PARAMETERS_T(length_1=20), LCM, [True] * 15, cache=cache)
+    uncached = Decider(PARAMETERS_T(length_1=2), LCM, [True] * 15)
+    points = [(0, 0), (5, 5), (1, 9), (-2, 4), (3, -3)]
+
+    assert decider.decide(points) == uncached.decide(points)
+    assert decider.decide(np.array(points)) == uncached.decide(points)
+    assert decider.calculate_CMV(points) == uncached.calculate_CMV(points)
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+    # Another configuration does not share the entry
+    assert other.calculate_CMV(points)[0] is False
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_threads() -> None:
+    cache = DecisionCache(max_entries=50)
+
+    def work(offset: int) -> None:
+        for i in range(500):
+            key = (bytes([(i + offset) % 80]), "config")
+            if cache.get(key) is None:
+                cache.put(key, (), True)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats["entries"] <= 50
+    assert stats["hits"] + stats["misses"] == 2000
@@ -0,0 +1,58 @@
+import random
+import sys
+import os
+import tracemalloc
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from chunked import calculate_CMV_chunked, chunk_overlap
+from decision_logic import calculate_CMV
+from parameters import PARAMETERS_T
+
+
+def test_chunked_matches_calculate_CMV() -> None:
+    rng = random.Random(4)
+    parameters = PARAMETERS_T(length_1=6, radius_1=3, epsilon=2.8, area_1=12, q_pts=4, quads=3, dist=3, n_pts=5,
+                              k_pts=3, a_pts=2, b_pts=3, c_pts=2, d_pts=1, e_pts=3, f_pts=2, g_pts=4,
+                              length_2=1, radius_2=0.8, area_2=0.5)
+    assert chunk_overlap(parameters) == 7
+    for num_points in (0, 2, 5, 9, 40, 300):
+        points = np.array([(rng.uniform(-4, 4), rng.uniform(-4, 4)) for _ in range(num_points)]).reshape(-1, 2)
+        expected = calculate_CMV(points.tolist(), parameters, engine="scalar")
+        for chunk_size in (1, 3, 10, 1000):
+            assert calculate_CMV_chunked(points, parameters, chunk_size=chunk_size) == expected
+        assert calculate_CMV_chunked(points.tolist(), PARAMETERS_T(g_pts=-3), [i == 11 for i in range(15)], 2) == \
+            calculate_CMV(points.tolist(), PARAMETERS_T(g_pts=-3), [i == 11 for i in range(15)])
+
+    with pytest.raises(ValueError):
+        calculate_CMV_chunked(points, parameters, chunk_size=0)
+
+
+def test_chunked_two_sided_across_blocks() -> None:
+    # The long pair is in the first block, the short pair only in the last one
+    points = [(0, 0), (10, 0)] + [(10 + 3 * i, 0) for i in range(1, 30)] + [(100, 0), (100.5, 0), (101, 0)]
+    points = np.array(points, dtype=float)
+    parameters = PARAMETERS_T(k_pts=1, length_1=8, length_2=2, a_pts=1, b_pts=1)
+    CMV = calculate_CMV_chunked(points, parameters, chunk_size=4)
+    assert CMV[12] is True
+    assert CMV == calculate_CMV(points.tolist(), parameters)
+
+
+def test_chunked_memory_is_bounded(tmp_path) -> None:
+    path = tmp_path / "track.npy"
+    rng = np.random.default_rng(0)
+    np.save(path, rng.uniform(-1, 1, (400_000, 2)))
+    track = np.load(path, mmap_mode="r")
+    # Nothing is met, so every block is read
+    parameters = PARAMETERS_T(length_1=10, radius_1=10, epsilon=0, area_1=10, dist=10, q_pts=3, quads=3,
+                              length_2=0, radius_2=0, area_2=0)
+
+    tracemalloc.start()
+    CMV = calculate_CMV_chunked(track, parameters, chunk_size=4096)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 4 * 2**20
+    assert CMV[0] is False and CMV[5] is True
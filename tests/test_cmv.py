@@ -1,6 +1,9 @@
+import pytest
 import sys
 import os
 
+import numpy as np
+
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from decision_logic import *
@@ -57,3 +60,110 @@ def test_cmv() -> None:
     assert CMV[13] == lic_13(points, test_parameters.radius_1, test_parameters.radius_2, test_parameters.a_pts, test_parameters.b_pts)
     assert CMV[14] == lic_14(points, test_parameters.e_pts, test_parameters.f_pts, test_parameters.area_1, test_parameters.area_2)
 
+
+def test_cmv_vectorized() -> None:
+    """
+    The vectorized CMV is identical to the one calculated by the LICs in lic.py,
+    both for a list of tuples and for an (N, 2) array.
+    """
+    points = [(0, 0), (0, 2), (1, 1), (1, 0), (2, 0), (3, 0), (4, 0),(2, 2), (5, 2), (2, 5),(3, 3), (-3, 3), (-3, -3), (3, -3),
+              (6, 6), (6, 8), (7, 6), (-1,2)]
+    for test_parameters in [PARAMETERS_T(), PARAMETERS_T(length_1=5, radius_1=2, epsilon=3, area_1=4, q_pts=3, quads=2,
+                                                         n_pts=4, dist=2, k_pts=2, a_pts=2, b_pts=3, c_pts=2, d_pts=1,
+                                                         e_pts=3, f_pts=2, g_pts=3, length_2=8, radius_2=5, area_2=3)]:
+        CMV = calculate_CMV(points, test_parameters)
+        assert calculate_CMV_vectorized(points, test_parameters) == CMV
+        assert calculate_CMV_vectorized(np.array(points, dtype=float), test_parameters) == CMV
+
+
+def test_required_LICs() -> None:
+    """
+    Only LICs that appear in a used element of an active PUM row are required.
+    """
+    LCM = [["NOTUSED"] * 15 for _ in range(15)]
+    LCM[0][1] = LCM[1][0] = "ANDD"
+    LCM[2][3] = LCM[3][2] = "ORR"
+    LCM[4][4] = "ANDD"
+    PUV = [False] * 15
+
+    # Nothing is active
+    assert calculate_required_LICs(LCM, PUV) == [False] * 15
+
+    # Row 0 reads CMV[0] and CMV[1], row 4 only has a used element on the diagonal
+    PUV[0] = True
+    PUV[4] = True
+    assert calculate_required_LICs(LCM, PUV) == [True, True] + [False] * 13
+
+    # The default LCM in decide.py only needs the first four LICs
+    PUV[3] = True
+    assert calculate_required_LICs(LCM, PUV) == [True, True, True, True] + [False] * 11
+
+
+def test_cmv_required() -> None:
+    """
+    LICs that are not required are not calculated and set to None.
+    """
+    points = [(0, 0), (0, 2), (1, 1), (1, 0), (2, 0), (3, 0), (4, 0), (2, 2), (5, 2)]
+    required = [i % 3 == 0 for i in range(15)]
+    full_CMV = calculate_CMV(points, PARAMETERS_T())
+    expected = [full_CMV[i] if required[i] else None for i in range(15)]
+    assert calculate_CMV(points, PARAMETERS_T(), required) == expected
+    assert calculate_CMV_vectorized(points, PARAMETERS_T(), required) == expected
+
+
+def test_cmv_engines_agree() -> None:
+    """
+    The scalar, vectorized and automatically chosen engines give the same CMV around the crossovers.
+    """
+    import random
+    import numpy as np
+    from decision_logic import CROSSOVER
+
+    rng = random.Random(5)
+    parameters = PARAMETERS_T(length_1=5, radius_1=4, epsilon=2.5, area_1=30, q_pts=4, quads=3, dist=4, n_pts=5,
+                              k_pts=2, g_pts=3, length_2=0.5, radius_2=1, area_2=0.5)
+    for num_points in sorted(set(CROSSOVER)) + [3, 10]:
+        for _ in range(5):
+            points = [(rng.uniform(-3, 3), rng.uniform(-3, 3)) for _ in range(num_points - 1)] + [(-3, -3)]
+            scalar = calculate_CMV(points, parameters, engine="scalar")
+            assert calculate_CMV(points, parameters, engine="vectorized") == scalar
+            assert calculate_CMV(points, parameters) == scalar
+            assert calculate_CMV(np.array(points), parameters) == scalar
+
+    with pytest.raises(ValueError):
+        calculate_CMV(points, parameters, engine="gpu")
+
+
+def test_cmv_margins() -> None:
+    """
+    The margins report the deciding extreme of every LIC, on the side of the threshold that matches the CMV.
+    """
+    import random
+
+    points = [(0, 0), (3, 4), (3, 0), (0, 0)]
+    parameters = PARAMETERS_T(length_1=4, radius_1=3, area_1=6, k_pts=1, length_2=3)
+    CMV, margins = calculate_CMV(points, parameters, margins=True)
+    assert CMV == calculate_CMV(points, parameters)
+    assert margins[0] == (Margin("distance", ">", 4, 5.0),)
+    assert margins[0][0].distance == 1.0
+    assert margins[3] == (Margin("area", ">", 6, 6.0),) and CMV[3] is False
+    assert margins[12] == (Margin("distance", ">", 4, 5.0), Margin("distance", "<", 3, 3.0))
+    # All points lie in quadrant I, and the smallest X[j] - X[i] is 0 - 3 for LIC 5 and LIC 11
+    assert margins[4] == (Margin("quadrant_count", ">", 1, 1.0),) and CMV[4] is False
+    assert margins[5] == margins[11] == (Margin("x_difference", "<", 0.0, -3.0),)
+    assert margins[11][0].distance == 3.0
+    # Not enough points for LIC 9, 10 and 14
+    assert margins[9] == margins[10] == margins[14] == ()
+
+    rng = random.Random(2)
+    for _ in range(50):
+        points = [(rng.uniform(-3, 3), rng.uniform(-3, 3)) for _ in range(rng.randint(3, 20))]
+        parameters = PARAMETERS_T(length_1=rng.uniform(0, 5), radius_1=rng.uniform(0, 3), area_1=rng.uniform(0, 5),
+                                  dist=rng.uniform(0, 3), n_pts=4, k_pts=2, a_pts=2, q_pts=rng.randint(2, 5),
+                                  quads=rng.randint(1, 3), g_pts=rng.randint(-4, 3))
+        required = [i != 2 for i in range(15)]
+        CMV, margins = calculate_CMV(points, parameters, required, margins=True)
+        assert CMV == calculate_CMV(points, parameters, required, engine="scalar")
+        assert margins[2] is None
+        for i in (0, 1, 3, 4, 5, 6, 7, 8, 10, 11):
+            assert CMV[i] == bool(margins[i] and (margins[i][0].distance or 0) > 0)
@@ -79,3 +79,166 @@ def test_decide_no(capsys, example_parameters) -> None:
 
     # Assert that "NO" is printed to terminal
     assert result.out.strip() == "NO"
+
+
+def test_decide_batch(example_parameters) -> None:
+    """
+    The batch DECIDE function returns one launch decision per frame, equal to the one of decide.
+    """
+    import numpy as np
+    from decide import decide_batch
+
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    PUV = [False] * 15
+    PUV[0] = True
+    PUV[1] = True
+
+    frames = np.array([[(0, 0), (10, 10), (20, 20), (40, 59)],
+                       [(0, 0), (0.1, 0), (0.2, 0), (0.3, 0)]])
+    assert list(decide_batch(frames, example_parameters, LCM, PUV)) == [True, False]
+
+    # A batch without frames, as an array or a list
+    for empty in (np.zeros((0, 4, 2)), np.zeros((0, 8)), []):
+        decisions = decide_batch(empty, example_parameters, LCM, PUV)
+        assert decisions.shape == (0,) and decisions.dtype == bool
+
+
+def test_decide_batch_ragged(example_parameters) -> None:
+    """
+    Frames of different lengths, given as a list or as a padded array with lengths or a mask.
+    """
+    import numpy as np
+    from decide import decide_batch
+
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    PUV = [False] * 15
+    PUV[0] = True
+
+    frames = [[(0, 0), (10, 10)], [(0, 0), (0.5, 0), (1, 0)], [(0, 0)]]
+    assert list(decide_batch(frames, example_parameters, LCM, PUV)) == [True, False, False]
+
+    # The padding of the second frame would satisfy LIC 0 if it was not ignored
+    padded = np.zeros((3, 3, 2))
+    padded[0, :2] = frames[0]
+    padded[1] = frames[1]
+    padded[1, 2] = (-5, -5)
+    padded[2, :1] = frames[2]
+    lengths = np.array([2, 2, 1])
+    assert list(decide_batch(padded, example_parameters, LCM, PUV, lengths=lengths)) == [True, False, False]
+    mask = np.arange(3) < lengths[:, np.newaxis]
+    assert list(decide_batch(padded, example_parameters, LCM, PUV, mask=mask)) == [True, False, False]
+
+
+def test_decide_required_LICs_only(capsys, example_parameters) -> None:
+    """
+    Skipping the LICs that cannot affect the decision gives the same result as calculating all of them.
+    """
+    import random
+    from decision_logic import calculate_required_LICs
+
+    rng = random.Random(0)
+    for _ in range(50):
+        points = [(rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(10)]
+        LCM = [[rng.choice(["ANDD", "ORR", "NOTUSED", "NOTUSED"]) for _ in range(15)] for _ in range(15)]
+        PUV = [rng.random() < 0.3 for _ in range(15)]
+
+        full_FUV = Calculate_FUV(calculate_PUM(LCM, calculate_CMV(points, example_parameters)), PUV)
+        CMV = calculate_CMV(points, example_parameters, calculate_required_LICs(LCM, PUV))
+        assert Calculate_FUV(calculate_PUM(LCM, CMV), PUV) == full_FUV
+
+        decide(points, example_parameters, LCM, PUV)
+        expected = "YES" if Calculate_Launch(full_FUV) else "NO"
+        assert capsys.readouterr().out.strip() == expected
+
+
+def test_decide_sites(capsys) -> None:
+    """
+    Every site gets the CMV and launch decision of deciding with its own parameters.
+    """
+    import random
+    from decide import decide_sites
+
+    rng = random.Random(2)
+    points = [(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(40)]
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    LCM[0][13] = LCM[13][0] = "ANDD"
+    PUV = [False] * 15
+    PUV[0] = True
+    sites = [PARAMETERS_T(length_1=rng.uniform(0, 30), radius_1=rng.uniform(0, 15), radius_2=rng.uniform(0, 5),
+                          a_pts=rng.randint(1, 3), b_pts=rng.randint(1, 3)) for _ in range(20)]
+
+    CMV, launches = decide_sites(points, sites, LCM, PUV)
+    assert CMV.shape == (20, 15) and launches.shape == (20,)
+    required = calculate_required_LICs(LCM, PUV)
+    for site, parameters in enumerate(sites):
+        expected = calculate_CMV(points, parameters)
+        assert [bool(CMV[site, i]) for i in range(15) if required[i]] == [expected[i] for i in range(15) if required[i]]
+        decide(points, parameters, LCM, PUV)
+        assert capsys.readouterr().out.strip() == ("YES" if launches[site] else "NO")
+    assert 0 < launches.sum() < 20
+
+
+def test_decide_policies(capsys, example_parameters) -> None:
+    """
+    Every policy gets the launch decision of deciding with it alone.
+    """
+    import random
+    from decide import decide_policies
+
+    rng = random.Random(3)
+    points = [(rng.randint(-5, 5), rng.randint(-5, 5)) for _ in range(12)]
+    policies = []
+    for _ in range(30):
+        LCM = [["NOTUSED"] * 15 for _ in range(15)]
+        for i in range(15):
+            for j in range(i, 15):
+                LCM[i][j] = LCM[j][i] = rng.choice(["ANDD", "ORR", "NOTUSED", "NOTUSED", "NOTUSED"])
+        policies.append((LCM, [rng.random() < 0.2 for _ in range(15)]))
+
+    launches = decide_policies(points, example_parameters, policies)
+    assert launches.shape == (30,)
+    for launch, (LCM, PUV) in zip(launches, policies):
+        decide(points, example_parameters, LCM, PUV)
+        assert capsys.readouterr().out.strip() == ("YES" if launch else "NO")
+    assert 0 < launches.sum() < 30
+
+
+def test_decide_entry_points_accept_the_same_LCM(capsys, example_parameters) -> None:
+    """
+    decide, decide_batch, decide_sites and decide_policies read an asymmetric LCM row by row alike.
+    """
+    from decide import decide_policies, decide_sites
+
+    points = [(0, 0), (5, 0), (1, 0)]
+    LCM = [["NOTUSED"] * 15 for _ in range(15)]
+    LCM[0][5] = "ANDD"
+    PUV = [True] + [False] * 14
+
+    decide(points, example_parameters, LCM, PUV)
+    expected = capsys.readouterr().out.strip() == "YES"
+    assert list(decide_batch([points], example_parameters, LCM, PUV)) == [expected]
+    assert list(decide_sites(points, [example_parameters], LCM, PUV)[1]) == [expected]
+    assert list(decide_policies(points, example_parameters, [(LCM, PUV)])) == [expected]
+
+
+def test_decide_imports_numpy_lazily() -> None:
+    """
+    Deciding a small frame in a new process does not import NumPy, a large frame does.
+    """
+    import os
+    import subprocess
+    import sys
+
+    src = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+    script = f"""
+import runpy, sys
+sys.path.insert(0, {src!r})
+runpy.run_path({os.path.join(src, "decide.py")!r}, run_name="__main__")
+from decide import LCM, PUV, decide, parameters
+decide([(i, i * i % 7) for i in range(100)], parameters, LCM, PUV)
+print("numpy" in sys.modules, "lic_vectorized" in sys.modules)
+decide([(i, i * i % 7) for i in range(2000)], parameters, LCM, PUV)
+print("numpy" in sys.modules, "lic_vectorized" in sys.modules)
+"""
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    assert [line for line in output.splitlines() if line not in ("YES", "NO")] == ["False False", "True True"]
@@ -0,0 +1,75 @@
+import random
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decider import Decider
+from decision_logic import calculate_CMV, calculate_PUM, Calculate_FUV, Calculate_Launch
+from parameters import PARAMETERS_T, validate_parameters
+
+
+def test_decider_matches_decide_logic() -> None:
+    rng = random.Random(0)
+    parameters = PARAMETERS_T(length_1=2, radius_1=1.5, epsilon=0.3, area_1=1, q_pts=3, quads=2, dist=1,
+                              n_pts=4, k_pts=2, g_pts=2, length_2=4, radius_2=3, area_2=5)
+    for _ in range(30):
+        LCM = [["NOTUSED"] * 15 for _ in range(15)]
+        for i in range(15):
+            for j in range(i, 15):
+                LCM[i][j] = LCM[j][i] = rng.choice(["ANDD", "ORR", "NOTUSED"])
+        PUV = [rng.random() < 0.4 for _ in range(15)]
+        decider = Decider(parameters, LCM, PUV)
+
+        for _ in range(10):
+            points = [(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(rng.randint(2, 12))]
+            expected = Calculate_Launch(Calculate_FUV(calculate_PUM(LCM, calculate_CMV(points, parameters)), PUV))
+            assert decider.decide(points) is expected
+            assert list(decider.decide_batch([points])) == [expected]
+
+
+def test_decider_validates_once() -> None:
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    validate_parameters(PARAMETERS_T())
+
+    with pytest.raises(ValueError):
+        Decider(PARAMETERS_T(epsilon=4), LCM, [True] * 15)
+    with pytest.raises(ValueError):
+        Decider(PARAMETERS_T(quads=4), LCM, [True] * 15)
+    with pytest.raises(ValueError):
+        Decider(PARAMETERS_T(length_1=-1), LCM, [True] * 15)
+    with pytest.raises(ValueError):
+        Decider(PARAMETERS_T(), LCM[:3], [True] * 15)
+
+
+def test_decider_only_required_LICs() -> None:
+    # Only row 0 is active and it only connects LIC 0 and LIC 5
+    LCM = [["NOTUSED"] * 15 for _ in range(15)]
+    LCM[0][5] = LCM[5][0] = "ANDD"
+    decider = Decider(PARAMETERS_T(), LCM, [True] + [False] * 14)
+
+    points = [(0, 0), (5, 0), (1, 0)]
+    CMV = decider.calculate_CMV(points)
+    assert CMV[0] is True and CMV[5] is True
+    assert CMV.count(None) == 13
+    assert decider.decide(points)
+    assert not decider.decide([(0, 0), (5, 0)])
+
+
+def test_decider_engines_agree() -> None:
+    import numpy as np
+
+    rng = random.Random(3)
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    PUV = [True] * 15
+    parameters = PARAMETERS_T(length_1=6, radius_1=5, epsilon=2.8, area_1=20, q_pts=5, quads=3, dist=5)
+    deciders = [Decider(parameters, LCM, PUV, engine) for engine in ("auto", "scalar", "vectorized")]
+    for num_points in (5, 50, 300):
+        points = [(rng.uniform(-4, 4), rng.uniform(-4, 4)) for _ in range(num_points)]
+        CMVs = [decider.calculate_CMV(points) for decider in deciders]
+        assert CMVs[0] == CMVs[1] == CMVs[2]
+        assert deciders[0].decide(np.array(points)) == deciders[1].decide(points) == deciders[2].decide(points)
+
+    with pytest.raises(ValueError):
+        Decider(parameters, LCM, PUV, "gpu")
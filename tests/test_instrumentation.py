@@ -0,0 +1,99 @@
+import sys
+import os
+from dataclasses import replace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decide import decide
+from decider import Decider
+from decision_logic import LICS, calculate_CMV, lic_arguments, lic_progress, lic_windows, progress_points
+from instrumentation import Histogram, Instrumentation
+from parameters import PARAMETERS_T
+
+
+def test_histogram() -> None:
+    histogram = Histogram()
+    assert histogram.quantile(0.5) == 0.0
+    for seconds in [1e-6, 2e-6, 3e-6, 1e-3]:
+        histogram.add(seconds)
+    assert histogram.count == 4
+    assert histogram.min == 1e-6 and histogram.max == 1e-3
+    # Quantiles are the upper bound of their bucket
+    assert 3e-6 <= histogram.quantile(0.75) < 6e-6
+    assert histogram.quantile(1) == 1e-3
+    assert sum(histogram.as_dict()["buckets"].values()) == 4
+
+
+def test_instrumented_CMV() -> None:
+    points = [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (5, 0)]
+    parameters = PARAMETERS_T(length_1=0.5)
+    instrumentation = Instrumentation()
+    CMV = calculate_CMV(points, parameters, instrumentation=instrumentation)
+    assert CMV == calculate_CMV(points, parameters)
+
+    assert instrumentation.lic_calls == [1] * 15
+    # LIC 0 is met by the first of its 5 pairs, LIC 1 is not met and examines all triples
+    assert instrumentation.lic_windows[0] == 1 and instrumentation.lic_early_exits[0] == 1
+    assert instrumentation.lic_windows[1] == lic_windows(1, parameters, len(points)) == 4
+    assert instrumentation.lic_early_exits[1] == 0
+    assert instrumentation.stage_times["CMV"].count == 1
+
+    # The vectorized LICs examine every window
+    instrumentation = Instrumentation()
+    assert calculate_CMV(points, parameters, instrumentation=instrumentation, engine="vectorized") == CMV
+    assert instrumentation.lic_windows == [lic_windows(i, parameters, len(points)) for i in range(15)]
+    assert instrumentation.lic_early_exits == [0] * 15
+
+
+def progress(index: int, points: list[tuple[float, float]], parameters: PARAMETERS_T) -> tuple[int, bool]:
+    """Run the scalar LIC number index once and return how far it got."""
+    counting = progress_points(index, LICS[index], points)
+    LICS[index](counting, *lic_arguments(index, parameters))
+    return lic_progress(index, counting, parameters)
+
+
+def test_lic_progress() -> None:
+    points = [(1, 1), (-1, 1), (-1, -1), (1, -1), (1, 1)]
+    # The first run of 3 points in more than 2 quadrants ends at the third point
+    parameters = PARAMETERS_T(q_pts=3, quads=2, g_pts=-1)
+    assert progress(4, points, parameters) == (1, True)
+    assert progress(4, [(1, 1), (1, 1), (-1, 1), (-1, -1), (1, 1)], parameters) == (2, True)
+    assert progress(4, points, replace(parameters, quads=3)) == (3, False)
+    # LIC 11 pairs every point with itself and is never met
+    assert progress(11, points, parameters) == (5, False)
+    # The point (3, 1) is 1 off the line of the third window of LIC 6, the middle one
+    line = [(0, 0), (1, 0), (2, 0), (3, 1), (4, 0), (5, 0)]
+    assert progress(6, line, replace(parameters, n_pts=3, dist=0.5)) == (3, True)
+    assert progress(6, line, replace(parameters, n_pts=3, dist=2)) == (4, False)
+    # LIC 6 rejects a negative DIST without examining a window
+    assert progress(6, points, replace(parameters, dist=-1)) == (0, False)
+
+
+def test_lic_windows_11() -> None:
+    # The pairs of lic_11 for G_PTS = -1 are every point with itself
+    assert lic_windows(11, PARAMETERS_T(g_pts=-1), 5) == 5
+    assert lic_windows(11, PARAMETERS_T(g_pts=-3), 5) == 2
+    assert lic_windows(11, PARAMETERS_T(g_pts=-9), 5) == 5
+    assert lic_windows(11, PARAMETERS_T(g_pts=1), 5) == 3
+    assert lic_windows(11, PARAMETERS_T(g_pts=9), 5) == 0
+
+
+def test_instrumented_decide(capsys) -> None:
+    LCM = [["NOTUSED"] * 15 for _ in range(15)]
+    LCM[0][5] = LCM[5][0] = "ANDD"
+    PUV = [True] + [False] * 14
+    points = [(0, 0), (5, 0), (1, 0)]
+    instrumentation = Instrumentation()
+
+    decide(points, PARAMETERS_T(), LCM, PUV, instrumentation)
+    assert capsys.readouterr().out.strip() == "YES"
+    assert set(instrumentation.stage_times) == {"policy", "CMV", "launch"}
+
+    decider = Decider(PARAMETERS_T(), LCM, PUV)
+    for _ in range(3):
+        assert decider.decide(points, instrumentation)
+    # Only the required LICs are recorded
+    assert [i for i in range(15) if instrumentation.lic_calls[i]] == [0, 5]
+    assert instrumentation.lic_calls[0] == 4
+    assert instrumentation.stage_times["launch"].count == 4
+    assert "lic_0" in instrumentation.report()
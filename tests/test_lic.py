@@ -182,6 +182,19 @@ def test_lic_4_invalid() -> None:
     points = [(1, 1), (-1, 1), (-1, -1), (1, -1)]
     assert not lic_4(points, q_pts, quads)
 
+def test_lic_4_sliding_window() -> None:
+    # The sliding counts agree with counting the quadrants of every window, also for points on
+    # the axes and for points in no quadrant
+    import random
+    rng = random.Random(0)
+    values = [-1, 0, 1, math.nan]
+    for _ in range(2000):
+        points = [(rng.choice(values), rng.choice(values)) for _ in range(rng.randint(0, 12))]
+        q_pts, quads = rng.randint(2, 8), rng.randint(1, 3)
+        expected = any(len({get_quadrant(point) for point in points[i:i + q_pts]} - {None}) > quads
+                       for i in range(len(points) - q_pts + 1))
+        assert lic_4(points, q_pts, quads) == expected
+
 
 """
 There exists at least one set of two consecutive data points,
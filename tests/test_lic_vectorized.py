@@ -0,0 +1,129 @@
+import math
+import random
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import lic
+import lic_vectorized
+from lic_vectorized import as_point_array
+
+
+def random_tracks(count: int, seed: int = 0) -> list[list[tuple[float, float]]]:
+    """Small tracks of integer, float and axis-aligned points that hit many edge cases."""
+    rng = random.Random(seed)
+    tracks = []
+    for _ in range(count):
+        n = rng.randint(0, 20)
+        kind = rng.randrange(3)
+        if kind == 0:
+            tracks.append([(rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(n)])
+        elif kind == 1:
+            tracks.append([(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(n)])
+        else:
+            tracks.append([(rng.choice([0, 1, 0.5, -1]), rng.choice([0, 1, -2, 0.5])) for _ in range(n)])
+    return tracks
+
+
+def test_as_point_array() -> None:
+    points = as_point_array([(0, 1), (2, 3)])
+    assert points.dtype == np.float64
+    assert points.shape == (2, 2)
+
+    # Arrays with the right layout are not copied
+    assert as_point_array(points) is points
+
+    # No points
+    assert as_point_array([]).shape == (0, 2)
+
+
+def test_window_views() -> None:
+    points = as_point_array([(0, 0), (1, 10), (2, 20), (3, 30), (4, 40)])
+    (x1, y1), (x2, y2), (x3, y3) = lic_vectorized.window_views(points, (0, 2, 3))
+    assert list(x1) == [0, 1]
+    assert list(x2) == [2, 3]
+    assert list(y3) == [30, 40]
+    # Views share the memory of the points
+    assert np.shares_memory(x1, points)
+
+
+def test_quadrants() -> None:
+    # Ties are decided in the order I, II, III, IV
+    points = as_point_array([(0, 0), (-1, 0), (0, -1), (0, 1), (1, 0), (1, -1)])
+    assert list(lic_vectorized.quadrants(points)) == [0, 1, 2, 0, 0, 3]
+
+
+def test_exact_radius_is_not_uncontainable() -> None:
+    # Exact radius, must use the same REL_TOL semantics as lic_1
+    points = as_point_array([(0, 0), (0, 2), (1, 1)])
+    assert not lic_vectorized.lic_1(points, 1)
+    assert lic_vectorized.lic_1(points, 0.99)
+
+
+def test_lics_match_scalar() -> None:
+    rng = random.Random(1)
+    for points in random_tracks(300):
+        array = as_point_array(points)
+        length_1, length_2 = rng.choice([0, 1, 2, math.sqrt(2)]), rng.choice([0, 1, 3])
+        radius_1, radius_2 = rng.choice([0, 0.5, 1, math.sqrt(2) / 2]), rng.choice([0, 0.5, 1, 3])
+        area_1, area_2 = rng.choice([0, 0.5, 1, 2]), rng.choice([0, 0.5, 3])
+        epsilon = rng.choice([0, 0.5, math.pi / 2, 3])
+        a_pts, b_pts = rng.randint(1, 3), rng.randint(1, 3)
+        k_pts, g_pts = rng.randint(0, 4), rng.randint(-2, 3)
+        q_pts, quads = rng.randint(2, 6), rng.randint(1, 3)
+        n_pts, dist = rng.randint(3, 6), rng.choice([0, 1, 2.5])
+
+        assert lic_vectorized.lic_0(array, length_1) == lic.lic_0(points, length_1)
+        assert lic_vectorized.lic_1(array, radius_1) == lic.lic_1(points, radius_1)
+        assert lic_vectorized.lic_2(array, epsilon) == lic.lic_2(points, epsilon)
+        assert lic_vectorized.lic_3(array, area_1) == lic.lic_3(points, area_1)
+        assert lic_vectorized.lic_4(array, q_pts, quads) == lic.lic_4(points, q_pts, quads)
+        assert lic_vectorized.lic_5(array) == lic.lic_5(points)
+        assert lic_vectorized.lic_6(array, n_pts, dist) == lic.lic_6(points, n_pts, dist)
+        assert lic_vectorized.lic_7(array, k_pts, length_1) == lic.lic_7(points, k_pts, length_1)
+        assert lic_vectorized.lic_8(array, radius_1, a_pts, b_pts) == lic.lic_8(points, radius_1, a_pts, b_pts)
+        assert lic_vectorized.lic_9(array, a_pts, b_pts, epsilon) == lic.lic_9(points, a_pts, b_pts, epsilon)
+        assert lic_vectorized.lic_10(array, a_pts, b_pts, area_1) == lic.lic_10(points, a_pts, b_pts, area_1)
+        assert lic_vectorized.lic_11(array, g_pts) == lic.lic_11(points, g_pts)
+        assert lic_vectorized.lic_12(array, k_pts, length_1, length_2) == lic.lic_12(points, k_pts, length_1, length_2)
+        assert (lic_vectorized.lic_13(array, radius_1, radius_2, a_pts, b_pts)
+                == lic.lic_13(points, radius_1, radius_2, a_pts, b_pts))
+        assert (lic_vectorized.lic_14(array, a_pts, b_pts, area_1, area_2)
+                == lic.lic_14(points, a_pts, b_pts, area_1, area_2))
+
+
+def test_lics_batch_match_single_frames() -> None:
+    frames = random_tracks(40, seed=3)
+    points, lengths = lic_vectorized.as_frame_batch(frames)
+    assert points.shape == (40, max(len(frame) for frame in frames), 2)
+
+    results = [lic_vectorized.lic_0(points, 1, lengths), lic_vectorized.lic_4(points, 3, 1, lengths),
+               lic_vectorized.lic_6(points, 3, 1, lengths), lic_vectorized.lic_9(points, 1, 2, 1, lengths),
+               lic_vectorized.lic_11(points, -2, lengths), lic_vectorized.lic_13(points, 0.5, 1, 1, 1, lengths)]
+    for b, frame in enumerate(frames):
+        array = as_point_array(frame)
+        expected = [lic_vectorized.lic_0(array, 1), lic_vectorized.lic_4(array, 3, 1),
+                    lic_vectorized.lic_6(array, 3, 1), lic_vectorized.lic_9(array, 1, 2, 1),
+                    lic_vectorized.lic_11(array, -2), lic_vectorized.lic_13(array, 0.5, 1, 1, 1)]
+        assert [result[b] for result in results] == expected
+
+
+def test_geometry_context_shares_metrics() -> None:
+    points = as_point_array([(0, 0), (3, 0), (3, 4), (0, 4), (1, 1), (5, 5), (2, 7)])
+    geometry = lic_vectorized.GeometryContext(points)
+
+    # LIC 7 and LIC 12 read the same distances
+    lic_vectorized.lic_7(points, 2, 1, geometry=geometry)
+    lic_vectorized.lic_12(points, 2, 1, 1, geometry=geometry)
+    assert len(geometry) == 1
+
+    # LIC 8 and LIC 13 read the same radii, LIC 10 and LIC 14 the same areas
+    lic_vectorized.lic_8(points, 1, 1, 2, geometry=geometry)
+    lic_vectorized.lic_13(points, 1, 2, 1, 2, geometry=geometry)
+    lic_vectorized.lic_10(points, 1, 1, 1, geometry=geometry)
+    lic_vectorized.lic_14(points, 1, 1, 1, 2, geometry=geometry)
+    assert len(geometry) == 3
+    assert geometry.metric("area", (1, 1)) is geometry.metric("area", (1, 1))
+    assert list(geometry.metric("distance", (2,))) == [math.dist(points[i], points[i + 3]) for i in range(4)]
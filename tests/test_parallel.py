@@ -0,0 +1,36 @@
+import random
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decider import Decider
+from parallel import ParallelDecider
+from parameters import PARAMETERS_T
+
+
+def test_parallel_decider() -> None:
+    rng = random.Random(0)
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    PUV = [True] * 15
+    parameters = PARAMETERS_T(length_1=3, q_pts=3, quads=2)
+    frames = [[(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(rng.randint(2, 10))] for _ in range(500)]
+    expected = [Decider(parameters, LCM, PUV).decide(points) for points in frames]
+    assert True in expected and False in expected
+
+    with ParallelDecider(parameters, LCM, PUV, workers=2, chunk_size=7) as pool:
+        assert pool.decide_all(frames) == expected
+        # Frames are read lazily from any iterable
+        assert [index for index, _ in pool.imap(iter(frames))] == list(range(500))
+        # Unordered results carry the index of their frame
+        assert sorted(pool.imap(frames, ordered=False)) == list(enumerate(expected))
+        assert pool.decide_all([]) == []
+
+
+def test_parallel_decider_invalid() -> None:
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    with pytest.raises(ValueError):
+        ParallelDecider(PARAMETERS_T(quads=0), LCM, [True] * 15)
+    with pytest.raises(ValueError):
+        ParallelDecider(PARAMETERS_T(), LCM, [True] * 15, chunk_size=0)
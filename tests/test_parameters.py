@@ -0,0 +1,48 @@
+import dataclasses
+import math
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from lic import REL_TOL
+from parameters import PARAMETERS_T, compile_parameters
+
+
+def test_parameters_are_immutable_and_hashable() -> None:
+    parameters = PARAMETERS_T(length_1=2)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        parameters.length_1 = 3
+    assert hash(parameters) == hash(PARAMETERS_T(length_1=2))
+    assert {parameters: True}[PARAMETERS_T(length_1=2)]
+    assert dataclasses.replace(parameters, length_1=3) != parameters
+
+
+def test_compile_parameters() -> None:
+    parameters = PARAMETERS_T(radius_1=2, radius_2=3, epsilon=0.25)
+    compiled = compile_parameters(parameters)
+
+    assert compiled.parameters is parameters
+    assert compiled.radius_1_limit == 2 * REL_TOL
+    assert compiled.radius_2_limit == 3 * REL_TOL
+    assert (compiled.angle_lower, compiled.angle_upper) == (math.pi - 0.25, math.pi + 0.25)
+    assert compile_parameters(PARAMETERS_T(radius_1=2, radius_2=3, epsilon=0.25)) is compiled
+
+    with pytest.raises(ValueError):
+        compile_parameters(PARAMETERS_T(epsilon=4))
+    # The LICs treat out of range parameters as not met, which does not need them to be valid
+    assert compile_parameters(PARAMETERS_T(epsilon=4), validate=False).angle_lower == math.pi - 4
+
+
+def test_compiled_windows() -> None:
+    parameters = PARAMETERS_T(q_pts=4, a_pts=2, b_pts=3, g_pts=-3)
+    compiled = compile_parameters(parameters, validate=False)
+
+    assert compiled.arguments[8] == (1.0, 2, 3) and compiled.arguments[5] == ()
+    assert compiled.offsets[8] == compiled.offsets[13] == (0, 3, 7)
+    assert compiled.offsets[4] == (0, 3) and compiled.spans[4] == 4
+    assert compiled.spans[8] == 8 and compiled.spans[0] == 2
+    # A negative G_PTS pairs points that are not consecutive
+    assert compiled.offsets[11] == (0, -2) and compiled.spans[11] == 2
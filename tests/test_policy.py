@@ -0,0 +1,115 @@
+import random
+import numpy as np
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decision_logic import calculate_PUM, Calculate_FUV, Calculate_Launch, calculate_required_LICs
+from policy import (compile_policy, validate_policy, pack_CMV, pack_CMV_batch, Calculate_FUV_bits,
+                    Calculate_Launch_bits, Calculate_Launch_bits_batch, launch_table, compile_policies,
+                    Calculate_Launch_policies)
+
+
+def random_policy(rng: random.Random) -> tuple[list[list[str]], list[bool]]:
+    """A random symmetric LCM and a random PUV."""
+    LCM = [["NOTUSED"] * 15 for _ in range(15)]
+    for i in range(15):
+        for j in range(i, 15):
+            LCM[i][j] = LCM[j][i] = rng.choice(["ANDD", "ORR", "NOTUSED", "NOTUSED"])
+    return LCM, [rng.random() < 0.5 for _ in range(15)]
+
+
+def test_pack_CMV() -> None:
+    assert pack_CMV([False] * 15) == 0
+    assert pack_CMV([True] + [False] * 13 + [True]) == 0b100000000000001
+    # LICs that were not calculated count as not met
+    assert pack_CMV([None, True] + [None] * 13) == 0b10
+
+    CMVs = np.array([[True] * 15, [False] * 15, [i % 2 == 0 for i in range(15)]])
+    bits = pack_CMV_batch(CMVs)
+    assert bits.dtype == np.uint16
+    assert list(bits) == [pack_CMV(CMV) for CMV in CMVs.tolist()]
+
+
+def test_compiled_policy_matches_PUM() -> None:
+    rng = random.Random(0)
+    for _ in range(200):
+        LCM, PUV = random_policy(rng)
+        CMV = [rng.random() < 0.6 for _ in range(15)]
+        policy = compile_policy(LCM, PUV)
+        FUV = Calculate_FUV(calculate_PUM(LCM, CMV), PUV)
+
+        bits = Calculate_FUV_bits(policy, pack_CMV(CMV))
+        assert [bool(bits >> i & 1) for i in range(15)] == FUV
+        assert Calculate_Launch_bits(policy, pack_CMV(CMV)) == Calculate_Launch(FUV)
+
+
+def test_compiled_policy_batch() -> None:
+    rng = random.Random(1)
+    LCM, PUV = random_policy(rng)
+    CMVs = np.array([[rng.random() < 0.8 for _ in range(15)] for _ in range(100)])
+    policy = compile_policy(LCM, PUV)
+
+    launches = Calculate_Launch_bits_batch(policy, pack_CMV_batch(CMVs))
+    assert list(launches) == [Calculate_Launch_bits(policy, pack_CMV(CMV)) for CMV in CMVs.tolist()]
+
+    # Without active rows every frame launches
+    assert Calculate_Launch_bits_batch(compile_policy(LCM, [False] * 15), pack_CMV_batch(CMVs)).all()
+
+
+def test_launch_table() -> None:
+    rng = random.Random(2)
+    LCM, PUV = random_policy(rng)
+    policy = compile_policy(LCM, PUV)
+    table = launch_table(policy)
+    assert table.shape == (1 << 15,)
+    assert not table.flags.writeable
+
+    for bits in rng.sample(range(1 << 15), 500):
+        assert table[bits] == Calculate_Launch_bits(policy, bits)
+
+    # An equal policy reuses the table
+    assert launch_table(compile_policy(LCM, PUV)) is table
+
+
+def test_compiled_policies() -> None:
+    rng = random.Random(3)
+    LCMs_PUVs = [random_policy(rng) for _ in range(20)]
+    LCMs_PUVs.append((LCMs_PUVs[0][0], [False] * 15))
+    policies = compile_policies(LCMs_PUVs)
+    assert len(policies) == 21
+    required = [any(calculate_required_LICs(LCM, PUV)[i] for LCM, PUV in LCMs_PUVs) for i in range(15)]
+    assert list(policies.required) == required
+
+    CMVs = np.array([[rng.random() < 0.8 for _ in range(15)] for _ in range(100)])
+    launches = Calculate_Launch_policies(policies, pack_CMV_batch(CMVs))
+    assert launches.shape == (100, 21)
+    for p, (LCM, PUV) in enumerate(LCMs_PUVs):
+        assert list(launches[:, p]) == list(Calculate_Launch_bits_batch(compile_policy(LCM, PUV), pack_CMV_batch(CMVs)))
+    assert list(Calculate_Launch_policies(policies, pack_CMV(CMVs[7].tolist()))) == list(launches[7])
+
+    # Policies that are already compiled give the same decisions
+    compiled = compile_policies([compile_policy(*LCMs_PUVs[3]), LCMs_PUVs[4]])
+    assert (Calculate_Launch_policies(compiled, pack_CMV_batch(CMVs)) == launches[:, 3:5]).all()
+
+
+def test_validate_policy() -> None:
+    LCM = [["NOTUSED"] * 15 for _ in range(15)]
+    validate_policy(LCM, [True] * 15)
+
+    with pytest.raises(ValueError):
+        validate_policy(LCM, [True] * 14)
+    with pytest.raises(ValueError):
+        validate_policy(LCM[:14], [True] * 15)
+
+    LCM[2][5] = "ANDD"
+    with pytest.raises(ValueError):
+        compile_policy(LCM, [True] * 15)
+    LCM[5][2] = "ANDD"
+    compile_policy(LCM, [True] * 15)
+
+    LCM[3][3] = "XOR"
+    with pytest.raises(ValueError):
+        validate_policy(LCM, [True] * 15)
@@ -61,3 +61,18 @@ def test_calculate_PUM_diagonal() -> None:
         [False, True, False, False],
         [False, False, True, False],
         [False, False, False, True]]
+
+def test_calculate_PUM_batch() -> None:
+    import numpy as np
+    from decision_logic import calculate_PUM_batch
+
+    LCM = [
+        [ANDD, ORR, NOTUSED, ANDD],
+        [ORR, ANDD, ANDD, NOTUSED],
+        [NOTUSED, ANDD, ORR, ORR],
+        [ANDD, NOTUSED, ORR, NOTUSED]]
+    CMVs = [[True, False, True, False], [False, False, False, False], [True, True, False, True]]
+    PUM = calculate_PUM_batch(LCM, np.array(CMVs))
+    assert PUM.shape == (3, 4, 4)
+    for b, CMV in enumerate(CMVs):
+        assert PUM[b].tolist() == calculate_PUM(LCM, CMV)
@@ -0,0 +1,72 @@
+import io
+import json
+import random
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decider import Decider
+from decision_logic import calculate_CMV, calculate_PUM, Calculate_FUV
+from parameters import PARAMETERS_T
+from scenarios import decide_file, decide_scenarios, format_of, read_binary, read_csv, write_binary
+
+
+def random_frames(rng: random.Random, count: int) -> list[list[tuple[float, float]]]:
+    return [[(rng.randint(-5, 5), rng.randint(-5, 5)) for _ in range(rng.randint(0, 12))] for _ in range(count)]
+
+
+def test_decide_file_formats(tmp_path) -> None:
+    rng = random.Random(0)
+    frames = random_frames(rng, 50)
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    LCM[0][3] = LCM[3][0] = "ANDD"
+    PUV = [True, False, False, True] + [False] * 11
+    decider = Decider(PARAMETERS_T(length_1=6, area_1=10), LCM, PUV)
+    expected = ["YES" if decider.decide(frame) else "NO" for frame in frames]
+
+    (tmp_path / "scenarios.jsonl").write_text("".join(json.dumps({"points": frame} if b % 2 else frame) + "\n\n"
+                                                      for b, frame in enumerate(frames)))
+    (tmp_path / "scenarios.csv").write_text("".join(",".join(f"{x},{y}" for x, y in frame) + "\n" for frame in frames))
+    with open(tmp_path / "scenarios.bin", "wb") as file:
+        assert write_binary(frames, file) == 50
+
+    for name in ("scenarios.jsonl", "scenarios.csv", "scenarios.bin"):
+        output = io.StringIO()
+        count, elapsed = decide_file(str(tmp_path / name), decider, output, batch_size=7)
+        assert count == 50 and elapsed > 0
+        assert output.getvalue().splitlines() == expected
+
+    assert [format_of(name) for name in ("-", "a.json", "a.CSV", "a.frames")] == ["jsonl", "jsonl", "csv", "binary"]
+    with pytest.raises(ValueError):
+        decide_file(str(tmp_path / "scenarios.csv"), decider, output, "xml")
+    with open(tmp_path / "truncated.bin", "wb") as file:
+        file.write((tmp_path / "scenarios.bin").read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        list(read_binary(open(tmp_path / "truncated.bin", "rb")))
+    # A header is not a frame, the error names its line
+    with pytest.raises(ValueError, match="line 1 "):
+        list(read_csv(io.StringIO("x,y\n1,2\n")))
+    with pytest.raises(ValueError, match="line 2 "):
+        list(read_csv(io.StringIO("1,2\n3,four\n")))
+
+
+def test_decide_scenarios_details() -> None:
+    rng = random.Random(1)
+    frames = random_frames(rng, 20)
+    LCM = [[rng.choice(["ANDD", "ORR", "NOTUSED"]) for _ in range(15)] for _ in range(15)]
+    LCM = [[LCM[min(i, j)][max(i, j)] for j in range(15)] for i in range(15)]
+    PUV = [rng.random() < 0.5 for _ in range(15)]
+    parameters = PARAMETERS_T(length_1=3, area_1=2, k_pts=2)
+    decider = Decider(parameters, LCM, PUV)
+
+    output = io.StringIO()
+    assert decide_scenarios(iter(frames), decider, output, batch_size=6, details=True) == 20
+    for frame, line in zip(frames, output.getvalue().splitlines(), strict=True):
+        result = json.loads(line)
+        CMV = calculate_CMV(frame, parameters)
+        assert result["launch"] == decider.decide(frame)
+        assert [met for met, required in zip(result["CMV"], decider.required) if required] == \
+            [met for met, required in zip(CMV, decider.required) if required]
+        assert result["FUV"] == Calculate_FUV(calculate_PUM(LCM, CMV), PUV)
@@ -0,0 +1,76 @@
+import http.client
+import json
+import struct
+import threading
+import urllib.error
+import urllib.request
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decider import Decider
+from parameters import PARAMETERS_T
+from service import DecideServer, parse_binary_frame
+
+# Launch if LIC 0 or LIC 3 is met
+LCM = [["NOTUSED"] * 15 for _ in range(15)]
+LCM[0][3] = LCM[3][0] = "ORR"
+PUV = [True] + [False] * 14
+
+
+def post(url: str, body: bytes, content_type: str = "application/json") -> tuple[dict, dict]:
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": content_type})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read()), response.headers
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_decide_service(workers: int) -> None:
+    parameters = PARAMETERS_T(length_1=3)
+    frames = [[(0, 0), (5, 5), (1, 9)], [(0, 0), (1, 1), (2, 2)]]
+    expected = [Decider(parameters, LCM, PUV).decide(points) for points in frames]
+    assert expected == [True, False]
+
+    with DecideServer(("127.0.0.1", 0), parameters, LCM, PUV, workers) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            result, headers = post(url + "/decide", json.dumps({"points": frames[0]}).encode())
+            assert result == {"launch": True}
+            assert int(headers["X-Decide-Latency-Us"]) >= 0
+            assert [timing.split(";")[0] for timing in headers["Server-Timing"].split(", ")] == ["parse", "decide", "encode"]
+
+            result, _ = post(url + "/decide", json.dumps({"frames": frames}).encode())
+            assert result == {"launches": expected}
+
+            body = struct.pack("<6d", *[value for point in frames[1] for value in point])
+            result, _ = post(url + "/decide", body, "application/octet-stream")
+            assert result == {"launch": False}
+
+            with pytest.raises(urllib.error.HTTPError) as error:
+                post(url + "/decide", b"{not json")
+            assert error.value.code == 400
+
+            for content_length in [None, "many", "-1"]:
+                connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+                connection.putrequest("POST", "/decide")
+                if content_length is not None:
+                    connection.putheader("Content-Length", content_length)
+                connection.endheaders()
+                response = connection.getresponse()
+                assert response.status == 400
+                assert "Content-Length" in json.loads(response.read())["error"]
+                connection.close()
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def test_parse_binary_frame() -> None:
+    assert parse_binary_frame(struct.pack("<4d", 1, 2, 3.5, -4)) == [(1, 2), (3.5, -4)]
+    assert parse_binary_frame(b"") == []
+    with pytest.raises(ValueError):
+        parse_binary_frame(b"\0" * 8)
@@ -0,0 +1,51 @@
+import math
+import random
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decision_logic import calculate_CMV
+from parameters import PARAMETERS_T
+from streaming import StreamingCMV
+
+
+def test_streaming_matches_cmv_after_every_point() -> None:
+    rng = random.Random(0)
+    for _ in range(100):
+        parameters = PARAMETERS_T(
+            length_1=rng.choice([0, 1, 2, math.sqrt(2)]), radius_1=rng.choice([0, 0.5, 1]),
+            epsilon=rng.choice([0, 0.5, math.pi / 2]), area_1=rng.choice([0, 0.5, 1, 2]),
+            q_pts=rng.randint(2, 6), quads=rng.randint(1, 3), dist=rng.choice([0, 1, 2]), n_pts=rng.randint(3, 6),
+            k_pts=rng.randint(1, 4), a_pts=rng.randint(1, 3), b_pts=rng.randint(1, 3), c_pts=rng.randint(1, 3),
+            d_pts=rng.randint(1, 3), e_pts=rng.randint(1, 3), f_pts=rng.randint(1, 3), g_pts=rng.randint(1, 3),
+            length_2=rng.choice([0, 1, 3]), radius_2=rng.choice([0, 0.5, 3]), area_2=rng.choice([0, 0.5, 3]))
+        points = [(rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(20)]
+
+        stream = StreamingCMV(parameters)
+        for i, point in enumerate(points):
+            assert stream.append(point) == calculate_CMV(points[:i + 1], parameters)
+        assert stream.num_points == len(points)
+
+
+def test_streaming_lic_4_window() -> None:
+    # The window slides: (1, 1) and (-1, 1) are never within 2 consecutive points of (-1, -1)
+    stream = StreamingCMV(PARAMETERS_T(q_pts=2, quads=1))
+    stream.extend([(1, 1), (1, 1)])
+    assert not stream.CMV[4]
+    stream.append((-1, 1))
+    assert stream.CMV[4]
+
+    stream = StreamingCMV(PARAMETERS_T(q_pts=3, quads=2))
+    assert not stream.extend([(1, 1), (-1, 1), (-1, 1), (-1, -1)])[4]
+    assert stream.append((1, -1))[4]
+
+
+def test_streaming_two_sided_lics_latch_both_parts() -> None:
+    # LIC 12: first a long pair, much later a short one
+    parameters = PARAMETERS_T(k_pts=1, length_1=5, length_2=1)
+    stream = StreamingCMV(parameters)
+    stream.extend([(0, 0), (0, 0), (10, 0), (20, 0), (30, 0)])
+    assert not stream.CMV[12]
+    stream.extend([(30.1, 0), (30.2, 0)])
+    assert stream.CMV[12]
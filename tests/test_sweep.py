@@ -0,0 +1,55 @@
+import random
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decide import decide_batch
+from decision_logic import calculate_CMV
+from parameters import PARAMETERS_T
+from sweep import Sweep, parameter_grid, sweep_CMV, sweep_decide
+
+
+def test_parameter_grid() -> None:
+    base = PARAMETERS_T(k_pts=2)
+    grid = parameter_grid(base, length_1=[1, 2], radius_1=[3, 4, 5])
+    assert len(grid) == 6
+    assert [(p.length_1, p.radius_1) for p in grid[:3]] == [(1, 3), (1, 4), (1, 5)]
+    assert all(p.k_pts == 2 for p in grid)
+    assert parameter_grid() == [PARAMETERS_T()]
+
+
+def test_sweep_matches_calculate_CMV() -> None:
+    rng = random.Random(0)
+    for num_points in (0, 2, 4, 7, 30):
+        # Integer coordinates give metrics that are exactly equal to integer thresholds
+        points = [(rng.randint(-5, 5), rng.randint(-5, 5)) for _ in range(num_points)]
+        grid = parameter_grid(PARAMETERS_T(q_pts=3, quads=2, n_pts=4, length_2=3, radius_2=2, area_2=4),
+                              length_1=[0, 1, 2.5, 5, 8], radius_1=[0, 1.5, 2.5, 5], area_1=[0, 2, 4.5, 10],
+                              epsilon=[0, 1, 3], k_pts=[1, 3], a_pts=[1, 2], e_pts=[1, 4], dist=[0, 2])
+        sweep = Sweep(points)
+        CMV = sweep.calculate_CMV(grid)
+        assert CMV.shape == (len(grid), 15)
+        for v in rng.sample(range(len(grid)), 200):
+            for engine in ("scalar", "vectorized"):
+                assert list(CMV[v]) == calculate_CMV(points, grid[v], engine=engine)
+        # Variants that share the gap parameters share the metric arrays
+        assert len(sweep.geometry) <= 2 * 2 * 2 * 2 + 8
+
+
+def test_sweep_decide() -> None:
+    rng = random.Random(1)
+    points = np.array([(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(50)])
+    LCM = [["NOTUSED"] * 15 for _ in range(15)]
+    LCM[0][12] = LCM[12][0] = "ANDD"
+    LCM[1][7] = LCM[7][1] = "ORR"
+    PUV = [True, True] + [False] * 13
+    grid = parameter_grid(length_1=np.linspace(0, 30, 31), radius_1=[1, 8], k_pts=[1, 5], length_2=[0.5, 5])
+
+    launches = sweep_decide(points, grid, LCM, PUV)
+    expected = [decide_batch(points[np.newaxis], parameters, LCM, PUV)[0] for parameters in grid]
+    assert list(launches) == expected
+    assert 0 < launches.sum() < len(grid)
+    assert not sweep_CMV(points, grid, [False] * 15).any()
@@ -0,0 +1,60 @@
+import random
+import sys
+import os
+from array import array
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from decider import Decider
+from decision_logic import LICS, calculate_CMV, lic_arguments
+from parameters import PARAMETERS_T
+from track import Track
+
+
+def test_track_behaves_like_a_list() -> None:
+    points = [(0.0, 1.0), (2.0, 3.0), (4.0, 5.0), (6.0, 7.0)]
+    track = Track.from_points(points)
+    assert len(track) == 4 and track[1] == (2.0, 3.0) and track[-1] == (6.0, 7.0)
+    assert list(track) == points == track.tolist()
+    assert list(track[1::2]) == points[1::2]
+    assert track.nbytes == 64
+    assert Track.from_points(track) is track
+    assert Track.from_points(np.array(points)) == track
+    assert np.array_equal(np.asarray(track), np.array(points))
+    assert np.array_equal(np.array(track, dtype=np.float32, copy=True), np.array(points))
+    # The columns cannot be viewed as one (N, 2) array
+    with pytest.raises(ValueError):
+        np.asarray(track, copy=False)
+
+    # Slices share the columns
+    x = array("d", [1.0, 2.0, 3.0])
+    view = Track(x, array("d", [0.0] * 3))[1:]
+    x[2] = 9.0
+    assert view[1] == (9.0, 0.0)
+
+    with pytest.raises(ValueError):
+        Track(array("d", [1.0]), array("d", []))
+    with pytest.raises(ValueError):
+        Track(array("i", [1]), array("i", [1]))
+
+
+def test_lics_accept_tracks() -> None:
+    rng = random.Random(6)
+    for _ in range(40):
+        points = [(rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(rng.randint(0, 30))]
+        track = Track.from_points(points)
+        parameters = PARAMETERS_T(length_1=rng.uniform(0, 5), radius_1=rng.uniform(0, 3), epsilon=rng.uniform(0, 3),
+                                  area_1=rng.uniform(0, 5), q_pts=3, quads=2, n_pts=4, k_pts=2, g_pts=rng.randint(-3, 3),
+                                  length_2=2, radius_2=1, area_2=1)
+        for i, lic in enumerate(LICS):
+            assert lic(track, *lic_arguments(i, parameters)) == lic(points, *lic_arguments(i, parameters))
+        expected = calculate_CMV(points, parameters)
+        for engine in ("auto", "scalar", "vectorized"):
+            assert calculate_CMV(track, parameters, engine=engine) == expected
+
+    LCM = [["ORR"] * 15 for _ in range(15)]
+    decider = Decider(PARAMETERS_T(), LCM, [True] * 15)
+    assert decider.decide(track) == decider.decide(points)
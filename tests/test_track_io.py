@@ -0,0 +1,55 @@
+import json
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import decision_logic
+from decide import decide
+from decision_logic import calculate_CMV
+from parameters import PARAMETERS_T
+from track_io import load_track, read_text_track, save_track
+
+
+def test_convert_and_load(tmp_path) -> None:
+    points = [(0.0, 1.0), (2.5, -3.0), (4.0, 5.0), (-6.0, 7.25)]
+    (tmp_path / "track.csv").write_text("x,y\n" + "".join(f"{x},{y}\n" for x, y in points) + "\n")
+    (tmp_path / "track.json").write_text(json.dumps({"points": points}))
+
+    for source in ("track.csv", "track.json"):
+        for target in ("track.npy", "track.bin"):
+            assert save_track(read_text_track(tmp_path / source), tmp_path / target) == 4
+            track = load_track(tmp_path / target)
+            assert isinstance(track, np.memmap) and track.shape == (4, 2)
+            assert track.tolist() == [list(point) for point in points]
+    assert not os.path.exists(tmp_path / "track.npy.part")
+
+    (tmp_path / "bad.bin").write_bytes(b"\0" * 24)
+    with pytest.raises(ValueError):
+        load_track(tmp_path / "bad.bin")
+    (tmp_path / "bad.csv").write_text("1,2\n3\n")
+    with pytest.raises((ValueError, IndexError)):
+        list(read_text_track(tmp_path / "bad.csv"))
+
+
+def test_decide_memory_mapped_track(tmp_path, monkeypatch, capsys) -> None:
+    rng = np.random.default_rng(1)
+    points = rng.uniform(-5, 5, (3000, 2))
+    save_track(points, tmp_path / "track.bin")
+    track = load_track(tmp_path / "track.bin")
+    parameters = PARAMETERS_T(length_1=9, radius_1=7, area_1=40, dist=7, q_pts=4, quads=3, length_2=0.1)
+
+    expected = calculate_CMV(points, parameters)
+    assert calculate_CMV(track, parameters) == expected
+    # Long memory-mapped tracks are evaluated in blocks
+    monkeypatch.setattr(decision_logic, "CHUNK_SIZE", 500)
+    assert calculate_CMV(track, parameters) == expected
+
+    LCM = [["ANDD"] * 15 for _ in range(15)]
+    decide(track, parameters, LCM, [True] * 15)
+    decide(points.tolist(), parameters, LCM, [True] * 15)
+    first, second = capsys.readouterr().out.split()
+    assert first == second